@@ -0,0 +1,110 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import pycountry
+
+from market_calendar_tool.cleaning.cleaner import (
+    BASE_COLUMNS,
+    camel_to_snake,
+    clean_base,
+    impact_mapping,
+)
+from market_calendar_tool.scraper.schemas import apply_schema
+
+CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CNY", "All", "XYZ", None]
+IMPACTS = list(impact_mapping) + ["Holiday", None]
+
+
+def base_frame(size: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    datelines = 1729515300 + rng.integers(0, 86_400 * 90, size)
+    return pd.DataFrame(
+        {
+            "id": np.arange(size),
+            "name": [f"Event {i % 500}" for i in range(size)],
+            "currency": rng.choice(np.array(CURRENCIES, dtype=object), size),
+            "dateline": datelines,
+            "impactTitle": rng.choice(np.array(IMPACTS, dtype=object), size),
+            "actual": "0.3%",
+            "previous": "0.1%",
+            "revision": "",
+            "forecast": "0.2%",
+            "actualBetterWorse": rng.integers(-1, 2, size),
+            "revisionBetterWorse": 0,
+            "siteId": 1,
+        }
+    )
+
+
+def is_valid_currency(currency) -> bool:
+    if currency is None:
+        return False
+    try:
+        return pycountry.currencies.get(alpha_3=currency.upper()) is not None
+    except Exception:
+        return False
+
+
+def row_wise_clean_base(df: pd.DataFrame) -> pd.DataFrame:
+    columns_to_validate = ["currency", "dateline", "impactTitle"]
+    df = df.rename(columns={col: f"{col}_raw" for col in columns_to_validate})
+
+    df["datetime"] = pd.to_datetime(
+        df["dateline_raw"], unit="s", utc=True, errors="coerce"
+    )
+    df["impact"] = df["impactTitle_raw"].map(impact_mapping)
+
+    df = df.dropna(subset=["datetime"])
+    df = df.dropna(subset=["impact"])
+
+    currency = df["currency_raw"].astype(object)
+    df["currency"] = currency.where(currency.apply(is_valid_currency))
+    df = df.dropna(subset=["currency"])
+
+    df = df.drop(columns=[f"{col}_raw" for col in columns_to_validate])
+    df["currency"] = df["currency"].replace("All", "WORLD")
+    df = df[BASE_COLUMNS]
+    return df.rename(columns=lambda col: camel_to_snake(col))
+
+
+def timed(func, df: pd.DataFrame, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        frame = df.copy()
+        started = time.perf_counter()
+        result = func(frame)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the row-wise and vectorized clean_base."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>9} {'dtypes':>7} {'row-wise':>10} {'vectorized':>11} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        raw = base_frame(size)
+        for label, df in (("raw", raw), ("typed", apply_schema(raw, "base"))):
+            reference_time, reference = timed(row_wise_clean_base, df, args.repeat)
+            vectorized_time, cleaned = timed(clean_base, df, args.repeat)
+
+            pd.testing.assert_frame_equal(cleaned, reference)
+
+            print(
+                f"{size:>9} {label:>7} {reference_time:>9.3f}s "
+                f"{vectorized_time:>10.3f}s {reference_time / vectorized_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import time
+
+import numpy as np
+from bs4 import BeautifulSoup
+
+from market_calendar_tool.cleaning.html_text import HtmlTextMemo, html_to_text
+
+FRAGMENTS = [
+    '<a href="https://www.ons.gov.uk/">Office for National Statistics</a> '
+    '(<a href="https://www.ons.gov.uk/releases">latest release</a>)',
+    "Change in the price of goods and services purchased by consumers;",
+    "'Actual' greater than 'Forecast' is good for currency;",
+    "<p>Monthly, released about 15 days after the month ends;</p>",
+    "<div><b>Derived Via</b><br>Average price of a basket of goods &amp; "
+    "services is sampled each month</div>",
+]
+
+
+def soup_text(html_content):
+    soup = BeautifulSoup(html_content, "html.parser")
+    for a in soup.find_all("a"):
+        text = a.get_text()
+        href = a.get("href", "")
+        a.replace_with(f"{text} ({href})" if href else text)
+    return soup.get_text(separator=" ", strip=True)
+
+
+def spec_html(size: int, distinct: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    unique = [
+        f"{FRAGMENTS[i % len(FRAGMENTS)]} <i>Event {i}</i>" for i in range(distinct)
+    ]
+    return [unique[i] for i in rng.integers(0, distinct, size)]
+
+
+def timed(func, values, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(values)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare BeautifulSoup, html_to_text and the memoized path."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--distinct", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'soup':>9} {'parser':>9} {'memo':>9} {'speedup':>8}")
+    for size in args.sizes:
+        values = spec_html(size, args.distinct)
+
+        soup_time, reference = timed(
+            lambda rows: [soup_text(row) for row in rows], values, args.repeat
+        )
+        parser_time, texts = timed(
+            lambda rows: [html_to_text(row) for row in rows], values, args.repeat
+        )
+        memo_time, memoized = timed(
+            lambda rows: list(map(HtmlTextMemo().convert, rows)), values, args.repeat
+        )
+
+        assert texts == reference
+        assert memoized == reference
+
+        print(
+            f"{size:>8} {soup_time:>8.3f}s {parser_time:>8.3f}s {memo_time:>8.3f}s "
+            f"{soup_time / memo_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
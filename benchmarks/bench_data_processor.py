@@ -0,0 +1,127 @@
+import argparse
+import time
+
+import pandas as pd
+
+from market_calendar_tool.scraper.data_processor import DataProcessor
+
+DETAIL_SPECS = {
+    "specs": (["data", "specs"], {"data.event_id": "id"}),
+    "history": (["data", "history", "events"], {"data.event_id": "id"}),
+    "news": (
+        ["data", "linked_threads", "news"],
+        {"id": "news_id", "data.event_id": "id"},
+    ),
+}
+
+
+def detail_payload(event_id: int) -> dict:
+    return {
+        "data": {
+            "event_id": event_id,
+            "specs": [
+                {"order": order, "title": f"Spec {order}", "html": "<p>Text</p>"}
+                for order in range(0, 60, 10)
+            ],
+            "history": {
+                "events": [
+                    {
+                        "event_id": event_id * 100 + i,
+                        "impact": "medium",
+                        "impact_class": "icon--ff-impact-ora",
+                        "date": "Aug 16, 2024",
+                        "url": f"/calendar?day=aug16.2024#detail={event_id}",
+                        "actual": "0.3%",
+                        "forecast": "0.2%",
+                        "previous": "0.1%",
+                    }
+                    for i in range(4)
+                ]
+            },
+            "linked_threads": {
+                "news": [
+                    {"id": event_id * 10 + i, "html": "<div>News</div>"}
+                    for i in range(2)
+                ]
+            },
+        }
+    }
+
+
+def base_payload(count: int) -> dict:
+    events = [
+        {
+            "id": event_id,
+            "name": f"Event {event_id}",
+            "currency": "USD",
+            "dateline": 1729515300 + event_id,
+            "impactTitle": "High Impact Expected",
+            "actual": "0.3%",
+            "forecast": "0.2%",
+        }
+        for event_id in range(count)
+    ]
+    return {"days": [{"events": events[i : i + 100]} for i in range(0, count, 100)]}
+
+
+def json_normalize_path(payloads, base):
+    frames = {
+        name: pd.json_normalize(
+            payloads, record_path=path, meta=[["data", "event_id"]], errors="ignore"
+        ).rename(columns=rename)
+        for name, (path, rename) in DETAIL_SPECS.items()
+    }
+    frames["base"] = pd.json_normalize(base, record_path=["days", "events"], meta=[])
+    return frames
+
+
+def columnar_path(payloads, base):
+    processor = DataProcessor(payloads)
+    return {
+        "specs": processor.to_specs_df(typed=False),
+        "history": processor.to_history_df(typed=False),
+        "news": processor.to_news_df(typed=False),
+        "base": DataProcessor(base).to_base_df(typed=False),
+    }
+
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare json_normalize with the single-pass columnar flattener."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'events':>8} {'json_normalize':>15} {'columnar':>10} {'speedup':>8}")
+    for size in args.sizes:
+        payloads = [detail_payload(event_id) for event_id in range(size)]
+        base = base_payload(size)
+
+        reference_time, reference = timed(
+            json_normalize_path, payloads, base, repeat=args.repeat
+        )
+        columnar_time, frames = timed(columnar_path, payloads, base, repeat=args.repeat)
+
+        for name, frame in reference.items():
+            pd.testing.assert_frame_equal(frames[name], frame)
+
+        print(
+            f"{size:>8} {reference_time:>14.3f}s {columnar_time:>9.3f}s "
+            f"{reference_time / columnar_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from market_calendar_tool.cleaning.cleaner import impact_mapping
+from market_calendar_tool.scraper.models import ScrapeResult, Site
+from market_calendar_tool.storage import CalendarStore
+
+CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CNY", "AUD", "CAD", "CHF"]
+IMPACTS = list(impact_mapping.values())
+START = pd.Timestamp("2022-01-01", tz="UTC")
+
+
+def month_result(month: int, events: int, first_id: int, seed: int) -> ScrapeResult:
+    rng = np.random.default_rng(seed)
+    begin = START + pd.DateOffset(months=month)
+    seconds = ((begin + pd.DateOffset(months=1)) - begin).total_seconds()
+    ids = np.arange(first_id, first_id + events)
+    base = pd.DataFrame(
+        {
+            "id": ids,
+            "name": [f"Event {i % 500}" for i in ids],
+            "currency": rng.choice(CURRENCIES, events),
+            "datetime": begin + pd.to_timedelta(rng.integers(0, seconds, events), "s"),
+            "impact": rng.choice(IMPACTS, events),
+            "actual": "0.3%",
+            "previous": "0.1%",
+            "forecast": "0.2%",
+        }
+    )
+    specs = pd.DataFrame(
+        {
+            "id": np.repeat(ids, 4),
+            "order": np.tile([10, 20, 30, 40], events),
+            "title": np.tile(["Source", "Measures", "Usual Effect", "Notes"], events),
+            "description": "Statistics Bureau; released monthly",
+        }
+    )
+    news = pd.DataFrame(
+        {"news_id": ids * 10, "id": ids, "html": "Headline", "title": "News"}
+    )
+    return ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from=str(begin.date()),
+        date_to=str(begin.date()),
+        base=base,
+        specs=specs,
+        news=news,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time CalendarStore.query on a multi-year store."
+    )
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--events-per-month", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        store = CalendarStore(root)
+        started = time.perf_counter()
+        for month in range(args.years * 12):
+            first_id = month * args.events_per_month
+            store.upsert(month_result(month, args.events_per_month, first_id, month))
+        print(f"built store in {time.perf_counter() - started:.2f}s")
+
+        week = START + pd.DateOffset(months=args.years * 12 - 1, days=7)
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = store.query(
+                Site.FOREXFACTORY,
+                start=week,
+                end=week + pd.Timedelta(days=6),
+                currency=["USD"],
+                impact=["high"],
+            )
+            best = min(best, time.perf_counter() - started)
+
+        full = store.read("base").to_pandas()
+        expected = full[
+            (full["currency"] == "USD")
+            & (full["impact"] == "high")
+            & (full["datetime"] >= week)
+            & (full["datetime"] < week + pd.Timedelta(days=7))
+        ]
+        assert sorted(result.base["id"]) == sorted(expected["id"])
+
+        rows = args.years * 12 * args.events_per_month
+        print(
+            f"{rows} events: {len(result.base)} matches, "
+            f"{len(result.specs)} specs in {best * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
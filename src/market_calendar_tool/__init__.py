@@ -1,12 +1,40 @@
-from .api import clean_data, scrape_calendar
-from .mixins.save_mixin import SaveFormat
-from .scraper.models import ScrapeOptions, ScrapeResult, Site
+from .api import (
+    SiteScrapeError,
+    clean_data,
+    scrape_calendar,
+    scrape_calendar_async,
+    scrape_sites,
+    scrape_sites_async,
+)
+from .cleaning.cleaner import clean_incremental
+from .cleaning.html_text import HtmlTextMemo
+from .cleaning.models import CleaningOptions
+from .client import CalendarClient
+from .mixins.save_mixin import ResultFormat, SaveFormat, WriteOptions
+from .scraper.detail_cache import DetailCache, SQLiteDetailCache
+from .scraper.models import Engine, FailedFetch, ScrapeOptions, ScrapeResult, Site
+from .storage import CalendarStore
 
 __all__ = [
     "ScrapeOptions",
     "ScrapeResult",
+    "FailedFetch",
     "scrape_calendar",
+    "scrape_calendar_async",
+    "scrape_sites",
+    "scrape_sites_async",
+    "SiteScrapeError",
+    "CalendarClient",
     "clean_data",
+    "clean_incremental",
+    "HtmlTextMemo",
+    "CleaningOptions",
     "Site",
+    "Engine",
     "SaveFormat",
+    "ResultFormat",
+    "WriteOptions",
+    "DetailCache",
+    "SQLiteDetailCache",
+    "CalendarStore",
 ]
@@ -1,21 +1,162 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Iterable, Optional, Union
 
+import aiohttp
 from loguru import logger
 
 from market_calendar_tool.scraper.models import ScrapeOptions, Site
 
 from .cleaning.cleaner import clean_data
+from .cleaning.models import CleaningOptions
 from .scraper import BaseScraper, ExtendedScraper, ScrapeResult
 
 
+class SiteScrapeError(Exception):
+    def __init__(
+        self, results: Dict[Site, ScrapeResult], errors: Dict[Site, BaseException]
+    ):
+        self.results = results
+        self.errors = errors
+        failed = ", ".join(f"{site.name}: {error}" for site, error in errors.items())
+        super().__init__(
+            f"Failed to scrape {len(errors)} of {len(errors) + len(results)} "
+            f"sites ({failed})"
+        )
+
+
 def scrape_calendar(
     site: Site = Site.FOREXFACTORY,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     extended: bool = False,
     options: Optional[ScrapeOptions] = None,
+    previous: Optional[Union[ScrapeResult, str]] = None,
 ) -> ScrapeResult:
+    date_from_str, date_to_str = _resolve_date_range(date_from, date_to)
+
+    logger.info(f"Scraping calendar from {date_from_str} to {date_to_str}")
+
+    if options is None:
+        options = ScrapeOptions()
+
+    base_scraper = BaseScraper(site, date_from_str, date_to_str, options=options)
+    if extended:
+        return ExtendedScraper(base_scraper, options=options).scrape(previous=previous)
+    else:
+        return base_scraper.scrape()
+
+
+async def scrape_calendar_async(
+    site: Site = Site.FOREXFACTORY,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    extended: bool = False,
+    options: Optional[ScrapeOptions] = None,
+    previous: Optional[Union[ScrapeResult, str]] = None,
+) -> ScrapeResult:
+    date_from_str, date_to_str = _resolve_date_range(date_from, date_to)
+
+    logger.info(f"Scraping calendar from {date_from_str} to {date_to_str}")
+
+    if options is None:
+        options = ScrapeOptions()
+
+    base_scraper = BaseScraper(site, date_from_str, date_to_str, options=options)
+    if extended:
+        return await ExtendedScraper(base_scraper, options=options).async_scrape(
+            previous=previous
+        )
+    else:
+        return await base_scraper.async_scrape()
+
+
+def scrape_sites(
+    sites: Iterable[Site] = tuple(Site),
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    extended: bool = False,
+    options: Optional[ScrapeOptions] = None,
+    max_connections: Optional[int] = None,
+) -> Dict[Site, ScrapeResult]:
+    coroutine = scrape_sites_async(
+        sites=sites,
+        date_from=date_from,
+        date_to=date_to,
+        extended=extended,
+        options=options,
+        max_connections=max_connections,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+
+async def scrape_sites_async(
+    sites: Iterable[Site] = tuple(Site),
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    extended: bool = False,
+    options: Optional[ScrapeOptions] = None,
+    max_connections: Optional[int] = None,
+) -> Dict[Site, ScrapeResult]:
+    sites = list(dict.fromkeys(sites))
+    date_from_str, date_to_str = _resolve_date_range(date_from, date_to)
+
+    if options is None:
+        options = ScrapeOptions()
+    if max_connections is None:
+        max_connections = options.max_parallel_tasks * max(len(sites), 1)
+    if max_connections < 1:
+        raise ValueError("max_connections must be at least 1")
+
+    logger.info(
+        f"Scraping {len(sites)} sites from {date_from_str} to {date_to_str} "
+        f"with {max_connections} shared connections"
+    )
+
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=options.max_parallel_tasks,
+        ttl_dns_cache=300,
+    )
+    semaphore = asyncio.Semaphore(max_connections)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = []
+        for site in sites:
+            base_scraper = BaseScraper(
+                site, date_from_str, date_to_str, options=options
+            )
+            if extended:
+                scraper = ExtendedScraper(base_scraper, options=options)
+            else:
+                scraper = base_scraper
+            tasks.append(scraper.async_scrape(session, semaphore))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    scraped, errors = {}, {}
+    for site, result in zip(sites, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Error scraping {site.name}: {result}")
+            errors[site] = result
+        else:
+            scraped[site] = result
+
+    if errors:
+        raise SiteScrapeError(scraped, errors)
+    return scraped
+
+
+def _resolve_date_range(
+    date_from: Optional[str], date_to: Optional[str]
+) -> tuple[str, str]:
     def validate_and_format_date(date_str, default_date):
         if date_str:
             try:
@@ -36,21 +177,13 @@ def scrape_calendar(
             f"cannot be earlier than start date (date_from: {date_from_dt.strftime('%Y-%m-%d')})."
         )
 
-    date_from_str: str = date_from_dt.strftime("%Y-%m-%d")
-    date_to_str: str = date_to_dt.strftime("%Y-%m-%d")
+    return date_from_dt.strftime("%Y-%m-%d"), date_to_dt.strftime("%Y-%m-%d")
 
-    logger.info(f"Scraping calendar from {date_from_str} to {date_to_str}")
 
-    base_scraper = BaseScraper(site, date_from_str, date_to_str)
-    if extended:
-        if options is None:
-            options = ScrapeOptions()
-        return ExtendedScraper(base_scraper, options=options).scrape()
-    else:
-        return base_scraper.scrape()
-
-
-def clean_calendar_data(scrape_result: ScrapeResult) -> ScrapeResult:
-    cleaned_result = clean_data(scrape_result)
+def clean_calendar_data(
+    scrape_result: ScrapeResult,
+    options: Optional[CleaningOptions] = None,
+) -> ScrapeResult:
+    cleaned_result = clean_data(scrape_result, options)
 
     return cleaned_result
@@ -1,3 +1,11 @@
-from .cleaner import clean_data
+from .cleaner import clean_data, clean_incremental
+from .html_text import HtmlTextMemo, html_to_text
+from .models import CleaningOptions
 
-__all__ = ["clean_data"]
+__all__ = [
+    "clean_data",
+    "clean_incremental",
+    "CleaningOptions",
+    "HtmlTextMemo",
+    "html_to_text",
+]
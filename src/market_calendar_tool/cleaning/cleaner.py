@@ -1,14 +1,24 @@
 import re
 from enum import Enum
-from functools import wraps
-from typing import Optional
+from functools import lru_cache, partial, wraps
+from typing import Callable, Iterable, List, Optional
 
 import pandas as pd
 import pycountry
-from bs4 import BeautifulSoup
 from loguru import logger
+from pandas.api.types import is_datetime64_any_dtype
 
 from market_calendar_tool.scraper.extended_scraper import ScrapeResult
+from market_calendar_tool.scraper.schemas import (
+    concat_frames,
+    to_datetime_from_date,
+    to_datetime_from_epoch,
+)
+
+from .fingerprints import FRAME_KEYS, changed_keys, frame_fingerprints, key_index
+from .html_text import HtmlTextMemo
+from .models import CleaningOptions
+from .parallel import CleaningPool, clean_in_chunks
 
 
 class ImpactLevel(Enum):
@@ -25,119 +35,238 @@ impact_mapping = {
     "Non-Economic": ImpactLevel.NON_ECONOMIC.value,
 }
 
+HTML_MEMO = HtmlTextMemo()
+
+CURRENCY_CODES = frozenset(currency.alpha_3 for currency in pycountry.currencies)
+
+BASE_COLUMNS = [
+    "id",
+    "name",
+    "currency",
+    "datetime",
+    "impact",
+    "actual",
+    "previous",
+    "revision",
+    "forecast",
+    "actualBetterWorse",
+    "revisionBetterWorse",
+    "siteId",
+]
+
 
 def handle_empty(func):
     @wraps(func)
-    def wrapper(df: pd.DataFrame) -> pd.DataFrame:
+    def wrapper(df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
         if df.empty:
             logger.debug(
                 f"{func.__name__} received an empty DataFrame; skipping cleaning."
             )
             return df
-        return func(df)
+        return func(df, *args, **kwargs)
 
     return wrapper
 
 
 def is_valid_currency(currency: Optional[str]) -> bool:
-    if currency is None:
-        return False
-    try:
-        return pycountry.currencies.get(alpha_3=currency.upper()) is not None
-    except Exception as e:
-        logger.error(f"Error in is_valid_currency: {e}")
-        return False
+    return isinstance(currency, str) and currency.upper() in CURRENCY_CODES
+
+
+def valid_currencies(values: Iterable) -> List[str]:
+    return [value for value in values if is_valid_currency(value)]
+
+
+def parse_unique(
+    series: pd.Series, parse: Callable[[pd.Series], pd.Series]
+) -> pd.Series:
+    codes, uniques = pd.factorize(series)
+    parsed = parse(pd.Series(uniques))
+    return pd.Series(
+        parsed.array.take(codes, allow_fill=True),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def map_unique(series: pd.Series, mapping: dict) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.map(mapping)
+    return parse_unique(series, lambda uniques: uniques.map(mapping))
 
 
+@lru_cache(maxsize=1024)
 def camel_to_snake(name: str) -> str:
     return re.sub(
         r"([A-Z]+)([A-Z][a-z])", r"\1_\2", re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
     ).lower()
 
 
-def clean_html(html_content):
-    soup = BeautifulSoup(html_content, "html.parser")
+def clean_html(html_content, html_memo: Optional[HtmlTextMemo] = None):
+    return _html_memo(html_memo).convert(html_content)
 
-    for a in soup.find_all("a"):
-        text = a.get_text()
-        href = a.get("href", "")
-        replacement = f"{text} ({href})" if href else text
-        a.replace_with(replacement)
 
-    return soup.get_text(separator=" ", strip=True)
+def _html_memo(html_memo: Optional[HtmlTextMemo]) -> HtmlTextMemo:
+    return HTML_MEMO if html_memo is None else html_memo
 
 
-def clean_data(scrape_result: ScrapeResult) -> ScrapeResult:
-    cleaned_base = clean_base(scrape_result.base)
-
-    valid_ids = set(cleaned_base["id"])
+def convert_html(
+    series: pd.Series, html_memo: Optional[HtmlTextMemo] = None
+) -> pd.Series:
+    html_memo = _html_memo(html_memo)
+    converted = parse_unique(series, lambda uniques: uniques.map(html_memo.convert))
+    html_memo.flush()
+    return converted
 
-    cleaned_specs = clean_specs(scrape_result.specs)
-    if not cleaned_specs.empty:
-        cleaned_specs = cleaned_specs[cleaned_specs["id"].isin(valid_ids)]
 
-    cleaned_history = clean_history(scrape_result.history)
-    if not cleaned_history.empty:
-        cleaned_history = cleaned_history[cleaned_history["id"].isin(valid_ids)]
+def clean_data(
+    scrape_result: ScrapeResult,
+    options: Optional[CleaningOptions] = None,
+) -> ScrapeResult:
+    options = options or CleaningOptions()
+    fingerprints = {}
+    base_fingerprints = frame_fingerprints(scrape_result.base, FRAME_KEYS["base"])
+    cleaned_base = clean_base(scrape_result.base)
+    fingerprints["base"] = _surviving(base_fingerprints, cleaned_base, "base")
 
-    cleaned_news = clean_news(scrape_result.news)
-    if not cleaned_history.empty:
-        cleaned_news = cleaned_news[cleaned_news["id"].isin(valid_ids)]
+    valid_ids = set(cleaned_base["id"])
 
     scrape_result.base = cleaned_base
-    scrape_result.specs = cleaned_specs
-    scrape_result.history = cleaned_history
-    scrape_result.news = cleaned_news
+    scrape_result.fingerprints = fingerprints
+    with CleaningPool(options.workers) as pool:
+        for name, clean_fn in _detail_cleaners(options, pool).items():
+            scrape_result.pipe(
+                name,
+                partial(_clean_detail_frame, clean_fn, valid_ids, fingerprints, name),
+            )
 
     return scrape_result
 
 
-def clean_base(df: pd.DataFrame) -> pd.DataFrame:
-    columns_to_validate = ["currency", "dateline", "impactTitle"]
-    df = df.rename(columns={col: f"{col}_raw" for col in columns_to_validate})
+def clean_incremental(
+    cleaned: ScrapeResult,
+    raw: ScrapeResult,
+    options: Optional[CleaningOptions] = None,
+) -> ScrapeResult:
+    options = options or CleaningOptions()
+    fingerprints = {}
+
+    base = _merge_cleaned("base", cleaned, raw, clean_base, fingerprints)
+    valid_ids = set(base["id"])
+    raw.base = base
+    with CleaningPool(options.workers) as pool:
+        for name, clean_fn in _detail_cleaners(options, pool).items():
+            merged = _merge_cleaned(name, cleaned, raw, clean_fn, fingerprints)
+            setattr(raw, name, _filter_valid(merged, valid_ids))
+            fingerprints[name] = _surviving(
+                fingerprints[name], getattr(raw, name), name
+            )
 
-    df["datetime"] = pd.to_datetime(
-        df["dateline_raw"], unit="s", utc=True, errors="coerce"
+    raw.fingerprints = fingerprints
+    return raw
+
+
+def _detail_cleaners(options: CleaningOptions, pool: CleaningPool) -> dict:
+    html_memo = _html_memo(options.html_memo)
+    cleaners = {
+        "specs": partial(clean_specs, html_memo=html_memo),
+        "history": clean_history,
+        "news": partial(clean_news, html_memo=html_memo),
+    }
+    return {
+        name: partial(clean_in_chunks, clean_fn=clean_fn, options=options, pool=pool)
+        for name, clean_fn in cleaners.items()
+    }
+
+
+def _clean_detail_frame(
+    clean_fn, valid_ids: set, fingerprints: dict, name: str, df: pd.DataFrame
+) -> pd.DataFrame:
+    raw_fingerprints = frame_fingerprints(df, FRAME_KEYS[name])
+    cleaned = _filter_valid(clean_fn(df), valid_ids)
+    fingerprints[name] = _surviving(raw_fingerprints, cleaned, name)
+    return cleaned
+
+
+def _merge_cleaned(
+    name: str,
+    cleaned: ScrapeResult,
+    raw: ScrapeResult,
+    clean_fn,
+    fingerprints: dict,
+) -> pd.DataFrame:
+    keys = FRAME_KEYS[name]
+    raw_df = getattr(raw, name)
+    current = fingerprints[name] = frame_fingerprints(raw_df, keys)
+    previous = getattr(cleaned, "fingerprints", {}).get(name)
+    if previous is None:
+        logger.info(f"No fingerprints for '{name}'; cleaning all {len(raw_df)} rows.")
+        return clean_fn(raw_df)
+    if raw_df.empty:
+        return clean_fn(raw_df)
+
+    changed = changed_keys(previous, current)
+    fresh = clean_fn(raw_df[key_index(raw_df, keys).isin(changed)])
+    logger.info(
+        f"Incremental clean of '{name}': {len(changed)} of {len(current)} keys "
+        f"new or changed."
     )
 
-    df["impact"] = df["impactTitle_raw"].map(impact_mapping)
-
-    df = df.dropna(subset=["datetime"])
-    df = df.dropna(subset=["impact"])
-
-    if "currency_raw" in df.columns:
-        df["currency"] = df["currency_raw"].where(
-            df["currency_raw"].apply(is_valid_currency)
-        )
-        df = df.dropna(subset=["currency"])
-
-    df = df.drop(columns=[f"{col}_raw" for col in columns_to_validate])
-
-    columns_to_keep = [
-        "id",
-        "name",
-        "currency",
-        "datetime",
-        "impact",
-        "actual",
-        "previous",
-        "revision",
-        "forecast",
-        "actualBetterWorse",
-        "revisionBetterWorse",
-        "siteId",
-    ]
-    df["currency"] = df["currency"].replace("All", "WORLD")
-    df = df[columns_to_keep]
-    df = df.rename(columns=lambda col: camel_to_snake(col))
+    previous_df = getattr(cleaned, name)
+    if previous_df.empty or any(key not in previous_df.columns for key in keys):
+        return fresh
+    previous_keys = key_index(previous_df, keys)
+    kept = previous_df[previous_keys.isin(current.index) & ~previous_keys.isin(changed)]
 
-    return df
+    frames = [frame for frame in (kept, fresh) if not frame.empty]
+    if not frames:
+        return kept.reset_index(drop=True)
+    return concat_frames(frames, ignore_index=True)
+
+
+def _filter_valid(cleaned: pd.DataFrame, valid_ids: set) -> pd.DataFrame:
+    if not cleaned.empty:
+        cleaned = cleaned[cleaned["id"].isin(valid_ids)]
+    return cleaned
+
+
+def _surviving(fingerprints: pd.Series, cleaned: pd.DataFrame, name: str):
+    keys = FRAME_KEYS[name]
+    if cleaned.empty or any(key not in cleaned.columns for key in keys):
+        return fingerprints.iloc[:0]
+    return fingerprints[fingerprints.index.isin(key_index(cleaned, keys))]
+
+
+def clean_base(df: pd.DataFrame) -> pd.DataFrame:
+    datetime = df["dateline"]
+    if not is_datetime64_any_dtype(datetime):
+        datetime = parse_unique(datetime, to_datetime_from_epoch)
+    impact = map_unique(df["impactTitle"], impact_mapping)
+    currency = df["currency"].astype(object)
+
+    keep = (
+        datetime.notna()
+        & impact.notna()
+        & currency.isin(valid_currencies(currency.unique()))
+    ).to_numpy()
+
+    derived = {
+        "currency": currency.replace("All", "WORLD"),
+        "datetime": datetime,
+        "impact": impact,
+    }
+    columns = {
+        camel_to_snake(column): derived[column] if column in derived else df[column]
+        for column in BASE_COLUMNS
+    }
+    return pd.DataFrame(columns, copy=False)[keep]
 
 
 @handle_empty
-def clean_specs(df: pd.DataFrame) -> pd.DataFrame:
+def clean_specs(
+    df: pd.DataFrame, html_memo: Optional[HtmlTextMemo] = None
+) -> pd.DataFrame:
     df = df.drop(columns=["is_notice"]).rename(columns={"html": "description"})
-    df["description"] = df["description"].apply(clean_html)
+    df["description"] = convert_html(df["description"], html_memo)
     return df
 
 
@@ -145,16 +274,17 @@ def clean_specs(df: pd.DataFrame) -> pd.DataFrame:
 def clean_history(df: pd.DataFrame) -> pd.DataFrame:
     df = df.drop(columns=["impact_class"])
     df = df.rename(columns=lambda col: camel_to_snake(col))
-    df["date"] = pd.to_datetime(
-        df["date"], format="%b %d, %Y", errors="coerce"
-    ).dt.tz_localize("UTC")
+    if not is_datetime64_any_dtype(df["date"]):
+        df["date"] = parse_unique(df["date"], to_datetime_from_date)
 
     return df
 
 
 @handle_empty
-def clean_news(df: pd.DataFrame) -> pd.DataFrame:
+def clean_news(
+    df: pd.DataFrame, html_memo: Optional[HtmlTextMemo] = None
+) -> pd.DataFrame:
     df = df.rename(columns={"html": "text"})
-    df["text"] = df["text"].apply(clean_html)
+    df["text"] = convert_html(df["text"], html_memo)
 
     return df
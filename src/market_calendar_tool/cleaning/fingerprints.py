@@ -0,0 +1,42 @@
+from typing import List
+
+import pandas as pd
+
+FRAME_KEYS = {
+    "base": ["id"],
+    "specs": ["id"],
+    "history": ["id"],
+    "news": ["news_id", "id"],
+}
+
+
+def key_index(df: pd.DataFrame, keys: List[str]) -> pd.Index:
+    if len(keys) == 1:
+        return pd.Index(df[keys[0]])
+    return pd.MultiIndex.from_frame(df[keys])
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    try:
+        return pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        return pd.util.hash_pandas_object(df.astype(str), index=False)
+
+
+def frame_fingerprints(df: pd.DataFrame, keys: List[str]) -> pd.Series:
+    if df.empty or any(key not in df.columns for key in keys):
+        return pd.Series(dtype="uint64")
+
+    columns = sorted(df.columns)
+    hashes = row_hashes(df[columns]).to_numpy()
+    grouped = pd.Series(hashes, index=key_index(df, keys)).groupby(level=keys)
+    return grouped.sum() ^ grouped.size().astype("uint64")
+
+
+def changed_keys(previous: pd.Series, current: pd.Series) -> pd.Index:
+    known = current.index.isin(previous.index)
+    unchanged = known.copy()
+    unchanged[known] = (
+        previous.loc[current.index[known]].to_numpy() == current[known].to_numpy()
+    )
+    return current.index[~unchanged]
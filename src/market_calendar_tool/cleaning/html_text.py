@@ -0,0 +1,275 @@
+import atexit
+import hashlib
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from html import unescape
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import List, Optional
+
+from market_calendar_tool.scraper.detail_cache import CacheStats
+
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "basefont",
+        "bgsound",
+        "br",
+        "col",
+        "command",
+        "embed",
+        "frame",
+        "hr",
+        "image",
+        "img",
+        "input",
+        "isindex",
+        "keygen",
+        "link",
+        "menuitem",
+        "meta",
+        "nextid",
+        "param",
+        "source",
+        "spacer",
+        "track",
+        "wbr",
+    }
+)
+
+HIDDEN_ELEMENTS = frozenset({"script", "style", "template", "rt", "rp"})
+
+PRESERVE_WHITESPACE_ELEMENTS = frozenset({"pre", "textarea"})
+
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+PERSIST_BATCH_SIZE = 256
+
+_PERSISTED_MEMOS: "weakref.WeakSet[HtmlTextMemo]" = weakref.WeakSet()
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.pieces: List[str] = []
+        self._open: List[str] = []
+        self._data: List[str] = []
+        self._hidden = 0
+        self._preserve = 0
+        self._anchor_depth: Optional[int] = None
+        self._anchor_href = ""
+        self._anchor_text: List[str] = []
+        self._closed: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        self._end_data()
+        if tag in VOID_ELEMENTS:
+            return
+        if tag == "a" and self._anchor_depth is None:
+            self._anchor_depth = len(self._open)
+            self._anchor_href = ""
+            for name, value in attrs:
+                if name == "href":
+                    self._anchor_href = value or ""
+            self._anchor_text = []
+        if tag in HIDDEN_ELEMENTS:
+            self._hidden += 1
+        if tag in PRESERVE_WHITESPACE_ELEMENTS:
+            self._preserve += 1
+        self._open.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._end_data()
+
+    def handle_endtag(self, tag):
+        self._end_data()
+        if tag not in self._open:
+            return
+        while self._open:
+            self._pop()
+            if self._closed == tag:
+                break
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_entityref(self, name):
+        self._data.append(html5.get(f"{name};", f"&{name}"))
+
+    def handle_charref(self, name):
+        self._data.append(unescape(f"&#{name};"))
+
+    def handle_comment(self, data):
+        self._end_data()
+
+    def handle_decl(self, decl):
+        self._end_data()
+
+    def handle_pi(self, data):
+        self._end_data()
+
+    def unknown_decl(self, data):
+        self._end_data()
+
+    def close(self):
+        super().close()
+        self._end_data()
+        while self._open:
+            self._pop()
+
+    def _pop(self) -> None:
+        self._closed = self._open.pop()
+        if self._closed in HIDDEN_ELEMENTS:
+            self._hidden -= 1
+        if self._closed in PRESERVE_WHITESPACE_ELEMENTS:
+            self._preserve -= 1
+        if self._anchor_depth == len(self._open):
+            text = "".join(self._anchor_text)
+            href = self._anchor_href
+            self.pieces.append(f"{text} ({href})" if href else text)
+            self._anchor_depth = None
+
+    def _end_data(self) -> None:
+        if not self._data:
+            return
+        data = "".join(self._data)
+        self._data = []
+        if self._hidden:
+            return
+        if not self._preserve and not data.strip(ASCII_SPACES):
+            data = "\n" if "\n" in data else " "
+        if self._anchor_depth is not None:
+            self._anchor_text.append(data)
+        else:
+            self.pieces.append(data)
+
+
+def html_to_text(html_content: str) -> str:
+    parser = _TextExtractor()
+    parser.feed(html_content)
+    parser.close()
+    return " ".join(
+        piece for piece in (piece.strip() for piece in parser.pieces) if piece
+    )
+
+
+def content_key(html_content: str) -> bytes:
+    return hashlib.blake2b(html_content.encode("utf-8"), digest_size=16).digest()
+
+
+class HtmlTextMemo:
+    def __init__(self, max_entries: int = 100_000, path: Optional[str] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = path
+        self.stats = CacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if path is not None:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS html_text "
+                "(key BLOB PRIMARY KEY, text TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            _PERSISTED_MEMOS.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        return {"max_entries": self.max_entries, "path": self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def __call__(self, html_content):
+        return self.convert(html_content)
+
+    def convert(self, html_content):
+        if not isinstance(html_content, str):
+            return html_content
+
+        key = content_key(html_content)
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return text
+            text = self._load(key)
+            if text is not None:
+                self.stats.hits += 1
+                self._remember(key, text)
+                return text
+            self.stats.misses += 1
+
+        text = html_to_text(html_content)
+        with self._lock:
+            self._remember(key, text)
+            if self._conn is not None:
+                self._pending.append((key, text))
+                if len(self._pending) >= PERSIST_BATCH_SIZE:
+                    self._flush()
+        return text
+
+    def _load(self, key: bytes) -> Optional[str]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT text FROM html_text WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _remember(self, key: bytes, text: str) -> None:
+        self._entries[key] = text
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _flush(self) -> None:
+        if self._conn is None or not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO html_text (key, text) VALUES (?, ?)",
+            self._pending,
+        )
+        self._conn.commit()
+        self._pending = []
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending = []
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM html_text")
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+@atexit.register
+def _close_persisted_memos() -> None:
+    for memo in list(_PERSISTED_MEMOS):
+        memo.close()
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .html_text import HtmlTextMemo
+
+
+@dataclass(frozen=True)
+class CleaningOptions:
+    workers: int = 1
+    chunk_rows: int = 50_000
+    serial_threshold: int = 20_000
+    html_memo: Optional[HtmlTextMemo] = None
+
+    def __post_init__(self):
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        if self.serial_threshold < 0:
+            raise ValueError("serial_threshold cannot be negative")
@@ -0,0 +1,90 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+from loguru import logger
+
+from market_calendar_tool.scraper.columnar import ARROW_CONVERSION_ERRORS
+from market_calendar_tool.scraper.schemas import concat_frames
+
+from .models import CleaningOptions
+
+Chunk = Union[bytes, pd.DataFrame]
+
+
+def encode_frame(df: pd.DataFrame) -> Chunk:
+    try:
+        table = pa.Table.from_pandas(df)
+    except ARROW_CONVERSION_ERRORS:
+        return df
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode_frame(chunk: Chunk) -> pd.DataFrame:
+    if isinstance(chunk, pd.DataFrame):
+        return chunk
+    return pa.ipc.open_stream(chunk).read_all().to_pandas()
+
+
+def clean_chunk(clean_fn: Callable[[pd.DataFrame], pd.DataFrame], chunk: Chunk):
+    return encode_frame(clean_fn(decode_frame(chunk)))
+
+
+def split_frame(df: pd.DataFrame, options: CleaningOptions) -> List[pd.DataFrame]:
+    count = max(options.workers, math.ceil(len(df) / options.chunk_rows))
+    size = math.ceil(len(df) / count)
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+class CleaningPool:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._open = False
+
+    def __enter__(self) -> "CleaningPool":
+        self._open = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._open = False
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def map(self, fn: Callable, *iterables: Iterable) -> list:
+        if not self._open:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(fn, *iterables))
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return list(self._executor.map(fn, *iterables))
+
+
+def clean_in_chunks(
+    df: pd.DataFrame,
+    clean_fn: Callable[[pd.DataFrame], pd.DataFrame],
+    options: CleaningOptions,
+    pool: Optional[CleaningPool] = None,
+) -> pd.DataFrame:
+    if options.workers == 1 or len(df) < max(options.serial_threshold, 2):
+        return clean_fn(df)
+
+    chunks = split_frame(df, options)
+    if pool is None:
+        pool = CleaningPool(min(options.workers, len(chunks)))
+    logger.debug(
+        f"Cleaning {len(df)} rows in {len(chunks)} chunks on {pool.workers} processes"
+    )
+    cleaned = pool.map(
+        clean_chunk,
+        [clean_fn] * len(chunks),
+        [encode_frame(chunk) for chunk in chunks],
+    )
+    return concat_frames([decode_frame(chunk) for chunk in cleaned])
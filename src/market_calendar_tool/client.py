@@ -0,0 +1,217 @@
+import asyncio
+import threading
+from typing import Optional, Union
+
+import aiohttp
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from .api import _resolve_date_range
+from .scraper import BaseScraper, ExtendedScraper, ScrapeResult
+from .scraper.models import ScrapeOptions, Site
+
+
+class CalendarClient:
+    def __init__(
+        self,
+        options: Optional[ScrapeOptions] = None,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        ttl_dns_cache: Optional[int] = 300,
+        keepalive_timeout: float = 30.0,
+    ):
+        if limit < 1 or limit_per_host < 1:
+            raise ValueError("limit and limit_per_host must be at least 1")
+
+        self.options = options or ScrapeOptions()
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(Site), pool_maxsize=limit_per_host)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._background_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._background_thread: Optional[threading.Thread] = None
+        self._background_session: Optional[aiohttp.ClientSession] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "CalendarClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self) -> "CalendarClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def scrape(
+        self,
+        site: Site = Site.FOREXFACTORY,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        options: Optional[ScrapeOptions] = None,
+    ) -> ScrapeResult:
+        return self._base_scraper(site, date_from, date_to, options).scrape()
+
+    def scrape_extended(
+        self,
+        site: Site = Site.FOREXFACTORY,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        options: Optional[ScrapeOptions] = None,
+        previous: Optional[Union[ScrapeResult, str]] = None,
+    ) -> ScrapeResult:
+        loop = self._ensure_background_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._scrape_extended_on(
+                self._get_background_session,
+                site,
+                date_from,
+                date_to,
+                options,
+                previous,
+            ),
+            loop,
+        )
+        return future.result()
+
+    async def async_scrape(
+        self,
+        site: Site = Site.FOREXFACTORY,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        options: Optional[ScrapeOptions] = None,
+    ) -> ScrapeResult:
+        scraper = self._base_scraper(site, date_from, date_to, options)
+        return await scraper.async_scrape(await self._get_async_session())
+
+    async def async_scrape_extended(
+        self,
+        site: Site = Site.FOREXFACTORY,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        options: Optional[ScrapeOptions] = None,
+        previous: Optional[Union[ScrapeResult, str]] = None,
+    ) -> ScrapeResult:
+        return await self._scrape_extended_on(
+            self._get_async_session, site, date_from, date_to, options, previous
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if self._background_loop is not None:
+            loop = self._background_loop
+            if self._background_session is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._background_session.close(), loop
+                ).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self._background_thread.join()
+            loop.close()
+            self._background_loop = None
+
+        if self._async_session is not None and not self._async_session.closed:
+            if self._async_loop.is_closed():
+                logger.warning("CalendarClient async session outlived its event loop.")
+            elif not self._async_loop.is_running():
+                self._async_loop.run_until_complete(self._async_session.close())
+            else:
+                logger.warning(
+                    "CalendarClient.close() called from a running event loop; "
+                    "use 'await client.aclose()' to close the async session."
+                )
+
+        self.session.close()
+        logger.info("Closed CalendarClient sessions.")
+
+    async def aclose(self) -> None:
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self.close()
+
+    async def _scrape_extended_on(
+        self, get_session, site, date_from, date_to, options, previous
+    ) -> ScrapeResult:
+        base_scraper = self._base_scraper(site, date_from, date_to, options)
+        scraper = ExtendedScraper(base_scraper, options=base_scraper.options)
+        return await scraper.async_scrape(await get_session(), previous=previous)
+
+    def _base_scraper(
+        self,
+        site: Site,
+        date_from: Optional[str],
+        date_to: Optional[str],
+        options: Optional[ScrapeOptions],
+    ) -> BaseScraper:
+        if self._closed:
+            raise RuntimeError("CalendarClient is closed")
+
+        date_from_str, date_to_str = _resolve_date_range(date_from, date_to)
+        return BaseScraper(
+            site,
+            date_from_str,
+            date_to_str,
+            options=options or self.options,
+            session=self.session,
+        )
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = self._create_session()
+            self._async_loop = loop
+        elif self._async_loop is not loop:
+            raise RuntimeError(
+                "CalendarClient async methods must be awaited on the event loop "
+                "that first used the client"
+            )
+        return self._async_session
+
+    async def _get_background_session(self) -> aiohttp.ClientSession:
+        if self._background_session is None:
+            self._background_session = self._create_session()
+        return self._background_session
+
+    def _ensure_background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CalendarClient is closed")
+            if self._background_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="market-calendar-client",
+                    daemon=True,
+                )
+                thread.start()
+                self._background_loop = loop
+                self._background_thread = thread
+            return self._background_loop
@@ -0,0 +1,180 @@
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+MANIFEST_NAME = "scrape_manifest.sqlite"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    site: str
+    date_from: str
+    date_to: str
+    scraped_at: float
+    format: str
+    path: str
+    files: Dict[str, str] = field(default_factory=dict)
+    row_counts: Dict[str, Optional[int]] = field(default_factory=dict)
+
+
+class ResultManifest:
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.path = os.path.join(self.directory, MANIFEST_NAME)
+        self._lock = threading.Lock()
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                site TEXT NOT NULL,
+                date_from TEXT NOT NULL,
+                date_to TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                format TEXT NOT NULL,
+                path TEXT NOT NULL,
+                files TEXT NOT NULL,
+                row_counts TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_site_scraped_at "
+            "ON results (site, scraped_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_scraped_at ON results (scraped_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_site_range "
+            "ON results (site, date_from, date_to)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def exists(cls, directory: str) -> bool:
+        return os.path.isfile(os.path.join(directory, MANIFEST_NAME))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def record(self, entry: ManifestEntry) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO results "
+                "(site, date_from, date_to, scraped_at, format, path, files, "
+                "row_counts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.site,
+                    entry.date_from,
+                    entry.date_to,
+                    entry.scraped_at,
+                    entry.format,
+                    self._relative(entry.path),
+                    json.dumps(
+                        {
+                            name: self._relative(path)
+                            for name, path in entry.files.items()
+                        }
+                    ),
+                    json.dumps(entry.row_counts),
+                ),
+            )
+            self._conn.commit()
+
+    def find(
+        self,
+        site: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        formats: Optional[Iterable[str]] = None,
+        covering: bool = False,
+    ) -> List[ManifestEntry]:
+        query, params = self._select(site, date_from, date_to, formats, covering)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def latest(
+        self,
+        site: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        formats: Optional[Iterable[str]] = None,
+        covering: bool = True,
+    ) -> Optional[ManifestEntry]:
+        query, params = self._select(site, date_from, date_to, formats, covering)
+        with self._lock:
+            for row in self._conn.execute(query, params):
+                entry = self._entry(row)
+                if os.path.exists(entry.path):
+                    return entry
+                logger.warning(f"Skipping missing manifest entry '{entry.path}'.")
+        return None
+
+    def _select(
+        self,
+        site: Optional[str],
+        date_from: Optional[str],
+        date_to: Optional[str],
+        formats: Optional[Iterable[str]],
+        covering: bool,
+    ) -> Tuple[str, list]:
+        clauses, params = [], []
+        if site is not None:
+            clauses.append("site = ?")
+            params.append(site)
+        if date_from is not None:
+            clauses.append("date_from <= ?" if covering else "date_to >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            clauses.append("date_to >= ?" if covering else "date_from <= ?")
+            params.append(date_to)
+        if formats is not None:
+            formats = list(formats)
+            clauses.append(f"format IN ({', '.join('?' * len(formats))})")
+            params.extend(formats)
+
+        query = (
+            "SELECT site, date_from, date_to, scraped_at, format, path, files, "
+            "row_counts FROM results"
+        )
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        return query + " ORDER BY scraped_at DESC, entry_id DESC", params
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _entry(self, row: tuple) -> ManifestEntry:
+        site, date_from, date_to, scraped_at, format, path, files, row_counts = row
+        return ManifestEntry(
+            site=site,
+            date_from=date_from,
+            date_to=date_to,
+            scraped_at=scraped_at,
+            format=format,
+            path=os.path.join(self.directory, path),
+            files={
+                name: os.path.join(self.directory, relative)
+                for name, relative in json.loads(files).items()
+            },
+            row_counts=json.loads(row_counts),
+        )
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.directory)
@@ -1,15 +1,165 @@
+import json
 import os
 import pickle
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from loguru import logger
 
+from market_calendar_tool.scraper.columnar import frame_to_arrow
+
 
 class SaveFormat(Enum):
     PARQUET = "parquet"
     CSV = "csv"
+    ARROW = "arrow"
+
+
+IPC_CODECS = ("lz4", "zstd")
+PARQUET_CODECS = ("snappy", "gzip", "brotli", "lz4", "zstd")
+
+
+@dataclass(frozen=True)
+class WriteOptions:
+    compression: Optional[str] = None
+    compression_level: Optional[int] = None
+    row_group_size: Optional[int] = None
+    use_dictionary: bool = True
+    csv_chunksize: Optional[int] = None
+    workers: int = 4
+
+    def __post_init__(self):
+        if self.compression is not None and not pa.Codec.is_available(self.compression):
+            raise ValueError(f"Unsupported compression codec '{self.compression}'")
+        if self.compression_level is not None and self.compression is None:
+            raise ValueError("compression_level requires a compression codec")
+        if self.row_group_size is not None and self.row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+        if self.csv_chunksize is not None and self.csv_chunksize < 1:
+            raise ValueError("csv_chunksize must be at least 1")
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+
+    def check_format(self, save_format: SaveFormat) -> None:
+        if self.compression is None:
+            return
+        if save_format == SaveFormat.CSV:
+            raise ValueError(
+                f"CSV files do not support compression, got '{self.compression}'"
+            )
+        codecs = {SaveFormat.PARQUET: PARQUET_CODECS, SaveFormat.ARROW: IPC_CODECS}
+        supported = codecs.get(save_format)
+        if supported is not None and self.compression.lower() not in supported:
+            raise ValueError(
+                f"{save_format.name.capitalize()} files support only "
+                f"{', '.join(supported)} compression, not '{self.compression}'"
+            )
+
+    def parquet_kwargs(self) -> dict:
+        kwargs = {"use_dictionary": self.use_dictionary}
+        if self.compression is not None:
+            kwargs["compression"] = self.compression
+            kwargs["compression_level"] = self.compression_level
+        if self.row_group_size is not None:
+            kwargs["row_group_size"] = self.row_group_size
+        return kwargs
+
+    def ipc_options(self) -> pa.ipc.IpcWriteOptions:
+        if self.compression is None:
+            return pa.ipc.IpcWriteOptions()
+        self.check_format(SaveFormat.ARROW)
+        codec = pa.Codec(self.compression, compression_level=self.compression_level)
+        return pa.ipc.IpcWriteOptions(compression=codec)
+
+
+@contextmanager
+def atomic_path(path: str):
+    directory, name = os.path.split(path)
+    token = uuid.uuid4().hex[:8]
+    temp_path = os.path.join(directory, f".{name}.{token}.tmp")
+    try:
+        yield temp_path
+        if os.path.isdir(temp_path) and os.path.isdir(path):
+            _swap_directory(
+                temp_path, path, os.path.join(directory, f".{name}.{token}.old")
+            )
+        else:
+            os.replace(temp_path, path)
+    except BaseException:
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path, ignore_errors=True)
+        elif os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _swap_directory(temp_path: str, path: str, old_path: str) -> None:
+    os.replace(path, old_path)
+    try:
+        os.replace(temp_path, path)
+    except BaseException:
+        os.replace(old_path, path)
+        raise
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def write_ipc(
+    path: str, table: pa.Table, options: Optional[pa.ipc.IpcWriteOptions] = None
+) -> None:
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+
+class ResultFormat(Enum):
+    BUNDLE = "bundle"
+    PICKLE = "pickle"
+
+
+BUNDLE_VERSION = 1
+BUNDLE_META = "meta.json"
+
+
+def write_bundle(path: str, tables: Dict[str, pa.Table], meta: dict) -> None:
+    with atomic_path(path) as temp_path:
+        os.makedirs(temp_path)
+        for name, table in tables.items():
+            write_ipc(os.path.join(temp_path, f"{name}.arrow"), table)
+
+        meta = {"version": BUNDLE_VERSION, "frames": list(tables), **meta}
+        with open(os.path.join(temp_path, BUNDLE_META), "w") as f:
+            json.dump(meta, f, default=_json_default)
+
+
+def read_bundle(path: str) -> Tuple[dict, Dict[str, pa.Table]]:
+    with open(os.path.join(path, BUNDLE_META)) as f:
+        meta = json.load(f)
+    if meta.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported bundle version {meta.get('version')!r}")
+
+    tables = {}
+    for name in meta["frames"]:
+        source = pa.memory_map(os.path.join(path, f"{name}.arrow"))
+        tables[name] = pa.ipc.open_file(source).read_all()
+    return meta, tables
+
+
+def is_bundle(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, BUNDLE_META))
+
+
+def _json_default(value):
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
 
 
 class SaveMixin:
@@ -17,51 +167,135 @@ class SaveMixin:
         self,
         output_dir: Optional[str] = None,
         file_name: Optional[str] = None,
-    ):
+        result_format: ResultFormat = ResultFormat.BUNDLE,
+    ) -> str:
         output_dir = self._ensure_output_dir(output_dir)
 
         if file_name is None:
-            file_name = "data.pickle"
-            logger.warning("No file_name provided. Using default 'data.pickle'.")
+            file_name = f"data.{result_format.value}"
+            logger.warning(f"No file_name provided. Using default '{file_name}'.")
 
         file_path = os.path.join(output_dir, file_name)
 
         try:
-            with open(file_path, "wb") as f:
-                pickle.dump(self, f)
+            if result_format == ResultFormat.BUNDLE:
+                write_bundle(file_path, *self._bundle_contents())
+            else:
+                with atomic_path(file_path) as temp_path:
+                    with open(temp_path, "wb") as f:
+                        pickle.dump(self, f)
             logger.info(f"Serialized ScrapeResult object to '{file_path}'.")
         except Exception as e:
             logger.error(
                 f"Failed to serialize ScrapeResult object to '{file_path}': {e}"
             )
             raise e
+        return file_path
 
     def save_to_dataframes(
         self,
         save_format: SaveFormat = SaveFormat.PARQUET,
         output_dir: Optional[str] = None,
         file_prefix: str = "data",
-    ):
+        write_options: Optional[WriteOptions] = None,
+    ) -> Dict[str, str]:
+        write_options = write_options or WriteOptions()
+        write_options.check_format(save_format)
         output_dir = self._ensure_output_dir(output_dir)
 
-        for attribute_name, attribute_value in self.__dict__.items():
-            if isinstance(attribute_value, pd.DataFrame):
-                if attribute_value.empty:
+        frames = {}
+        for attribute_name in list(vars(self)):
+            attribute_value = self._frame_for_save(attribute_name)
+            if isinstance(attribute_value, (pd.DataFrame, pa.Table)):
+                if self._is_empty(attribute_value):
                     logger.info(f"Skipping empty DataFrame '{attribute_name}'.")
                     continue
-                file_name = f"{file_prefix}_{attribute_name}.{save_format.value}"
-                file_path = os.path.join(output_dir, file_name)
-                try:
-                    if save_format == SaveFormat.PARQUET:
-                        attribute_value.to_parquet(file_path, index=False)
-                    elif save_format == SaveFormat.CSV:
-                        attribute_value.to_csv(file_path, index=False)
-                    logger.info(f"Saved '{attribute_name}' DataFrame to '{file_path}'.")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to save '{attribute_name}' DataFrame to '{file_path}': {e}"
+                if save_format == SaveFormat.CSV:
+                    attribute_value = getattr(self, attribute_name)
+                frames[attribute_name] = attribute_value
+
+        saved = {
+            name: os.path.join(output_dir, f"{file_prefix}_{name}.{save_format.value}")
+            for name in frames
+        }
+        workers = min(write_options.workers, len(frames))
+        if workers <= 1:
+            for name, frame in frames.items():
+                self._write_frame(name, frame, saved[name], save_format, write_options)
+            return saved
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._write_frame,
+                    name,
+                    frame,
+                    saved[name],
+                    save_format,
+                    write_options,
+                )
+                for name, frame in frames.items()
+            ]
+            for future in futures:
+                future.result()
+        return saved
+
+    @staticmethod
+    def _write_frame(
+        name: str,
+        frame,
+        file_path: str,
+        save_format: SaveFormat,
+        write_options: WriteOptions,
+    ) -> None:
+        try:
+            with atomic_path(file_path) as temp_path:
+                if save_format == SaveFormat.PARQUET:
+                    if isinstance(frame, pa.Table):
+                        pq.write_table(
+                            frame, temp_path, **write_options.parquet_kwargs()
+                        )
+                    else:
+                        frame.to_parquet(
+                            temp_path, index=False, **write_options.parquet_kwargs()
+                        )
+                elif save_format == SaveFormat.ARROW:
+                    if isinstance(frame, pd.DataFrame):
+                        frame = frame_to_arrow(frame)
+                    write_ipc(temp_path, frame, write_options.ipc_options())
+                elif save_format == SaveFormat.CSV:
+                    frame.to_csv(
+                        temp_path, index=False, chunksize=write_options.csv_chunksize
                     )
-                    raise e
+            logger.info(f"Saved '{name}' DataFrame to '{file_path}'.")
+        except Exception as e:
+            logger.error(f"Failed to save '{name}' DataFrame to '{file_path}': {e}")
+            raise e
+
+    def save_to_store(self, store) -> Dict[str, int]:
+        return store.upsert(self)
+
+    def _bundle_contents(self) -> Tuple[Dict[str, pa.Table], dict]:
+        tables = {}
+        for attribute_name in list(vars(self)):
+            attribute_value = self._frame_for_save(attribute_name)
+            if isinstance(attribute_value, pd.DataFrame):
+                attribute_value = frame_to_arrow(attribute_value)
+            if isinstance(attribute_value, pa.Table):
+                tables[attribute_name] = attribute_value
+        return tables, {}
+
+    def _frame_for_save(self, name: str):
+        value = vars(self)[name]
+        if isinstance(value, pa.Table):
+            return value
+        return getattr(self, name)
+
+    @staticmethod
+    def _is_empty(frame) -> bool:
+        if isinstance(frame, pa.Table):
+            return frame.num_rows == 0 or frame.num_columns == 0
+        return frame.empty
 
     @staticmethod
     def load_object(file_path: str):
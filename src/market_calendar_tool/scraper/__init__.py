@@ -1,13 +1,24 @@
 from .base_scraper import BaseScraper, DataProcessingError, DataProcessor
-from .extended_scraper import ExtendedScraper
-from .models import ScrapeResult, Site, site_number_mapping
+from .concurrency import AdaptiveLimiter
+from .detail_cache import CacheStats, DetailCache, SQLiteDetailCache
+from .extended_scraper import DetailFetchError, ExtendedScraper
+from .lazy import LazyFrame
+from .models import Engine, FailedFetch, ScrapeResult, Site, site_number_mapping
 
 __all__ = [
     "BaseScraper",
     "ExtendedScraper",
+    "DetailFetchError",
+    "FailedFetch",
+    "DetailCache",
+    "SQLiteDetailCache",
+    "CacheStats",
+    "AdaptiveLimiter",
     "DataProcessor",
     "DataProcessingError",
     "Site",
+    "Engine",
     "site_number_mapping",
     "ScrapeResult",
+    "LazyFrame",
 ]
@@ -1,18 +1,40 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import aiohttp
+import pandas as pd
+import pyarrow as pa
 import requests
 from loguru import logger
 
+from .columnar import concat_tables
 from .data_processor import DataProcessingError, DataProcessor
-from .models import ScrapeResult, Site, site_number_mapping
+from .models import Engine, ScrapeOptions, ScrapeResult, Site, site_number_mapping
+from .rate_limit import TokenBucket, host_bucket
+from .retry import retry_delay
+from .schemas import concat_frames
 
 
 class BaseScraper:
-    def __init__(self, site: Site, date_from: str, date_to: str):
+    def __init__(
+        self,
+        site: Site,
+        date_from: str,
+        date_to: str,
+        options: Optional[ScrapeOptions] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.site = site
         self.date_from = date_from
         self.date_to = date_to
+        self.options = options or ScrapeOptions()
         self.base_url = site.value
         self.site_number = site_number_mapping.get(site, None)
-        self.session = requests.Session()
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": "market-calendar-tool (+https://github.com/pavelkrusek/market-calendar-tool)",
@@ -21,40 +43,202 @@ class BaseScraper:
             }
         )
 
-    def scrape(self):
+    def scrape(self) -> ScrapeResult:
+        windows = self._date_windows()
+        if len(windows) == 1:
+            return self._build_result(self._process_data(self._fetch(*windows[0])))
+
+        max_workers = min(len(windows), self.options.max_parallel_tasks)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(
+                executor.map(
+                    lambda window: self._process_data(self._fetch(*window)), windows
+                )
+            )
+
+        return self._build_result(self._merge_frames(frames))
+
+    async def async_scrape(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> ScrapeResult:
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.async_scrape(own_session, semaphore)
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.options.max_parallel_tasks)
+
+        async def fetch_window(window: Tuple[str, str]) -> pd.DataFrame:
+            async with semaphore:
+                data = await self._async_fetch(session, *window)
+            return self._process_data(data)
+
+        windows = self._date_windows()
+        if len(windows) == 1:
+            return self._build_result(await fetch_window(windows[0]))
+
+        results = await asyncio.gather(
+            *(fetch_window(window) for window in windows), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return self._build_result(self._merge_frames(results))
+
+    def _fetch(self, date_from: str, date_to: str):
         url = f"{self.base_url}/apply-settings/1"
+        bucket = self._rate_limiter()
 
-        form_data = {
-            "begin_date": self.date_from,
-            "end_date": self.date_to,
-        }
+        for attempt in range(self.options.max_retries + 1):
+            try:
+                if bucket is not None:
+                    bucket.acquire_sync()
+                response = self.session.post(
+                    url,
+                    json=self._form_data(date_from, date_to),
+                    headers=self.session.headers,
+                    timeout=self.options.request_timeout,
+                )
+                response.raise_for_status()
+                try:
+                    data = response.json()
+                    logger.info(
+                        f"Successfully scraped base data from {url} ({date_from} to {date_to})"
+                    )
+                    return data
+                except requests.exceptions.JSONDecodeError as e:
+                    logger.error(f"Error decoding JSON from {url}: {str(e)}")
+                    raise
+            except requests.exceptions.RequestException as e:
+                delay = retry_delay(e, attempt, self.options)
+                if delay is None:
+                    logger.critical(f"Error scraping base data: {str(e)}")
+                    raise
+                self._log_retry(date_from, date_to, attempt, delay, e)
+                time.sleep(delay)
 
-        try:
-            response = self.session.post(
-                url, json=form_data, headers=self.session.headers, timeout=10
-            )
-            response.raise_for_status()
+    async def _async_fetch(
+        self, session: aiohttp.ClientSession, date_from: str, date_to: str
+    ):
+        url = f"{self.base_url}/apply-settings/1"
+        bucket = self._rate_limiter()
+
+        for attempt in range(self.options.max_retries + 1):
             try:
-                data = response.json()
-                logger.info(f"Successfully scraped base data from {url}")
-                df = self._process_data(data)
-                return ScrapeResult(
-                    site=self.site,
-                    date_from=self.date_from,
-                    date_to=self.date_to,
-                    base=df,
+                if bucket is not None:
+                    await bucket.acquire()
+                async with session.post(
+                    url,
+                    json=self._form_data(date_from, date_to),
+                    headers=self.session.headers,
+                    timeout=aiohttp.ClientTimeout(total=self.options.request_timeout),
+                ) as response:
+                    response.raise_for_status()
+                    try:
+                        data = await response.json()
+                    except (json.JSONDecodeError, aiohttp.ContentTypeError) as e:
+                        logger.error(f"Error decoding JSON from {url}: {str(e)}")
+                        raise
+                logger.info(
+                    f"Successfully scraped base data from {url} ({date_from} to {date_to})"
                 )
-            except requests.exceptions.JSONDecodeError as e:
-                logger.critical(f"Error decoding JSON from {url}: {str(e)}")
-                raise
-        except requests.exceptions.RequestException as e:
-            logger.critical(f"Error scraping base data: {str(e)}")
-            raise
+                return data
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                json.JSONDecodeError,
+            ) as e:
+                delay = retry_delay(e, attempt, self.options)
+                if delay is None:
+                    logger.critical(f"Error scraping base data: {str(e)}")
+                    raise
+                self._log_retry(date_from, date_to, attempt, delay, e)
+                await asyncio.sleep(delay)
+
+    def _rate_limiter(self) -> Optional[TokenBucket]:
+        return host_bucket(
+            self.base_url,
+            self.options.requests_per_second,
+            self.options.rate_limit_burst,
+        )
+
+    def _log_retry(
+        self, date_from: str, date_to: str, attempt: int, delay: float, error
+    ) -> None:
+        logger.warning(
+            f"Retrying base data window {date_from} to {date_to} in {delay:.2f}s "
+            f"(attempt {attempt + 1}/{self.options.max_retries}) after error: {error}"
+        )
+
+    def _date_windows(self) -> List[Tuple[str, str]]:
+        chunk_days = self.options.chunk_days
+        if chunk_days is None:
+            return [(self.date_from, self.date_to)]
+
+        start = datetime.strptime(self.date_from, "%Y-%m-%d")
+        end = datetime.strptime(self.date_to, "%Y-%m-%d")
+
+        windows = []
+        while start <= end:
+            window_end = min(start + timedelta(days=chunk_days - 1), end)
+            windows.append(
+                (start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d"))
+            )
+            start = window_end + timedelta(days=1)
+        return windows
+
+    @staticmethod
+    def _form_data(date_from: str, date_to: str) -> dict:
+        return {
+            "begin_date": date_from,
+            "end_date": date_to,
+        }
+
+    def _build_result(self, df: pd.DataFrame) -> ScrapeResult:
+        return ScrapeResult(
+            site=self.site,
+            date_from=self.date_from,
+            date_to=self.date_to,
+            base=df,
+        )
+
+    @staticmethod
+    def _merge_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        if frames and isinstance(frames[0], pa.Table):
+            return BaseScraper._merge_tables(frames)
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        df = concat_frames(frames, ignore_index=True)
+        if "id" in df.columns:
+            df = df.drop_duplicates(subset="id", keep="last").reset_index(drop=True)
+        return df
+
+    @staticmethod
+    def _merge_tables(tables: List[pa.Table]) -> pa.Table:
+        tables = [table for table in tables if table.num_rows]
+        if not tables:
+            return pa.table({})
+
+        table = concat_tables(tables)
+        if "id" in table.column_names:
+            ids = table.column("id").to_pandas()
+            keep = ~ids.duplicated(keep="last").to_numpy()
+            table = table.filter(pa.array(keep))
+        return table
 
     def _process_data(self, data):
         try:
             processor = DataProcessor(data)
-            df = processor.to_base_df()
+            typed = not self.options.raw_dtypes
+            if self.options.engine == Engine.ARROW:
+                return processor.to_base_table(typed=typed)
+            df = processor.to_base_df(typed=typed)
             return df
         except DataProcessingError as e:
             logger.critical(f"Error processing data: {str(e)}")
@@ -0,0 +1,310 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from loguru import logger
+
+BASE_RECORD_PATH = ("days", "events")
+
+DETAIL_RECORD_PATHS: Dict[str, Tuple[Tuple[str, ...], Dict[str, str]]] = {
+    "specs": (("data", "specs"), {}),
+    "history": (("data", "history", "events"), {}),
+    "news": (("data", "linked_threads", "news"), {"id": "news_id"}),
+}
+
+
+def flatten_record(record: dict, prefix: str = "", level: int = 0) -> dict:
+    if level == 0 and not any(isinstance(value, dict) for value in record.values()):
+        return record
+
+    flat = {}
+    nested = []
+    for key, value in record.items():
+        key = key if isinstance(key, str) else str(key)
+        name = f"{prefix}.{key}" if level else key
+        if isinstance(value, dict):
+            if level:
+                flat.update(flatten_record(value, name, level + 1))
+            else:
+                nested.append((name, value))
+        else:
+            flat[name] = value
+
+    for name, value in nested:
+        flat.update(flatten_record(value, name, level + 1))
+    return flat
+
+
+def pull_records(payload, path: Sequence[str]) -> List:
+    node = payload
+    for key in path:
+        if not isinstance(node, dict):
+            return []
+        node = node.get(key)
+    return node if isinstance(node, list) else []
+
+
+def iter_payloads(raw_data) -> List:
+    if isinstance(raw_data, dict):
+        return [raw_data]
+    return list(raw_data)
+
+
+def pull_event_id(payload):
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        return np.nan
+    return data.get("event_id", np.nan)
+
+
+ARROW_CONVERSION_ERRORS = (
+    pa.ArrowInvalid,
+    pa.ArrowTypeError,
+    pa.ArrowNotImplementedError,
+)
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def to_arrow_array(values: list, name: Optional[str] = None) -> pa.Array:
+    try:
+        return pa.array(values, from_pandas=True)
+    except ARROW_CONVERSION_ERRORS:
+        column = f"Column '{name}'" if name is not None else "A column"
+        logger.warning(
+            f"{column} mixes types that Arrow cannot hold together; "
+            "storing it as strings."
+        )
+        return pa.array(
+            [None if _is_missing(value) else str(value) for value in values],
+            type=pa.string(),
+        )
+
+
+def frame_to_arrow(df: pd.DataFrame) -> pa.Table:
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except ARROW_CONVERSION_ERRORS:
+        pass
+
+    df = df.copy(deep=False)
+    for column in df.columns:
+        try:
+            pa.Array.from_pandas(df[column])
+        except ARROW_CONVERSION_ERRORS:
+            array = to_arrow_array(df[column].tolist(), column)
+            df[column] = array.to_numpy(zero_copy_only=False)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def concat_tables(tables: List[pa.Table]) -> pa.Table:
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    types: Dict[str, set] = {}
+    for table in tables:
+        for field in table.schema:
+            types.setdefault(field.name, set()).add(field.type)
+    conflicting = {
+        name for name, found in types.items() if len(found - {pa.null()}) > 1
+    }
+
+    unified = []
+    for table in tables:
+        for index, name in enumerate(table.column_names):
+            if name in conflicting:
+                column = table.column(index).cast(pa.string())
+                table = table.set_column(index, name, column)
+        unified.append(table)
+    return pa.concat_tables(unified, promote_options="permissive")
+
+
+def id_order(ids: list, event_ids: Sequence) -> np.ndarray:
+    positions = {event_id: index for index, event_id in enumerate(event_ids)}
+    missing = len(positions)
+    ranks = [positions.get(event_id, missing) for event_id in ids]
+    return np.argsort(np.array(ranks, dtype=np.int64), kind="stable")
+
+
+def order_frame_by_ids(df: pd.DataFrame, event_ids: Sequence) -> pd.DataFrame:
+    if df.empty or "id" not in df.columns:
+        return df
+    order = id_order(df["id"].tolist(), event_ids)
+    return df.take(order).reset_index(drop=True)
+
+
+def order_table_by_ids(table: pa.Table, event_ids: Sequence) -> pa.Table:
+    if not table.num_rows or "id" not in table.column_names:
+        return table
+    return table.take(pa.array(id_order(table.column("id").to_pylist(), event_ids)))
+
+
+class ColumnarFrameBuilder:
+    def __init__(
+        self, rename: Optional[Dict[str, str]] = None, id_column: Optional[str] = "id"
+    ):
+        self.rename = rename or {}
+        self.id_column = id_column
+        self._reset()
+
+    def _reset(self) -> None:
+        self._columns: Dict[str, list] = {}
+        self._ids: list = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def append(self, record: dict, event_id=None) -> None:
+        length = len(self._ids)
+        columns = self._columns
+        flat = flatten_record(record)
+        for key, value in flat.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [np.nan] * length
+            column.append(value)
+        length += 1
+        if len(columns) > len(flat):
+            for column in columns.values():
+                if len(column) < length:
+                    column.append(np.nan)
+        self._ids.append(event_id)
+
+    def to_frame(self) -> pd.DataFrame:
+        data = {
+            self.rename.get(key, key): values for key, values in self._columns.items()
+        }
+        df = pd.DataFrame(data)
+        if self.id_column is not None:
+            df[self.id_column] = np.array(self._ids, dtype=object)
+        return df
+
+    def to_table(self) -> pa.Table:
+        columns = {}
+        for key, values in self._columns.items():
+            name = self.rename.get(key, key)
+            columns[name] = to_arrow_array(values, name)
+        if self.id_column is not None:
+            columns[self.id_column] = to_arrow_array(self._ids, self.id_column)
+        return pa.table(columns)
+
+    def flush(self) -> pd.DataFrame:
+        df = self.to_frame()
+        self._reset()
+        return df
+
+    def flush_table(self) -> pa.Table:
+        table = self.to_table()
+        self._reset()
+        return table
+
+
+class DetailFrameBuilder:
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        arrow: bool = False,
+        names: Optional[Sequence[str]] = None,
+    ):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.arrow = arrow
+        self.payload_count = 0
+        self._pending = 0
+        self._paths = {
+            name: DETAIL_RECORD_PATHS[name] for name in names or DETAIL_RECORD_PATHS
+        }
+        self._builders = {
+            name: ColumnarFrameBuilder(rename)
+            for name, (_, rename) in self._paths.items()
+        }
+        self._chunks: Dict[str, list] = {name: [] for name in self._paths}
+
+    def add(self, payload) -> None:
+        event_id = pull_event_id(payload)
+        for name, (path, _) in self._paths.items():
+            builder = self._builders[name]
+            for record in pull_records(payload, path):
+                if isinstance(record, dict):
+                    builder.append(record, event_id)
+
+        self.payload_count += 1
+        self._pending += 1
+        if self.batch_size is not None and self._pending >= self.batch_size:
+            self.flush()
+
+    def extend(self, payloads) -> "DetailFrameBuilder":
+        for payload in payloads:
+            self.add(payload)
+        return self
+
+    def flush(self) -> None:
+        for name, builder in self._builders.items():
+            if len(builder):
+                chunk = builder.flush_table() if self.arrow else builder.flush()
+                self._chunks[name].append(chunk)
+        self._pending = 0
+
+    def frame(self, name: str) -> pd.DataFrame:
+        self.flush()
+        if not self.payload_count:
+            return pd.DataFrame()
+
+        chunks = self._chunks[name]
+        if not chunks:
+            return pd.DataFrame({"id": np.array([], dtype=object)})
+        if len(chunks) == 1:
+            return chunks[0]
+
+        df = pd.concat(chunks, ignore_index=True)
+        df = df[[col for col in df.columns if col != "id"] + ["id"]]
+        self._chunks[name] = [df]
+        return df
+
+    def table(self, name: str) -> pa.Table:
+        self.flush()
+        if not self.payload_count:
+            return pa.table({})
+
+        chunks = self._chunks[name]
+        if not chunks:
+            return pa.table({"id": pa.array([], type=pa.int64())})
+        if len(chunks) == 1:
+            return chunks[0]
+
+        table = concat_tables(chunks)
+        table = table.select(
+            [col for col in table.column_names if col != "id"] + ["id"]
+        )
+        self._chunks[name] = [table]
+        return table
+
+    def frames(self) -> Dict[str, pd.DataFrame]:
+        return {name: self.frame(name) for name in self._paths}
+
+    def tables(self) -> Dict[str, pa.Table]:
+        return {name: self.table(name) for name in self._paths}
+
+
+def base_builder(raw_data) -> ColumnarFrameBuilder:
+    builder = ColumnarFrameBuilder(id_column=None)
+    days_key, events_key = BASE_RECORD_PATH
+    for payload in iter_payloads(raw_data):
+        for day in payload[days_key]:
+            for record in day[events_key]:
+                builder.append(record)
+    return builder
+
+
+def base_frame(raw_data) -> pd.DataFrame:
+    return base_builder(raw_data).to_frame()
+
+
+def base_table(raw_data) -> pa.Table:
+    return base_builder(raw_data).to_table()
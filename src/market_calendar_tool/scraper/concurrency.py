@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 5,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+    ):
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit cannot be lower than min_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.limit = min_limit if initial_limit is None else initial_limit
+        self.limit = max(min_limit, min(self.limit, max_limit))
+        self.history: List[Tuple[float, int]] = [(time.time(), self.limit)]
+
+        self._in_flight = 0
+        self._successes = 0
+        self._slow_start = True
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        elif latency > self._baseline_latency * self.latency_tolerance:
+            self._decrease()
+            return
+        else:
+            self._baseline_latency = 0.9 * self._baseline_latency + 0.1 * latency
+
+        self._successes += 1
+        if self._slow_start or self._successes >= self.limit:
+            self._successes = 0
+            self._set_limit(self.limit + 1)
+
+    def record_throttle(self) -> None:
+        self._decrease()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._slow_start = False
+        self._successes = 0
+        self._set_limit(int(self.limit * self.decrease_factor))
+
+    def _set_limit(self, limit: int) -> None:
+        limit = max(self.min_limit, min(limit, self.max_limit))
+        if limit != self.limit:
+            self.limit = limit
+            self.history.append((time.time(), limit))
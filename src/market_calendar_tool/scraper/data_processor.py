@@ -1,6 +1,10 @@
-from typing import List, Optional
+from typing import Dict, Optional
 
 import pandas as pd
+import pyarrow as pa
+
+from .columnar import DetailFrameBuilder, base_frame, base_table, iter_payloads
+from .schemas import apply_arrow_schema, apply_schema
 
 
 class DataProcessingError(Exception):
@@ -11,50 +15,61 @@ class DataProcessor:
 
     def __init__(self, raw_data):
         self.raw_data = raw_data
+        self._detail_frames: Optional[Dict[str, pd.DataFrame]] = None
+        self._detail_tables: Optional[Dict[str, pa.Table]] = None
 
-    def to_base_df(self) -> pd.DataFrame:
-        return self._to_df(
-            record_path=["days", "events"],
-            meta=[],
-            rename_cols={},
-        )
-
-    def to_specs_df(self) -> pd.DataFrame:
-        return self._to_df(
-            record_path=["data", "specs"],
-            meta=[["data", "event_id"]],
-            rename_cols={"data.event_id": "id"},
-        )
-
-    def to_news_df(self) -> pd.DataFrame:
-        return self._to_df(
-            record_path=["data", "linked_threads", "news"],
-            meta=[["data", "event_id"]],
-            rename_cols={"id": "news_id", "data.event_id": "id"},
-        )
-
-    def to_history_df(self) -> pd.DataFrame:
-        return self._to_df(
-            record_path=["data", "history", "events"],
-            meta=[["data", "event_id"]],
-            rename_cols={"data.event_id": "id"},
-        )
-
-    def _to_df(
-        self,
-        record_path: List[str],
-        meta: Optional[str | list[str | list[str]]] = None,
-        rename_cols: Optional[dict] = None,
-    ) -> pd.DataFrame:
+    def to_base_df(self, typed: bool = True) -> pd.DataFrame:
         try:
-            df = pd.json_normalize(
-                self.raw_data, record_path=record_path, meta=meta, errors="ignore"
-            )
+            df = base_frame(self.raw_data)
+        except Exception as e:
+            raise DataProcessingError(f"Failed to convert data to DataFrame: {e}")
+        return apply_schema(df, "base") if typed else df
 
-            if rename_cols:
-                df.rename(columns=rename_cols, inplace=True)
+    def to_specs_df(self, typed: bool = True) -> pd.DataFrame:
+        return self._detail_frame("specs", typed)
 
-            return df
+    def to_news_df(self, typed: bool = True) -> pd.DataFrame:
+        return self._detail_frame("news", typed)
 
+    def to_history_df(self, typed: bool = True) -> pd.DataFrame:
+        return self._detail_frame("history", typed)
+
+    def _detail_frame(self, name: str, typed: bool) -> pd.DataFrame:
+        if self._detail_frames is None:
+            try:
+                builder = DetailFrameBuilder()
+                self._detail_frames = builder.extend(
+                    iter_payloads(self.raw_data)
+                ).frames()
+            except Exception as e:
+                raise DataProcessingError(f"Failed to convert data to DataFrame: {e}")
+        df = self._detail_frames[name]
+        return apply_schema(df, name) if typed else df
+
+    def to_base_table(self, typed: bool = True) -> pa.Table:
+        try:
+            table = base_table(self.raw_data)
         except Exception as e:
-            raise DataProcessingError(f"Failed to convert data to DataFrame: {e}")
+            raise DataProcessingError(f"Failed to convert data to Table: {e}")
+        return apply_arrow_schema(table, "base") if typed else table
+
+    def to_specs_table(self, typed: bool = True) -> pa.Table:
+        return self._detail_table("specs", typed)
+
+    def to_news_table(self, typed: bool = True) -> pa.Table:
+        return self._detail_table("news", typed)
+
+    def to_history_table(self, typed: bool = True) -> pa.Table:
+        return self._detail_table("history", typed)
+
+    def _detail_table(self, name: str, typed: bool) -> pa.Table:
+        if self._detail_tables is None:
+            try:
+                builder = DetailFrameBuilder(arrow=True)
+                self._detail_tables = builder.extend(
+                    iter_payloads(self.raw_data)
+                ).tables()
+            except Exception as e:
+                raise DataProcessingError(f"Failed to convert data to Table: {e}")
+        table = self._detail_tables[name]
+        return apply_arrow_schema(table, name) if typed else table
@@ -0,0 +1,257 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __sub__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            hits=self.hits - other.hits,
+            misses=self.misses - other.misses,
+            evictions=self.evictions - other.evictions,
+        )
+
+
+class DetailCache(ABC):
+    def __init__(
+        self,
+        ttl: float = 24 * 60 * 60,
+        near_ttl: float = 10 * 60,
+        near_window: float = 24 * 60 * 60,
+    ):
+        if ttl <= 0 or near_ttl <= 0:
+            raise ValueError("ttl and near_ttl must be positive")
+        self.ttl = ttl
+        self.near_ttl = near_ttl
+        self.near_window = near_window
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def ttl_for(self, dateline: Optional[float], now: Optional[float] = None) -> float:
+        if dateline is None:
+            return self.ttl
+        now = time.time() if now is None else now
+        if abs(float(dateline) - now) <= self.near_window:
+            return self.near_ttl
+        return self.ttl
+
+    def get(self, site_number: int, event_id: int) -> Optional[dict]:
+        payload = self._get(site_number, event_id)
+        with self._stats_lock:
+            if payload is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return payload
+
+    def snapshot(self) -> CacheStats:
+        with self._stats_lock:
+            return replace(self.stats)
+
+    def set(
+        self,
+        site_number: int,
+        event_id: int,
+        payload: dict,
+        dateline: Optional[float] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if ttl is None:
+            ttl = self.ttl_for(dateline)
+        self._set(site_number, event_id, payload, ttl)
+
+    @abstractmethod
+    def _get(self, site_number: int, event_id: int) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def _set(self, site_number: int, event_id: int, payload: dict, ttl: float):
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+ACCESS_BATCH_SIZE = 256
+
+
+class SQLiteDetailCache(DetailCache):
+    def __init__(
+        self,
+        path: str = "detail_cache.sqlite",
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 24 * 60 * 60,
+        near_ttl: float = 10 * 60,
+        near_window: float = 24 * 60 * 60,
+    ):
+        super().__init__(ttl=ttl, near_ttl=near_ttl, near_window=near_window)
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._accessed: Dict[Tuple[int, int], float] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS details (
+                site_number INTEGER NOT NULL,
+                event_id INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (site_number, event_id)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS details_last_access ON details (last_access)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM details"
+        ).fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM details").fetchone()[0]
+
+    def _get(self, site_number: int, event_id: int) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, size, expires_at FROM details "
+                "WHERE site_number = ? AND event_id = ?",
+                (site_number, int(event_id)),
+            ).fetchone()
+            if row is None:
+                return None
+
+            payload, size, expires_at = row
+            if expires_at <= now:
+                self._conn.execute(
+                    "DELETE FROM details WHERE site_number = ? AND event_id = ?",
+                    (site_number, int(event_id)),
+                )
+                self._total_bytes -= size
+                self._conn.commit()
+                return None
+
+            self._accessed[(site_number, int(event_id))] = now
+            if len(self._accessed) >= ACCESS_BATCH_SIZE:
+                self._flush_access()
+                self._conn.commit()
+
+        try:
+            return json.loads(payload)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Discarding corrupt cache entry for {event_id}: {e}")
+            return None
+
+    def _set(self, site_number: int, event_id: int, payload: dict, ttl: float):
+        blob = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        size = len(blob)
+        if size > self.max_bytes:
+            logger.debug(f"Detail payload for {event_id} exceeds cache size limit")
+            return
+
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM details WHERE site_number = ? AND event_id = ?",
+                (site_number, int(event_id)),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO details "
+                "(site_number, event_id, payload, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (site_number, int(event_id), blob, size, now + ttl, now),
+            )
+            self._accessed.pop((site_number, int(event_id)), None)
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _flush_access(self) -> None:
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            "UPDATE details SET last_access = ? "
+            "WHERE site_number = ? AND event_id = ?",
+            [
+                (accessed_at, site_number, event_id)
+                for (site_number, event_id), accessed_at in self._accessed.items()
+            ],
+        )
+        self._accessed = {}
+
+    def _evict(self) -> None:
+        if self._total_bytes > self.max_bytes:
+            self._flush_access()
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT site_number, event_id, size FROM details "
+                "ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for site_number, event_id, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute(
+                    "DELETE FROM details WHERE site_number = ? AND event_id = ?",
+                    (site_number, event_id),
+                )
+                self._total_bytes -= size
+                with self._stats_lock:
+                    self.stats.evictions += 1
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accessed = {}
+            self._conn.execute("DELETE FROM details")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
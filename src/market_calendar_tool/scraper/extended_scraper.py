@@ -1,14 +1,42 @@
 import asyncio
 import json
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple, Union
 
 import aiohttp
+import pandas as pd
+import pyarrow as pa
 from loguru import logger
 
-from market_calendar_tool.scraper.models import ScrapeOptions, ScrapeResult
+from market_calendar_tool.scraper.models import (
+    Engine,
+    FailedFetch,
+    ScrapeOptions,
+    ScrapeResult,
+)
 
 from .base_scraper import BaseScraper
+from .columnar import DetailFrameBuilder, order_frame_by_ids, order_table_by_ids
+from .concurrency import THROTTLE_STATUSES, AdaptiveLimiter
 from .data_processor import DataProcessor
+from .incremental import DETAIL_FRAMES, changed_event_ids, splice_frame, splice_table
+from .lazy import LazyFrame
+from .priority import priority_order
+from .rate_limit import TokenBucket, host_bucket
+from .retry import error_status, retry_delay
+from .schemas import apply_arrow_schema, apply_schema, arrow_to_pandas, dateline_seconds
+
+
+class DetailFetchError(Exception):
+    def __init__(self, event_id, attempts: int):
+        super().__init__(
+            f"Failed to fetch details for {event_id} after {attempts} attempt(s)"
+        )
+        self.event_id = event_id
+        self.attempts = attempts
 
 
 class ExtendedScraper:
@@ -19,44 +47,300 @@ class ExtendedScraper:
     def __getattr__(self, name):
         return getattr(self.base_scraper, name)
 
-    def scrape(self) -> ScrapeResult:
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(self._async_scrape())
+    def scrape(
+        self, previous: Optional[Union[ScrapeResult, str]] = None
+    ) -> ScrapeResult:
+        return self._run(self._async_scrape(previous=previous))
+
+    async def async_scrape(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        previous: Optional[Union[ScrapeResult, str]] = None,
+    ) -> ScrapeResult:
+        return await self._async_scrape(session, semaphore, previous)
+
+    def retry_failed(self, result: ScrapeResult) -> ScrapeResult:
+        return self._run(self.async_retry_failed(result))
+
+    async def async_retry_failed(
+        self,
+        result: ScrapeResult,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> ScrapeResult:
+        if not result.missing_ids:
+            logger.info("No missing event details to retry.")
+            return result
+
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.async_retry_failed(result, own_session, semaphore)
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.options.max_parallel_tasks)
+
+        df_base = self._base_view(result, full=False)
+        targets = df_base[df_base["id"].isin(set(result.missing_ids))]
+        logger.info(f"Retrying details for {len(targets)} missing events")
+
+        frames, fetched_ids = await self._fetch_details(
+            result, session, semaphore, targets, self._deadline_at()
+        )
+        all_event_ids = df_base["id"].tolist()
+        for name in DETAIL_FRAMES:
+            setattr(
+                result,
+                name,
+                self._splice(result, name, frames[name], all_event_ids, fetched_ids),
+            )
+
+        logger.info(
+            f"Recovered details for {len(fetched_ids)} of {len(targets)} events"
+        )
+        return result
+
+    async def _async_scrape(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        previous: Optional[Union[ScrapeResult, str]] = None,
+    ) -> ScrapeResult:
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self._async_scrape(own_session, semaphore, previous)
+
+        if isinstance(previous, str):
+            previous = ScrapeResult.load(previous)
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.options.max_parallel_tasks)
+
+        deadline_at = self._deadline_at()
+        async with asyncio.timeout_at(deadline_at):
+            base_result = await self.base_scraper.async_scrape(session, semaphore)
+        df_base = self._base_view(base_result, full=previous is not None)
+        all_event_ids = df_base["id"].tolist()
+
+        if previous is not None:
+            refetch_ids = set(changed_event_ids(previous, df_base))
+            logger.info(
+                f"Incremental scrape: fetching details for {len(refetch_ids)} "
+                f"of {len(all_event_ids)} events"
+            )
+            targets = df_base[df_base["id"].isin(refetch_ids)]
         else:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._run_coroutine, self._async_scrape())
-                return future.result()
+            targets = df_base
+
+        frames, fetched_ids = await self._fetch_details(
+            base_result, session, semaphore, targets, deadline_at
+        )
+
+        for name in DETAIL_FRAMES:
+            frame = frames[name]
+            if previous is not None:
+                frame = self._splice(previous, name, frame, all_event_ids, fetched_ids)
+            setattr(base_result, name, frame)
 
-    async def _async_scrape(self) -> ScrapeResult:
-        base_result = self.base_scraper.scrape()
-        df_base = base_result.base
-        event_ids = df_base["id"].tolist()
-        semaphore = asyncio.Semaphore(self.options.max_parallel_tasks)
-
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._bounded_fetch_event_details(semaphore, session, event_id)
-                for event_id in event_ids
-            ]
-            scrape_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            successful_results = []
-            for event_id, result in zip(event_ids, scrape_results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error fetching event_id {event_id}: {result}")
+        return base_result
+
+    async def _fetch_details(
+        self,
+        result: ScrapeResult,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        targets: pd.DataFrame,
+        deadline_at: Optional[float],
+    ) -> Tuple[Dict[str, pd.DataFrame], List]:
+        event_ids = targets["id"].tolist()
+        prioritized = priority_order(targets)
+        cache = self.options.detail_cache
+        cache_before = None if cache is None else cache.snapshot()
+        datelines = (
+            dateline_seconds(prioritized["dateline"]).tolist()
+            if "dateline" in prioritized.columns
+            else [None] * len(prioritized)
+        )
+
+        limiter = self._create_limiter()
+        streaming = self.options.stream_batch_size is not None
+        builder = DetailFrameBuilder(
+            self.options.stream_batch_size, arrow=self.options.engine == Engine.ARROW
+        )
+        payloads = {}
+        fetched_ids = []
+        failed = []
+        pending = deque(zip(prioritized["id"].tolist(), datelines))
+
+        async def worker():
+            while pending:
+                event_id, dateline = pending.popleft()
+                try:
+                    payload = await self._bounded_fetch_event_details(
+                        semaphore, session, event_id, dateline, limiter
+                    )
+                except Exception as e:
+                    failure = self._failed_fetch(event_id, e)
+                    failed.append(failure)
+                    logger.error(
+                        f"Error fetching event_id {event_id} after "
+                        f"{failure.attempts} attempt(s): {failure.message}"
+                    )
                     continue
+
+                fetched_ids.append(event_id)
+                if streaming:
+                    builder.add(payload)
                 else:
-                    successful_results.append(result)
+                    payloads[event_id] = payload
 
-            processor = DataProcessor(successful_results)
+        worker_count = min(len(pending), self.options.max_parallel_tasks)
+        try:
+            async with asyncio.timeout_at(deadline_at):
+                await asyncio.gather(*(worker() for _ in range(worker_count)))
+        except TimeoutError:
+            logger.warning(
+                f"Deadline of {self.options.deadline}s reached with "
+                f"{len(event_ids) - len(fetched_ids)} event details outstanding"
+            )
+
+        fetched = set(fetched_ids)
+        result.missing_ids = [
+            event_id for event_id in event_ids if event_id not in fetched
+        ]
+        result.failed = failed
+        if result.missing_ids:
+            logger.warning(
+                f"Returning partial result: {len(result.missing_ids)} "
+                f"of {len(event_ids)} event details missing"
+            )
+
+        if limiter is not None:
+            result.concurrency_history.extend(limiter.history)
+            limits = [limit for _, limit in limiter.history]
+            logger.info(
+                f"Adaptive concurrency: final limit {limiter.limit}, "
+                f"range {min(limits)}-{max(limits)} over {len(limits) - 1} adjustments"
+            )
+
+        if cache is not None:
+            await asyncio.to_thread(cache.flush)
+            run_stats = cache.snapshot() - cache_before
+            logger.info(
+                f"Detail cache: {run_stats.hits} hits, {run_stats.misses} misses, "
+                f"{run_stats.evictions} evictions"
+            )
+
+        typed = not self.options.raw_dtypes
+        arrow = self.options.engine == Engine.ARROW
+        if streaming:
+            if arrow:
+                frames = {
+                    name: order_table_by_ids(table, event_ids)
+                    for name, table in builder.tables().items()
+                }
+                if typed:
+                    frames = {
+                        name: apply_arrow_schema(table, name)
+                        for name, table in frames.items()
+                    }
+                return frames, fetched_ids
+
+            frames = {
+                name: order_frame_by_ids(df, event_ids)
+                for name, df in builder.frames().items()
+            }
+            if typed:
+                frames = {name: apply_schema(df, name) for name, df in frames.items()}
+            return frames, fetched_ids
+
+        ordered = [payloads[event_id] for event_id in event_ids if event_id in payloads]
+        if self.options.lazy:
+            frames = LazyFrame.from_payloads(
+                ordered, DETAIL_FRAMES, typed=typed, arrow=arrow
+            )
+            return frames, fetched_ids
+
+        processor = DataProcessor(ordered)
+        if arrow:
+            frames = {
+                "specs": processor.to_specs_table(typed=typed),
+                "history": processor.to_history_table(typed=typed),
+                "news": processor.to_news_table(typed=typed),
+            }
+            return frames, fetched_ids
+
+        frames = {
+            "specs": processor.to_specs_df(typed=typed),
+            "history": processor.to_history_df(typed=typed),
+            "news": processor.to_news_df(typed=typed),
+        }
+        return frames, fetched_ids
 
-            base_result.specs = processor.to_specs_df()
-            base_result.history = processor.to_history_df()
-            base_result.news = processor.to_news_df()
+    @staticmethod
+    def _base_view(result: ScrapeResult, full: bool) -> pd.DataFrame:
+        if result.is_materialized("base"):
+            return result.base
 
-            return base_result
+        table = result.to_arrow(["base"])["base"]
+        if not full:
+            table = table.select(
+                [
+                    column
+                    for column in ("id", "dateline", "impactTitle")
+                    if column in table.column_names
+                ]
+            )
+        return arrow_to_pandas(table)
+
+    @staticmethod
+    def _splice(
+        source: ScrapeResult, name: str, fresh, current_ids: List, fetched_ids: List
+    ):
+        if isinstance(fresh, LazyFrame):
+            fresh = fresh.build()
+        if isinstance(fresh, pa.Table):
+            previous = source.to_arrow([name])[name]
+            return splice_table(previous, fresh, current_ids, fetched_ids)
+        return splice_frame(getattr(source, name), fresh, current_ids, fetched_ids)
+
+    def _deadline_at(self) -> Optional[float]:
+        if self.options.deadline is None:
+            return None
+        return asyncio.get_running_loop().time() + self.options.deadline
+
+    @staticmethod
+    def _failed_fetch(event_id, error: BaseException) -> FailedFetch:
+        attempts = 1
+        if isinstance(error, DetailFetchError):
+            attempts = error.attempts
+            error = error.__cause__ or error
+        status, _ = error_status(error)
+        return FailedFetch(
+            event_id=event_id,
+            error=type(error).__name__,
+            attempts=attempts,
+            last_status=status,
+            message=str(error),
+        )
+
+    def _run(self, coroutine) -> ScrapeResult:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(self._run_coroutine, coroutine)
+                return future.result()
+
+    def _create_limiter(self) -> Optional[AdaptiveLimiter]:
+        if not self.options.adaptive_concurrency:
+            return None
+        return AdaptiveLimiter(
+            min_limit=self.options.min_parallel_tasks,
+            max_limit=self.options.max_parallel_tasks,
+        )
 
     def _run_coroutine(self, coroutine) -> ScrapeResult:
         new_loop = asyncio.new_event_loop()
@@ -72,9 +356,69 @@ class ExtendedScraper:
         semaphore: asyncio.Semaphore,
         session: aiohttp.ClientSession,
         event_id: int,
+        dateline: Optional[float] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ):
+        cache = self.options.detail_cache
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, self.site_number, event_id)
+            if cached is not None:
+                return cached
+
+        bucket = host_bucket(
+            self.base_url,
+            self.options.requests_per_second,
+            self.options.rate_limit_burst,
+        )
+        for attempt in range(self.options.max_retries + 1):
+            try:
+                data = await self._limited_fetch_event_details(
+                    semaphore, session, event_id, limiter, bucket
+                )
+                break
+            except Exception as e:
+                delay = retry_delay(e, attempt, self.options)
+                if delay is None:
+                    raise DetailFetchError(event_id, attempt + 1) from e
+                logger.warning(
+                    f"Retrying event_id {event_id} in {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{self.options.max_retries}) after error: {e}"
+                )
+                await asyncio.sleep(delay)
+
+        if cache is not None:
+            await asyncio.to_thread(
+                cache.set, self.site_number, event_id, data, dateline=dateline
+            )
+        return data
+
+    async def _limited_fetch_event_details(
+        self,
+        semaphore: asyncio.Semaphore,
+        session: aiohttp.ClientSession,
+        event_id: int,
+        limiter: Optional[AdaptiveLimiter],
+        bucket: Optional[TokenBucket],
     ):
-        async with semaphore:
-            return await self._fetch_event_details(session, event_id)
+        async with limiter or nullcontext():
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                started = time.monotonic()
+                try:
+                    async with asyncio.timeout(self.options.request_timeout):
+                        data = await self._fetch_event_details(session, event_id)
+                except aiohttp.ClientResponseError as e:
+                    if limiter is not None and e.status in THROTTLE_STATUSES:
+                        limiter.record_throttle()
+                    raise
+                except asyncio.TimeoutError:
+                    if limiter is not None:
+                        limiter.record_throttle()
+                    raise
+                if limiter is not None:
+                    limiter.record_success(time.monotonic() - started)
+                return data
 
     async def _fetch_event_details(self, session: aiohttp.ClientSession, event_id: int):
         url = f"{self.base_url}/details/{self.site_number}-{event_id}"
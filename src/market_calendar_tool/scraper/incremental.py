@@ -0,0 +1,94 @@
+from typing import Iterable, List
+
+import pandas as pd
+import pyarrow as pa
+
+from .columnar import concat_tables
+from .models import ScrapeResult
+from .schemas import concat_frames
+
+DETAIL_FRAMES = ("specs", "history", "news")
+
+
+def changed_event_ids(previous: ScrapeResult, current_base: pd.DataFrame) -> List:
+    current_ids = current_base["id"].tolist()
+    previous_base = previous.base
+    if previous_base.empty or "id" not in previous_base.columns:
+        return current_ids
+
+    columns = [
+        col
+        for col in current_base.columns
+        if col != "id" and col in previous_base.columns
+    ]
+    previous_rows = _row_hashes(previous_base, columns)
+    current_rows = _row_hashes(current_base, columns)
+
+    common = current_rows.index.intersection(previous_rows.index)
+    differs = (
+        previous_rows.loc[common].to_numpy() != current_rows.loc[common].to_numpy()
+    )
+
+    changed = set(current_rows.index.difference(previous_rows.index))
+    changed.update(common[differs])
+    changed.update(_ids_without_details(previous, current_ids))
+
+    return [event_id for event_id in current_ids if event_id in changed]
+
+
+def splice_frame(
+    previous: pd.DataFrame,
+    fresh: pd.DataFrame,
+    current_ids: Iterable,
+    refetched_ids: Iterable,
+) -> pd.DataFrame:
+    if previous.empty or "id" not in previous.columns:
+        return fresh
+
+    current_ids = set(current_ids)
+    refetched_ids = set(refetched_ids)
+    kept = previous[
+        previous["id"].isin(current_ids) & ~previous["id"].isin(refetched_ids)
+    ]
+
+    frames = [frame for frame in (kept, fresh) if not frame.empty]
+    if not frames:
+        return kept.reset_index(drop=True)
+    return concat_frames(frames, ignore_index=True)
+
+
+def splice_table(
+    previous: pa.Table,
+    fresh: pa.Table,
+    current_ids: Iterable,
+    refetched_ids: Iterable,
+) -> pa.Table:
+    if not previous.num_rows or "id" not in previous.column_names:
+        return fresh
+
+    ids = previous.column("id").to_pandas()
+    keep = ids.isin(set(current_ids)) & ~ids.isin(set(refetched_ids))
+    kept = previous.filter(pa.array(keep.to_numpy()))
+
+    tables = [table for table in (kept, fresh) if table.num_rows]
+    if not tables:
+        return kept
+    return concat_tables(tables)
+
+
+def _row_hashes(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    df = df.drop_duplicates(subset="id", keep="last").set_index("id")
+    if not columns:
+        return pd.Series(0, index=df.index, dtype="uint64")
+    values = df[columns].astype(object)
+    values = values.where(values.notna(), None)
+    return pd.util.hash_pandas_object(values.astype(str), index=False)
+
+
+def _ids_without_details(previous: ScrapeResult, current_ids: List) -> set:
+    with_details = set()
+    for name in DETAIL_FRAMES:
+        frame = getattr(previous, name)
+        if not frame.empty and "id" in frame.columns:
+            with_details.update(frame["id"].tolist())
+    return set(current_ids) - with_details
@@ -0,0 +1,95 @@
+import json
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from .columnar import DetailFrameBuilder
+from .data_processor import DataProcessingError
+from .schemas import apply_arrow_schema, apply_schema
+
+Frame = Union[pd.DataFrame, pa.Table]
+
+
+class LazyPayloads:
+    def __init__(self, payloads: List[bytes], names: Sequence[str]):
+        self.payloads = payloads
+        self.names = tuple(names)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(payload) for payload in self.payloads)
+
+    def take(self, name: str, arrow: bool = False) -> Frame:
+        try:
+            builder = DetailFrameBuilder(arrow=arrow, names=[name])
+            builder.extend(json.loads(payload) for payload in self.payloads)
+            return (builder.tables() if arrow else builder.frames())[name]
+        except Exception as e:
+            raise DataProcessingError(f"Failed to convert lazy payloads: {e}")
+
+
+class LazyFrame:
+    def __init__(
+        self,
+        source: LazyPayloads,
+        name: str,
+        typed: bool = True,
+        arrow: bool = False,
+        transforms: Tuple[Callable[[pd.DataFrame], pd.DataFrame], ...] = (),
+    ):
+        self.source = source
+        self.name = name
+        self.typed = typed
+        self.arrow = arrow
+        self.transforms = transforms
+
+    @classmethod
+    def from_payloads(
+        cls,
+        payloads: Iterable[dict],
+        names: Sequence[str],
+        typed: bool = True,
+        arrow: bool = False,
+    ) -> Dict[str, "LazyFrame"]:
+        encoded = [
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            for payload in payloads
+        ]
+        source = LazyPayloads(encoded, names)
+        return {name: cls(source, name, typed=typed, arrow=arrow) for name in names}
+
+    @property
+    def payloads(self) -> List[bytes]:
+        return self.source.payloads
+
+    @property
+    def nbytes(self) -> int:
+        return self.source.nbytes
+
+    def pipe(self, func: Callable[[pd.DataFrame], pd.DataFrame]) -> "LazyFrame":
+        return LazyFrame(
+            self.source,
+            self.name,
+            typed=self.typed,
+            arrow=self.arrow,
+            transforms=self.transforms + (func,),
+        )
+
+    def build(self) -> Frame:
+        if self.arrow and not self.transforms:
+            table = self.source.take(self.name, arrow=True)
+            return apply_arrow_schema(table, self.name) if self.typed else table
+
+        df = self.source.take(self.name)
+        if self.typed:
+            df = apply_schema(df, self.name)
+        for func in self.transforms:
+            df = func(df)
+        return df
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyFrame(name={self.name!r}, payloads={len(self.payloads)}, "
+            f"nbytes={self.nbytes})"
+        )
@@ -2,15 +2,37 @@ import glob
 import os
 import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import MISSING, asdict, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
 from loguru import logger
 
-from market_calendar_tool.mixins.save_mixin import SaveFormat, SaveMixin
+from market_calendar_tool.mixins.manifest import (
+    MANIFEST_NAME,
+    ManifestEntry,
+    ResultManifest,
+)
+from market_calendar_tool.mixins.save_mixin import (
+    ResultFormat,
+    SaveFormat,
+    SaveMixin,
+    WriteOptions,
+    is_bundle,
+    read_bundle,
+)
+
+from .columnar import frame_to_arrow
+from .detail_cache import DetailCache
+from .lazy import LazyFrame
+from .schemas import arrow_to_pandas
+
+FRAME_NAMES = ("base", "specs", "history", "news")
+
+FINGERPRINT_PREFIX = "fingerprints."
 
 
 class Site(Enum):
@@ -25,6 +47,11 @@ class Site(Enum):
         return re.sub(r"\W+", "_", prefix)
 
 
+class Engine(Enum):
+    PANDAS = "pandas"
+    ARROW = "arrow"
+
+
 site_number_mapping = {
     Site.FOREXFACTORY: 1,
     Site.METALSMINE: 2,
@@ -36,13 +63,59 @@ site_number_mapping = {
 @dataclass(frozen=True)
 class ScrapeOptions:
     max_parallel_tasks: int = 5
+    chunk_days: Optional[int] = None
+    max_retries: Optional[int] = None
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    requests_per_second: Optional[float] = None
+    rate_limit_burst: int = 1
+    detail_cache: Optional[DetailCache] = None
+    adaptive_concurrency: bool = False
+    min_parallel_tasks: int = 1
+    stream_batch_size: Optional[int] = None
+    request_timeout: float = 10.0
+    deadline: Optional[float] = None
+    raw_dtypes: bool = False
+    engine: Engine = Engine.PANDAS
+    lazy: bool = False
 
     def __post_init__(self):
         if self.max_parallel_tasks < 1:
             raise ValueError("max_parallel_tasks must be at least 1")
+        if not 1 <= self.min_parallel_tasks <= self.max_parallel_tasks:
+            raise ValueError(
+                "min_parallel_tasks must be between 1 and max_parallel_tasks"
+            )
+        if self.chunk_days is not None and self.chunk_days < 1:
+            raise ValueError("chunk_days must be at least 1")
+        if self.max_retries is None:
+            object.__setattr__(self, "max_retries", 0 if self.chunk_days is None else 2)
+        if self.max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("backoff_base and backoff_max cannot be negative")
+        if self.stream_batch_size is not None and self.stream_batch_size < 1:
+            raise ValueError("stream_batch_size must be at least 1")
+        if self.requests_per_second is not None and self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if self.rate_limit_burst < 1:
+            raise ValueError("rate_limit_burst must be at least 1")
+        if self.request_timeout <= 0:
+            raise ValueError("request_timeout must be positive")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline must be positive")
+
+
+@dataclass(frozen=True)
+class FailedFetch:
+    event_id: int
+    error: str
+    attempts: int
+    last_status: Optional[int] = None
+    message: str = ""
 
 
-@dataclass
+@dataclass(repr=False)
 class ScrapeResult(SaveMixin):
     site: Site
     date_from: str
@@ -52,54 +125,329 @@ class ScrapeResult(SaveMixin):
     specs: pd.DataFrame = field(default_factory=pd.DataFrame)
     history: pd.DataFrame = field(default_factory=pd.DataFrame)
     news: pd.DataFrame = field(default_factory=pd.DataFrame)
+    concurrency_history: List[Tuple[float, int]] = field(default_factory=list)
+    missing_ids: List = field(default_factory=list)
+    failed: List[FailedFetch] = field(default_factory=list)
+    fingerprints: Dict[str, pd.Series] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.missing_ids
+
+    def __getattribute__(self, name):
+        value = object.__getattribute__(self, name)
+        if name in FRAME_NAMES and not isinstance(value, pd.DataFrame):
+            value = self._resolve(name)
+            if isinstance(value, pa.Table):
+                value = arrow_to_pandas(value)
+                object.__setattr__(self, name, value)
+        return value
+
+    def __setstate__(self, state: dict) -> None:
+        for f in fields(self):
+            if f.name not in state and f.default_factory is not MISSING:
+                state[f.name] = f.default_factory()
+        self.__dict__.update(state)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f.name}={self.__dict__[f.name]!r}" for f in fields(self))
+        return f"{type(self).__name__}({values})"
+
+    def _resolve(self, name: str):
+        value = self.__dict__[name]
+        if isinstance(value, LazyFrame):
+            value = value.build()
+            object.__setattr__(self, name, value)
+        return value
+
+    def _frame_for_save(self, name: str):
+        if name in FRAME_NAMES:
+            value = self._resolve(name)
+            if isinstance(value, pa.Table):
+                return value
+        return super()._frame_for_save(name)
+
+    def is_materialized(self, name: str) -> bool:
+        return isinstance(self.__dict__[name], pd.DataFrame)
+
+    def is_lazy(self, name: str) -> bool:
+        return isinstance(self.__dict__[name], LazyFrame)
+
+    def pipe(self, name: str, func) -> None:
+        value = self.__dict__[name]
+        if isinstance(value, LazyFrame):
+            setattr(self, name, value.pipe(func))
+        else:
+            setattr(self, name, func(getattr(self, name)))
+
+    def to_arrow(self, frames: Optional[Iterable[str]] = None) -> Dict[str, pa.Table]:
+        tables = {}
+        for name in FRAME_NAMES if frames is None else frames:
+            value = self._resolve(name)
+            if not isinstance(value, pa.Table):
+                value = frame_to_arrow(value)
+            tables[name] = value
+        return tables
+
+    @classmethod
+    def from_arrow(
+        cls,
+        tables: Dict[str, pa.Table],
+        site: Site,
+        date_from: str,
+        date_to: str,
+        scraped_at: Optional[float] = None,
+    ) -> "ScrapeResult":
+        frames = {name: tables.get(name, pa.table({})) for name in FRAME_NAMES}
+        if scraped_at is None:
+            return cls(site=site, date_from=date_from, date_to=date_to, **frames)
+        return cls(
+            site=site,
+            date_from=date_from,
+            date_to=date_to,
+            scraped_at=scraped_at,
+            **frames,
+        )
+
+    def memory_report(self, deep: bool = True) -> pd.DataFrame:
+        rows = []
+        for name in FRAME_NAMES:
+            if self.is_lazy(name):
+                rows.append((name, "<payloads>", "bytes", self.__dict__[name].nbytes))
+                continue
+            frame = getattr(self, name)
+            usage = frame.memory_usage(index=False, deep=deep)
+            for column, size in usage.items():
+                rows.append((name, column, str(frame[column].dtype), int(size)))
+        return pd.DataFrame(rows, columns=["frame", "column", "dtype", "bytes"])
+
+    def resume(self, options: Optional[ScrapeOptions] = None) -> "ScrapeResult":
+        from .base_scraper import BaseScraper
+        from .extended_scraper import ExtendedScraper
+
+        options = options or ScrapeOptions()
+        base_scraper = BaseScraper(
+            self.site, self.date_from, self.date_to, options=options
+        )
+        return ExtendedScraper(base_scraper, options=options).retry_failed(self)
 
     def save_to_dataframes(
         self,
         save_format: SaveFormat = SaveFormat.PARQUET,
         output_dir: Optional[str] = None,
-    ):
+        write_options: Optional[WriteOptions] = None,
+    ) -> Dict[str, str]:
         formatted_time = datetime.fromtimestamp(self.scraped_at).strftime(
             "%Y%m%d%H%M%S"
         )
         file_prefix = (
             f"{self.site.prefix}__{self.date_from}_{self.date_to}_{formatted_time}"
         )
-        super().save_to_dataframes(
-            save_format=save_format, output_dir=output_dir, file_prefix=file_prefix
+        saved = super().save_to_dataframes(
+            save_format=save_format,
+            output_dir=output_dir,
+            file_prefix=file_prefix,
+            write_options=write_options,
         )
+        directory = os.getcwd() if output_dir is None else output_dir
+        self._record(os.path.join(directory, file_prefix), save_format.value, saved)
+        return saved
 
     def save(
         self,
         output_dir: Optional[str] = None,
-    ):
+        result_format: ResultFormat = ResultFormat.BUNDLE,
+    ) -> str:
         formatted_time = datetime.fromtimestamp(self.scraped_at).strftime(
             "%Y%m%d%H%M%S"
         )
-        file_name = f"scrape_result_{formatted_time}.pickle"
-        super().save(output_dir=output_dir, file_name=file_name)
+        file_name = f"scrape_result_{formatted_time}.{result_format.value}"
+        file_path = super().save(
+            output_dir=output_dir, file_name=file_name, result_format=result_format
+        )
+        self._record(file_path, result_format.value)
+        return file_path
+
+    def row_counts(self) -> Dict[str, Optional[int]]:
+        counts = {}
+        for name in FRAME_NAMES:
+            value = self.__dict__[name]
+            if isinstance(value, LazyFrame):
+                counts[name] = None
+            elif isinstance(value, pa.Table):
+                counts[name] = value.num_rows
+            else:
+                counts[name] = len(value)
+        return counts
+
+    def _record(
+        self, path: str, format: str, files: Optional[Dict[str, str]] = None
+    ) -> None:
+        manifest = ResultManifest(os.path.dirname(os.path.abspath(path)))
+        try:
+            manifest.record(
+                ManifestEntry(
+                    site=self.site.prefix,
+                    date_from=self.date_from,
+                    date_to=self.date_to,
+                    scraped_at=self.scraped_at,
+                    format=format,
+                    path=path,
+                    files=files or {},
+                    row_counts=self.row_counts(),
+                )
+            )
+        finally:
+            manifest.close()
+
+    def _bundle_contents(self) -> Tuple[Dict[str, pa.Table], dict]:
+        tables, meta = super()._bundle_contents()
+        for name, fingerprints in self.fingerprints.items():
+            if fingerprints.empty:
+                continue
+            tables[f"{FINGERPRINT_PREFIX}{name}"] = pa.Table.from_pandas(
+                fingerprints.rename("fingerprint").reset_index(), preserve_index=False
+            )
+        meta.update(
+            site=self.site.name,
+            date_from=self.date_from,
+            date_to=self.date_to,
+            scraped_at=self.scraped_at,
+            concurrency_history=self.concurrency_history,
+            missing_ids=self.missing_ids,
+            failed=[asdict(failure) for failure in self.failed],
+        )
+        return tables, meta
 
     @classmethod
-    def load(cls, file_path: Optional[str] = None) -> "ScrapeResult":
-        if file_path is None:
-            pattern = os.path.join(os.getcwd(), "scrape_result_*.pickle")
-            files = glob.glob(pattern)
+    def load_bundle(cls, file_path: str) -> "ScrapeResult":
+        try:
+            meta, tables = read_bundle(file_path)
+        except Exception as e:
+            logger.error(f"Failed to read bundle from '{file_path}': {e}")
+            raise e
+
+        fingerprints = {}
+        for name in list(tables):
+            if name.startswith(FINGERPRINT_PREFIX):
+                frame = tables.pop(name).to_pandas()
+                keys = [column for column in frame.columns if column != "fingerprint"]
+                series = frame.set_index(keys)["fingerprint"].rename(None)
+                fingerprints[name[len(FINGERPRINT_PREFIX) :]] = series
+
+        result = cls.from_arrow(
+            tables,
+            Site[meta["site"]],
+            meta["date_from"],
+            meta["date_to"],
+            scraped_at=meta["scraped_at"],
+        )
+        result.concurrency_history = [
+            tuple(entry) for entry in meta["concurrency_history"]
+        ]
+        result.missing_ids = meta["missing_ids"]
+        result.failed = [FailedFetch(**failure) for failure in meta["failed"]]
+        result.fingerprints = fingerprints
+        logger.info(f"Mapped ScrapeResult bundle from '{file_path}'.")
+        return result
 
-            if not files:
+    @classmethod
+    def find(
+        cls,
+        site: Optional[Site] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        directory: Optional[str] = None,
+    ) -> List[ManifestEntry]:
+        directory = os.getcwd() if directory is None else directory
+        if not ResultManifest.exists(directory):
+            return []
+        manifest = ResultManifest(directory)
+        try:
+            return manifest.find(
+                site=None if site is None else site.prefix,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        finally:
+            manifest.close()
+
+    @classmethod
+    def load(
+        cls,
+        file_path: Optional[str] = None,
+        site: Optional[Site] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        directory: Optional[str] = None,
+    ) -> "ScrapeResult":
+        if file_path is None:
+            directory = os.getcwd() if directory is None else directory
+            if ResultManifest.exists(directory):
+                file_path = cls._latest_from_manifest(
+                    directory, site, date_from, date_to
+                )
+            elif site is not None or date_from is not None or date_to is not None:
                 raise FileNotFoundError(
-                    "No 'scrape_result_*.pickle' files found in the current directory."
+                    f"No '{MANIFEST_NAME}' found in '{directory}' to look up "
+                    f"results by site or range."
                 )
+            else:
+                file_path = cls._latest_from_listing(directory)
 
-            def extract_timestamp(f):
-                try:
-                    timestamp_str = (
-                        os.path.basename(f).split("_")[2].split(".pickle")[0]
-                    )
-                    return datetime.strptime(timestamp_str, "%Y%m%d%H%M%S")
-                except (IndexError, ValueError):
-                    return datetime.min
+        if is_bundle(file_path):
+            return cls.load_bundle(file_path)
+        return cls.load_object(file_path)
 
-            latest_file = max(files, key=extract_timestamp)
-            logger.info(f"No file_path provided. Using the latest file: {latest_file}")
-            file_path = latest_file
+    @staticmethod
+    def _latest_from_manifest(
+        directory: str,
+        site: Optional[Site],
+        date_from: Optional[str],
+        date_to: Optional[str],
+    ) -> str:
+        manifest = ResultManifest(directory)
+        try:
+            entry = manifest.latest(
+                site=None if site is None else site.prefix,
+                date_from=date_from,
+                date_to=date_to,
+                formats=[result_format.value for result_format in ResultFormat],
+            )
+        finally:
+            manifest.close()
 
-        return cls.load_object(file_path)
+        if entry is None:
+            raise FileNotFoundError(
+                f"No saved result in '{directory}' matches site={site}, "
+                f"date_from={date_from}, date_to={date_to}."
+            )
+        logger.info(f"No file_path provided. Using the latest result: {entry.path}")
+        return entry.path
+
+    @staticmethod
+    def _latest_from_listing(directory: str) -> str:
+        files = [
+            path
+            for result_format in ResultFormat
+            for path in glob.glob(
+                os.path.join(directory, f"scrape_result_*.{result_format.value}")
+            )
+        ]
+
+        if not files:
+            raise FileNotFoundError(
+                "No 'scrape_result_*' bundles or pickle files found in the "
+                "current directory."
+            )
+
+        def extract_timestamp(f):
+            try:
+                timestamp_str = os.path.basename(f).split("_")[2].split(".")[0]
+                return datetime.strptime(timestamp_str, "%Y%m%d%H%M%S")
+            except (IndexError, ValueError):
+                return datetime.min
+
+        latest_file = max(files, key=extract_timestamp)
+        logger.info(f"No file_path provided. Using the latest file: {latest_file}")
+        return latest_file
@@ -0,0 +1,37 @@
+import time
+from typing import Optional
+
+import pandas as pd
+
+from .schemas import dateline_seconds
+
+IMPACT_PRIORITY = {
+    "High Impact Expected": 0,
+    "Medium Impact Expected": 1,
+    "Low Impact Expected": 2,
+    "Non-Economic": 3,
+}
+
+
+def priority_order(df: pd.DataFrame, now: Optional[float] = None) -> pd.DataFrame:
+    lowest = len(IMPACT_PRIORITY)
+    if "impactTitle" in df.columns:
+        impact = df["impactTitle"].map(IMPACT_PRIORITY).astype(float).fillna(lowest)
+    else:
+        impact = pd.Series(lowest, index=df.index)
+
+    if "dateline" in df.columns:
+        dateline = dateline_seconds(df["dateline"])
+    else:
+        dateline = pd.Series(float("nan"), index=df.index)
+
+    now = time.time() if now is None else now
+    past = (dateline < now).astype(float).where(dateline.notna())
+    keys = pd.DataFrame(
+        {"impact": impact, "past": past, "distance": (dateline - now).abs()},
+        index=df.index,
+    )
+    order = keys.sort_values(
+        ["impact", "past", "distance"], kind="stable", na_position="last"
+    ).index
+    return df.loc[order]
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def configure(self, rate: float, capacity: float) -> None:
+        with self._lock:
+            self.rate = rate
+            self.capacity = capacity
+            self._tokens = min(self._tokens, capacity)
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+_host_buckets: Dict[str, TokenBucket] = {}
+_host_buckets_lock = threading.Lock()
+
+
+def host_bucket(
+    url: str, rate: Optional[float], capacity: float = 1
+) -> Optional[TokenBucket]:
+    if rate is None:
+        return None
+
+    host = urlparse(url).netloc or url
+    with _host_buckets_lock:
+        bucket = _host_buckets.get(host)
+        if bucket is None:
+            bucket = _host_buckets[host] = TokenBucket(rate, capacity)
+        elif bucket.rate != rate or bucket.capacity != capacity:
+            bucket.configure(rate, capacity)
+        return bucket
@@ -0,0 +1,66 @@
+import asyncio
+import json
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+import aiohttp
+import requests
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    json.JSONDecodeError,
+)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def error_status(error: BaseException) -> Tuple[Optional[int], Optional[dict]]:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status, error.headers
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code, error.response.headers
+    return None, None
+
+
+def retry_delay(error: BaseException, attempt: int, options) -> Optional[float]:
+    if attempt >= options.max_retries:
+        return None
+
+    status, headers = error_status(error)
+    if status is not None:
+        if status not in RETRY_STATUSES:
+            return None
+    elif not isinstance(error, RETRYABLE_ERRORS):
+        return None
+
+    delay = backoff_delay(attempt, options.backoff_base, options.backoff_max)
+    retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, options.backoff_max))
+    return delay
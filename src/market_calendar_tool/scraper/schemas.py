@@ -0,0 +1,208 @@
+from typing import Callable, Dict, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from loguru import logger
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_object_dtype
+
+EPOCH = pd.Timestamp(0, tz="UTC")
+
+BASE_SCHEMA: Dict[str, str] = {
+    "id": "Int64",
+    "ebaseId": "Int64",
+    "dateline": "epoch",
+    "country": "category",
+    "currency": "category",
+    "impactClass": "category",
+    "impactTitle": "category",
+    "impactName": "category",
+    "timeLabel": "category",
+    "actualBetterWorse": "Int8",
+    "revisionBetterWorse": "Int8",
+    "siteId": "category",
+}
+
+SPECS_SCHEMA: Dict[str, str] = {
+    "order": "Int32",
+    "title": "category",
+    "is_notice": "category",
+    "id": "Int64",
+}
+
+HISTORY_SCHEMA: Dict[str, str] = {
+    "event_id": "Int64",
+    "impact": "category",
+    "impact_class": "category",
+    "date": "date",
+    "actualBetterWorse": "Int8",
+    "revisionBetterWorse": "Int8",
+    "id": "Int64",
+}
+
+NEWS_SCHEMA: Dict[str, str] = {
+    "news_id": "Int64",
+    "id": "Int64",
+}
+
+SCHEMAS = {
+    "base": BASE_SCHEMA,
+    "specs": SPECS_SCHEMA,
+    "history": HISTORY_SCHEMA,
+    "news": NEWS_SCHEMA,
+}
+
+ARROW_INTEGERS = {
+    "Int8": pa.int8(),
+    "Int16": pa.int16(),
+    "Int32": pa.int32(),
+    "Int64": pa.int64(),
+}
+
+PANDAS_INTEGERS = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+}
+
+
+def to_category(series: pd.Series) -> pd.Series:
+    return series.astype("category")
+
+
+def to_integer(dtype: str) -> Callable[[pd.Series], pd.Series]:
+    def convert(series: pd.Series) -> pd.Series:
+        if not is_numeric_dtype(series):
+            series = pd.to_numeric(series, errors="coerce")
+        return series.astype(dtype)
+
+    return convert
+
+
+def to_datetime_from_epoch(series: pd.Series) -> pd.Series:
+    if is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(
+        pd.to_numeric(series, errors="coerce"), unit="s", utc=True, errors="coerce"
+    )
+
+
+def to_datetime_from_date(series: pd.Series) -> pd.Series:
+    if is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, format="%b %d, %Y", errors="coerce").dt.tz_localize(
+        "UTC"
+    )
+
+
+def arrow_category(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    if pa.types.is_null(column.type) or pa.types.is_dictionary(column.type):
+        return column
+    return column.dictionary_encode()
+
+
+def arrow_integer(dtype: str) -> Callable[[pa.ChunkedArray], pa.ChunkedArray]:
+    def convert(column: pa.ChunkedArray) -> pa.ChunkedArray:
+        return column.cast(ARROW_INTEGERS[dtype])
+
+    return convert
+
+
+def arrow_datetime_from_epoch(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    if pa.types.is_timestamp(column.type):
+        return column
+    seconds = column.cast(pa.int64()).cast(pa.timestamp("s", tz="UTC"))
+    return seconds.cast(pa.timestamp("ns", tz="UTC"))
+
+
+def arrow_datetime_from_date(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    if pa.types.is_timestamp(column.type):
+        return column
+    parsed = pc.strptime(column, format="%b %d, %Y", unit="ns", error_is_null=True)
+    return parsed.cast(pa.timestamp("ns", tz="UTC"))
+
+
+PANDAS_CONVERTERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    "category": to_category,
+    "epoch": to_datetime_from_epoch,
+    "date": to_datetime_from_date,
+    **{dtype: to_integer(dtype) for dtype in ARROW_INTEGERS},
+}
+
+ARROW_CONVERTERS: Dict[str, Callable[[pa.ChunkedArray], pa.ChunkedArray]] = {
+    "category": arrow_category,
+    "epoch": arrow_datetime_from_epoch,
+    "date": arrow_datetime_from_date,
+    **{dtype: arrow_integer(dtype) for dtype in ARROW_INTEGERS},
+}
+
+
+def apply_schema(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    schema = SCHEMAS[name]
+    converted = {}
+    for column in df.columns:
+        kind = schema.get(column)
+        if kind is None:
+            continue
+        try:
+            converted[column] = PANDAS_CONVERTERS[kind](df[column])
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Keeping raw dtype for {name}.{column}: {e}")
+
+    if not converted:
+        return df
+    return df.assign(**converted)
+
+
+def apply_arrow_schema(table: pa.Table, name: str) -> pa.Table:
+    schema = SCHEMAS[name]
+    for index, column_name in enumerate(table.column_names):
+        kind = schema.get(column_name)
+        if kind is None:
+            continue
+        column = table.column(index)
+        try:
+            converted = ARROW_CONVERTERS[kind](column)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            try:
+                series = PANDAS_CONVERTERS[kind](column.to_pandas())
+                converted = pa.chunked_array([pa.Array.from_pandas(series)])
+            except (TypeError, ValueError, pa.ArrowException) as e:
+                logger.debug(f"Keeping raw type for {name}.{column_name}: {e}")
+                continue
+        table = table.set_column(index, column_name, converted)
+    return table
+
+
+def arrow_to_pandas(table: pa.Table) -> pd.DataFrame:
+    if not table.num_columns:
+        return pd.DataFrame()
+    if table.schema.pandas_metadata is not None:
+        return table.to_pandas()
+    return table.to_pandas(types_mapper=PANDAS_INTEGERS.get)
+
+
+def concat_frames(frames: List[pd.DataFrame], **kwargs) -> pd.DataFrame:
+    df = pd.concat(frames, **kwargs)
+    categorical = [
+        column
+        for column in df.columns
+        if is_object_dtype(df[column])
+        and all(
+            isinstance(frame[column].dtype, pd.CategoricalDtype)
+            for frame in frames
+            if column in frame.columns
+        )
+    ]
+    for column in categorical:
+        df[column] = df[column].astype("category")
+    return df
+
+
+def dateline_seconds(series: pd.Series) -> pd.Series:
+    if is_datetime64_any_dtype(series):
+        if series.dt.tz is None:
+            series = series.dt.tz_localize("UTC")
+        return (series - EPOCH).dt.total_seconds()
+    return pd.to_numeric(series, errors="coerce")
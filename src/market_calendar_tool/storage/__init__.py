@@ -0,0 +1,3 @@
+from .calendar_store import CalendarStore
+
+__all__ = ["CalendarStore"]
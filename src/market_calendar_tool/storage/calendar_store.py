@@ -0,0 +1,491 @@
+import glob
+import operator
+import os
+import time
+import uuid
+from datetime import date, datetime
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from market_calendar_tool.cleaning.cleaner import ImpactLevel, impact_mapping
+from market_calendar_tool.cleaning.fingerprints import FRAME_KEYS
+from market_calendar_tool.scraper.columnar import frame_to_arrow
+from market_calendar_tool.scraper.incremental import DETAIL_FRAMES
+from market_calendar_tool.scraper.models import FRAME_NAMES, ScrapeResult, Site
+from market_calendar_tool.scraper.schemas import dateline_seconds
+
+SEQUENCE_COLUMN = "_seq"
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+PARTITION_SCHEMA = pa.schema(
+    [
+        ("site", pa.string()),
+        ("year", pa.int32()),
+        ("month", pa.int32()),
+        ("frame", pa.string()),
+    ]
+)
+
+
+def frame_to_table(df: pd.DataFrame) -> pa.Table:
+    table = frame_to_arrow(df)
+    return _decode_dictionaries(table).replace_schema_metadata(None)
+
+
+def _decode_dictionaries(table: pa.Table) -> pa.Table:
+    for index, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            column = table.column(index).cast(field.type.value_type)
+            table = table.set_column(index, field.name, column)
+    return table
+
+
+def merge_schemas(existing: pa.Schema, incoming: pa.Schema) -> pa.Schema:
+    try:
+        return pa.unify_schemas([existing, incoming], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+
+    fields = {field.name: field for field in existing}
+    for field in incoming:
+        current = fields.get(field.name)
+        if current is None or current.type == field.type:
+            fields.setdefault(field.name, field)
+            continue
+        try:
+            fields[field.name] = pa.unify_schemas(
+                [pa.schema([current]), pa.schema([field])],
+                promote_options="permissive",
+            ).field(0)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            fields[field.name] = pa.field(field.name, pa.string())
+    return pa.schema(list(fields.values()))
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(table.column(field.name).cast(field.type))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def month_bounds(start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]):
+    expression = None
+    year, month = ds.field("year"), ds.field("month")
+    if start is not None:
+        expression = (year > start.year) | (
+            (year == start.year) & (month >= start.month)
+        )
+    if end is not None:
+        upper = (year < end.year) | ((year == end.year) & (month <= end.month))
+        expression = upper if expression is None else expression & upper
+    return expression
+
+
+def time_bound(field: pa.Field, moment: pd.Timestamp) -> pa.Scalar:
+    if pa.types.is_timestamp(field.type):
+        if field.type.tz is None:
+            moment = moment.tz_convert(None)
+        return pa.scalar(moment.to_pydatetime(), type=field.type)
+    if pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+        return pa.scalar(moment.value // 10**9, type=field.type)
+    raise ValueError(f"Cannot filter '{field.name}' of type {field.type} by time")
+
+
+def to_utc(value: DateLike) -> pd.Timestamp:
+    moment = pd.Timestamp(value)
+    return moment.tz_localize("UTC") if moment.tz is None else moment.tz_convert("UTC")
+
+
+def base_filter(
+    schema: pa.Schema,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    currency: Optional[Iterable[str]] = None,
+    impact: Optional[Iterable[Union[str, ImpactLevel]]] = None,
+) -> Optional[ds.Expression]:
+    start = None if start is None else to_utc(start)
+    last = None if end is None else to_utc(end)
+    upper = operator.le
+    if last is not None and last == last.normalize():
+        end, upper = last + pd.Timedelta(days=1), operator.lt
+    else:
+        end = last
+
+    expressions = []
+    partitions = month_bounds(start, last)
+    if partitions is not None:
+        expressions.append(partitions)
+
+    time_field = schema.field("datetime" if "datetime" in schema.names else "dateline")
+    if start is not None:
+        expressions.append(ds.field(time_field.name) >= time_bound(time_field, start))
+    if end is not None:
+        expressions.append(
+            upper(ds.field(time_field.name), time_bound(time_field, end))
+        )
+
+    if currency is not None:
+        codes = [code.upper() for code in currency]
+        expressions.append(ds.field("currency").isin(codes))
+
+    if impact is not None:
+        levels = [ImpactLevel(level).value for level in impact]
+        if "impact" in schema.names:
+            expressions.append(ds.field("impact").isin(levels))
+        else:
+            titles = [
+                title for title, level in impact_mapping.items() if level in levels
+            ]
+            expressions.append(ds.field("impactTitle").isin(titles))
+
+    if not expressions:
+        return None
+    return reduce(operator.and_, expressions)
+
+
+def id_filter(ids: pa.ChunkedArray) -> ds.Expression:
+    bounds = pc.min_max(ids)
+    return (
+        (ds.field("id") >= bounds["min"])
+        & (ds.field("id") <= bounds["max"])
+        & ds.field("id").isin(pc.unique(ids))
+    )
+
+
+def event_months(base: pd.DataFrame) -> pd.DataFrame:
+    column = "datetime" if "datetime" in base.columns else "dateline"
+    seconds = dateline_seconds(base[column])
+    moments = pd.to_datetime(seconds, unit="s", utc=True, errors="coerce")
+    return pd.DataFrame(
+        {
+            "id": base["id"].to_numpy(),
+            "year": moments.dt.year.to_numpy(),
+            "month": moments.dt.month.to_numpy(),
+        }
+    )
+
+
+class CalendarStore:
+    def __init__(self, root: str, compact_threshold: int = 16):
+        if compact_threshold < 2:
+            raise ValueError("compact_threshold must be at least 2")
+        self.root = root
+        self.compact_threshold = compact_threshold
+        self._last_sequence = 0
+        os.makedirs(os.path.join(root, "_schemas"), exist_ok=True)
+
+    def upsert(self, result: ScrapeResult) -> Dict[str, int]:
+        base = result.base
+        if base.empty or "id" not in base.columns:
+            logger.info("Nothing to store: base frame is empty.")
+            return {}
+
+        months = event_months(base).dropna(subset=["year", "month"])
+        months = months.drop_duplicates(subset="id", keep="last")
+        sequence = self._next_sequence()
+        site = result.site.prefix
+
+        written = {}
+        touched = []
+        for name in FRAME_NAMES:
+            df = getattr(result, name)
+            if df.empty or "id" not in df.columns:
+                continue
+
+            located = df.merge(months, on="id", how="inner")
+            if len(located) < len(df):
+                logger.warning(
+                    f"Skipping {len(df) - len(located)} '{name}' rows without "
+                    f"a dated base event."
+                )
+            if located.empty:
+                continue
+
+            for (year, month), rows in located.groupby(["year", "month"], sort=True):
+                table = frame_to_table(
+                    rows.drop(columns=["year", "month"]).reset_index(drop=True)
+                )
+                table = table.append_column(
+                    SEQUENCE_COLUMN, pa.array(np.full(len(rows), sequence))
+                )
+                directory = self._partition_dir(site, int(year), int(month), name)
+                self._write_part(name, directory, table, sequence)
+                touched.append((name, directory))
+            written[name] = len(located)
+
+        logger.info(
+            f"Upserted {sum(written.values())} rows for {site} into '{self.root}'."
+        )
+        busy: Dict[str, List[str]] = {}
+        for name, directory in touched:
+            if len(self._part_files(directory)) >= self.compact_threshold:
+                busy.setdefault(name, []).append(directory)
+        for name, directories in busy.items():
+            self._compact_site(name, site, directories)
+        return written
+
+    def read(
+        self,
+        frame: str,
+        site: Optional[Site] = None,
+        columns: Optional[List[str]] = None,
+        filter: Optional[ds.Expression] = None,
+    ) -> pa.Table:
+        dataset = self.dataset(frame, site)
+        if dataset is None:
+            return pa.table({})
+
+        keys = FRAME_KEYS[frame]
+        projection = None
+        if columns is not None:
+            projection = list(dict.fromkeys(keys + columns + [SEQUENCE_COLUMN]))
+        table = dataset.to_table(columns=projection, filter=filter)
+        if filter is None:
+            table = latest_rows(table, keys)
+        else:
+            table = self._drop_superseded(table, keys, dataset)
+
+        if columns is None:
+            columns = [
+                name
+                for name in table.column_names
+                if name != SEQUENCE_COLUMN and name not in PARTITION_SCHEMA.names
+            ]
+        return table.select(columns)
+
+    def query(
+        self,
+        site: Site,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        currency: Optional[Iterable[str]] = None,
+        impact: Optional[Iterable[Union[str, ImpactLevel]]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> ScrapeResult:
+        date_from = "" if start is None else str(pd.Timestamp(start).date())
+        date_to = "" if end is None else str(pd.Timestamp(end).date())
+        schema = self._load_schema("base")
+        if schema is None:
+            return ScrapeResult.from_arrow({}, site, date_from, date_to)
+
+        if columns is not None and "id" not in columns:
+            columns = ["id"] + columns
+        filter = base_filter(schema, start, end, currency, impact)
+        base = self.read("base", site, columns=columns, filter=filter)
+
+        tables = {"base": base}
+        if base.num_rows:
+            ids = base.column("id")
+            for name in DETAIL_FRAMES:
+                tables[name] = self.read(name, site, filter=id_filter(ids))
+        logger.info(
+            f"Query matched {base.num_rows} {site.prefix} events in '{self.root}'."
+        )
+        return ScrapeResult.from_arrow(tables, site, date_from, date_to)
+
+    def dataset(self, frame: str, site: Optional[Site] = None) -> Optional[ds.Dataset]:
+        files = self.files(frame, site)
+        schema = self._load_schema(frame)
+        if not files or schema is None:
+            return None
+
+        for field in PARTITION_SCHEMA:
+            if field.name != "frame":
+                schema = schema.append(field)
+        return ds.dataset(
+            files,
+            schema=schema,
+            format="parquet",
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            partition_base_dir=self.root,
+        )
+
+    def files(self, frame: str, site: Optional[Site] = None) -> List[str]:
+        site_pattern = "*" if site is None else site.prefix
+        pattern = os.path.join(
+            self.root,
+            f"site={site_pattern}",
+            "year=*",
+            "month=*",
+            f"frame={frame}",
+            "*.parquet",
+        )
+        return sorted(glob.glob(pattern))
+
+    def compact(self, site: Optional[Site] = None) -> int:
+        removed = 0
+        for name in FRAME_NAMES:
+            sites = {self._site_of(path) for path in self._partitions(name, site)}
+            for site_prefix in sorted(sites):
+                removed += self._compact_site(name, site_prefix)
+        return removed
+
+    def _compact_site(
+        self, name: str, site: str, directories: Optional[List[str]] = None
+    ) -> int:
+        dataset = self.dataset(name, Site[site.upper()])
+        if dataset is None:
+            return 0
+
+        keys = FRAME_KEYS[name]
+        versions = dataset.to_table(
+            columns=keys + [SEQUENCE_COLUMN, "year", "month"]
+        ).to_pandas()
+        groups = versions.groupby(keys, dropna=False)[SEQUENCE_COLUMN]
+        winners = groups.max()
+
+        if directories is None:
+            stale = versions[versions[SEQUENCE_COLUMN] != groups.transform("max")]
+            stale_dirs = {
+                self._partition_dir(site, int(year), int(month), name)
+                for year, month in stale[["year", "month"]]
+                .drop_duplicates()
+                .itertuples(index=False)
+            }
+            directories = [
+                directory
+                for directory in self._partitions(name, Site[site.upper()])
+                if directory in stale_dirs or len(self._part_files(directory)) > 1
+            ]
+
+        return sum(
+            self._compact_partition(name, directory, winners)
+            for directory in directories
+        )
+
+    def _compact_partition(self, name: str, directory: str, winners: pd.Series) -> int:
+        files = self._part_files(directory)
+        if not files:
+            return 0
+
+        table = pa.concat_tables(
+            [
+                conform_table(pq.read_table(path), self._load_schema(name))
+                for path in files
+            ]
+        )
+        table = filter_winners(table, FRAME_KEYS[name], winners)
+        if table.num_rows:
+            sequence = pc.max(table.column(SEQUENCE_COLUMN)).as_py() or 0
+            self._write_part(name, directory, table, sequence, check_schema=False)
+        for path in files:
+            os.remove(path)
+
+        kept = 1 if table.num_rows else 0
+        logger.info(
+            f"Compacted {len(files)} files in '{directory}' into {kept} with "
+            f"{table.num_rows} rows."
+        )
+        return len(files) - kept
+
+    @staticmethod
+    def _drop_superseded(
+        table: pa.Table, keys: List[str], dataset: ds.Dataset
+    ) -> pa.Table:
+        if not table.num_rows:
+            return table
+        versions = dataset.to_table(
+            columns=keys + [SEQUENCE_COLUMN],
+            filter=id_filter(table.column("id")),
+        ).to_pandas()
+        winners = versions.groupby(keys, dropna=False)[SEQUENCE_COLUMN].max()
+        return filter_winners(table, keys, winners)
+
+    def _write_part(
+        self,
+        name: str,
+        directory: str,
+        table: pa.Table,
+        sequence: int,
+        check_schema: bool = True,
+    ) -> str:
+        if check_schema:
+            schema = self._load_schema(name)
+            schema = (
+                table.schema if schema is None else merge_schemas(schema, table.schema)
+            )
+            self._save_schema(name, schema)
+            table = conform_table(table, schema)
+
+        table = table.sort_by([(key, "ascending") for key in FRAME_KEYS[name]])
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(
+            directory, f"part-{sequence:020d}-{uuid.uuid4().hex[:8]}.parquet"
+        )
+        pq.write_table(table, path)
+        return path
+
+    def _next_sequence(self) -> int:
+        self._last_sequence = max(time.time_ns(), self._last_sequence + 1)
+        return self._last_sequence
+
+    def _partition_dir(self, site: str, year: int, month: int, frame: str) -> str:
+        return os.path.join(
+            self.root,
+            f"site={site}",
+            f"year={year}",
+            f"month={month:02d}",
+            f"frame={frame}",
+        )
+
+    def _partitions(self, frame: str, site: Optional[Site]) -> List[str]:
+        return sorted({os.path.dirname(path) for path in self.files(frame, site)})
+
+    @staticmethod
+    def _part_files(directory: str) -> List[str]:
+        return sorted(glob.glob(os.path.join(directory, "*.parquet")))
+
+    def _site_of(self, directory: str) -> str:
+        relative = os.path.relpath(directory, self.root)
+        return relative.split(os.sep)[0].split("=", 1)[1]
+
+    def _schema_path(self, frame: str) -> str:
+        return os.path.join(self.root, "_schemas", f"{frame}.arrow")
+
+    def _load_schema(self, frame: str) -> Optional[pa.Schema]:
+        path = self._schema_path(frame)
+        if not os.path.exists(path):
+            return None
+        with pa.memory_map(path) as source:
+            return pa.ipc.read_schema(source)
+
+    def _save_schema(self, frame: str, schema: pa.Schema) -> None:
+        path = self._schema_path(frame)
+        with open(f"{path}.tmp", "wb") as sink:
+            sink.write(schema.serialize())
+        os.replace(f"{path}.tmp", path)
+
+
+def latest_rows(table: pa.Table, keys: Iterable[str]) -> pa.Table:
+    keys = list(keys)
+    if not table.num_rows:
+        return table
+    frame = table.select(keys + [SEQUENCE_COLUMN]).to_pandas()
+    latest = frame.groupby(keys, dropna=False)[SEQUENCE_COLUMN].transform("max")
+    return table.filter(pa.array((frame[SEQUENCE_COLUMN] == latest).to_numpy()))
+
+
+def filter_winners(table: pa.Table, keys: List[str], winners: pd.Series) -> pa.Table:
+    if not table.num_rows:
+        return table
+    frame = table.select(keys + [SEQUENCE_COLUMN]).to_pandas()
+    index = (
+        pd.Index(frame[keys[0]])
+        if len(keys) == 1
+        else pd.MultiIndex.from_frame(frame[keys])
+    )
+    best = winners.reindex(index).to_numpy()
+    return table.filter(pa.array(frame[SEQUENCE_COLUMN].to_numpy() == best))
@@ -0,0 +1,79 @@
+from market_calendar_tool.scraper.data_processor import DataProcessor
+from market_calendar_tool.scraper.models import ScrapeResult, Site
+
+
+def detail_payload(event_id, specs=(), history=(), news=()):
+    return {
+        "data": {
+            "event_id": event_id,
+            "specs": list(specs),
+            "history": {"events": list(history)},
+            "linked_threads": {"news": list(news)},
+        }
+    }
+
+
+def event_payload(event_id, source="Statistics Bureau"):
+    return detail_payload(
+        event_id,
+        specs=[
+            {
+                "order": 10,
+                "title": "Source",
+                "html": f"<b>{source}</b>",
+                "is_notice": "",
+            },
+            {
+                "order": 20,
+                "title": "Measures",
+                "html": f"<p>Event {event_id}</p>",
+                "is_notice": "",
+            },
+        ],
+        history=[
+            {
+                "event_id": event_id * 10,
+                "impact": "high",
+                "impact_class": "icon--ff-impact-red",
+                "date": "Sep 16, 2024",
+                "actualBetterWorse": 0,
+            }
+        ],
+        news=[{"id": event_id * 100, "html": f"<p>News {event_id}</p>"}],
+    )
+
+
+def base_event(
+    event_id,
+    dateline=None,
+    actual="0.2%",
+    currency="USD",
+    impact="High Impact Expected",
+):
+    return {
+        "id": event_id,
+        "name": f"Event {event_id}",
+        "currency": currency,
+        "dateline": 1729515300 + event_id if dateline is None else dateline,
+        "impactTitle": impact,
+        "actual": actual,
+        "previous": "0.1%",
+        "revision": "",
+        "forecast": "0.2%",
+        "actualBetterWorse": 0,
+        "revisionBetterWorse": 0,
+        "siteId": 1,
+    }
+
+
+def raw_result(events, payloads=(), date_from="2024-10-21", date_to="2024-11-05"):
+    processor = DataProcessor(list(payloads))
+    return ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from=date_from,
+        date_to=date_to,
+        base=DataProcessor({"days": [{"events": events}]}).to_base_df(),
+        specs=processor.to_specs_df(),
+        history=processor.to_history_df(),
+        news=processor.to_news_df(),
+    )
@@ -0,0 +1,236 @@
+import glob
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from loguru import logger
+
+from market_calendar_tool.mixins.save_mixin import SaveFormat
+from market_calendar_tool.scraper.base_scraper import BaseScraper
+from market_calendar_tool.scraper.columnar import concat_tables
+from market_calendar_tool.scraper.data_processor import DataProcessor
+from market_calendar_tool.scraper.extended_scraper import ExtendedScraper
+from market_calendar_tool.scraper.models import (
+    Engine,
+    ScrapeOptions,
+    ScrapeResult,
+    Site,
+)
+from market_calendar_tool.scraper.schemas import arrow_to_pandas
+from tests.conftest import detail_payload
+
+RAW_BASE_DATA = {
+    "days": [
+        {
+            "events": [
+                {
+                    "id": 1,
+                    "name": "CPI m/m",
+                    "currency": "USD",
+                    "dateline": 1729515300,
+                    "impactTitle": "High Impact Expected",
+                    "actualBetterWorse": 1,
+                    "siteId": 1,
+                },
+                {
+                    "id": 2,
+                    "name": "Bank Holiday",
+                    "currency": "All",
+                    "dateline": 1729547100,
+                    "impactTitle": "Non-Economic",
+                    "actualBetterWorse": 0,
+                    "siteId": 1,
+                },
+            ]
+        }
+    ]
+}
+
+
+def _detail_payload(event_id):
+    return detail_payload(
+        event_id,
+        specs=[
+            {"order": 10, "title": "Source", "html": "<b>x</b>"},
+            {"order": 20, "title": "Notice", "html": "", "is_notice": "Yes"},
+        ],
+        history=[
+            {
+                "event_id": event_id * 10,
+                "impact": "low",
+                "date": "Sep 16, 2024",
+                "actualBetterWorse": "" if event_id % 2 else 1,
+            }
+        ],
+        news=[{"id": event_id * 100, "html": "<p>n</p>"}],
+    )
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_base_table_matches_frame(typed):
+    processor = DataProcessor(RAW_BASE_DATA)
+
+    table = processor.to_base_table(typed=typed)
+    df = processor.to_base_df(typed=typed)
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == list(df.columns)
+    if typed:
+        pd.testing.assert_frame_equal(
+            arrow_to_pandas(table), df, check_categorical=False
+        )
+
+
+def test_detail_tables_match_typed_frames():
+    payloads = [_detail_payload(1), _detail_payload(2)]
+    processor = DataProcessor(payloads)
+
+    for name in ("specs", "history", "news"):
+        table = getattr(processor, f"to_{name}_table")()
+        df = getattr(processor, f"to_{name}_df")()
+        pd.testing.assert_frame_equal(
+            arrow_to_pandas(table), df, check_categorical=False
+        )
+
+
+def test_from_arrow_materializes_on_access():
+    table = DataProcessor(RAW_BASE_DATA).to_base_table()
+    result = ScrapeResult.from_arrow(
+        {"base": table}, Site.FOREXFACTORY, "2024-10-21", "2024-10-22"
+    )
+
+    assert not result.is_materialized("base")
+    assert result.to_arrow(["base"])["base"] is table
+
+    df = result.base
+    assert isinstance(df, pd.DataFrame)
+    assert result.is_materialized("base")
+    assert result.base is df
+    assert result.specs.empty
+
+    tables = result.to_arrow()
+    assert set(tables) == {"base", "specs", "history", "news"}
+    assert tables["base"].num_rows == 2
+
+
+def test_save_to_dataframes_writes_tables_without_conversion(tmp_path):
+    table = DataProcessor(RAW_BASE_DATA).to_base_table()
+    result = ScrapeResult.from_arrow(
+        {"base": table}, Site.FOREXFACTORY, "2024-10-21", "2024-10-22"
+    )
+
+    with patch.object(pd.DataFrame, "to_parquet") as mock_to_parquet:
+        result.save_to_dataframes(output_dir=str(tmp_path))
+
+    mock_to_parquet.assert_not_called()
+    assert not result.is_materialized("base")
+    files = glob.glob(os.path.join(tmp_path, "*_base.*"))
+    assert len(files) == 1
+    written = pq.read_table(files[0])
+    assert written.to_pylist() == table.to_pylist()
+
+    result.save_to_dataframes(save_format=SaveFormat.CSV, output_dir=str(tmp_path))
+    assert len(glob.glob(os.path.join(tmp_path, "*_base.*"))) == 2
+
+
+def test_engines_agree_on_mixed_columns_up_to_strings():
+    payloads = [_detail_payload(1), _detail_payload(2)]
+    payloads[0]["data"]["specs"][0]["value"] = 1
+    payloads[1]["data"]["specs"][0]["value"] = "0.3%"
+    processor = DataProcessor(payloads)
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+
+    try:
+        table = processor.to_specs_table()
+    finally:
+        logger.remove(sink)
+    df = processor.to_specs_df()
+
+    assert table.column("value").to_pylist() == ["1", None, "0.3%", None]
+    assert df["value"].tolist()[::2] == [1, "0.3%"]
+    assert any("'value'" in message for message in messages)
+    pd.testing.assert_frame_equal(
+        arrow_to_pandas(table).drop(columns="value"),
+        df.drop(columns="value"),
+        check_categorical=False,
+    )
+
+
+def test_merge_tables_dedupes_by_id():
+    first = pa.table({"id": [1, 2], "name": ["a", "b"]})
+    second = pa.table({"id": [2, 3], "name": ["b2", "c"]})
+
+    merged = BaseScraper._merge_frames([first, pa.table({}), second])
+
+    assert merged.column("id").to_pylist() == [1, 2, 3]
+    assert merged.column("name").to_pylist() == ["a", "b2", "c"]
+
+
+def test_concat_tables_unifies_conflicting_types():
+    first = pa.table({"actual": [1], "id": [1]})
+    second = pa.table({"actual": ["0.3%"], "extra": [True], "id": [2]})
+
+    table = concat_tables([first, second])
+
+    assert table.column("actual").to_pylist() == ["1", "0.3%"]
+    assert table.column("extra").to_pylist() == [None, True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_batch_size", [None, 1])
+async def test_extended_scrape_with_arrow_engine(stream_batch_size):
+    options = ScrapeOptions(
+        max_parallel_tasks=2, engine=Engine.ARROW, stream_batch_size=stream_batch_size
+    )
+    base_scraper = MagicMock()
+    base_scraper.base_url = Site.FOREXFACTORY.value
+    base_scraper.site_number = 1
+    base_scraper.session.headers = {}
+
+    async def async_scrape(session, semaphore):
+        return ScrapeResult(
+            site=Site.FOREXFACTORY,
+            date_from="",
+            date_to="",
+            base=DataProcessor(RAW_BASE_DATA).to_base_table(),
+        )
+
+    base_scraper.async_scrape = async_scrape
+
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(event_id)
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await ExtendedScraper(base_scraper, options).async_scrape()
+
+    for name in ("base", "specs", "history", "news"):
+        assert not result.is_materialized(name)
+
+    assert sorted(result.to_arrow(["specs"])["specs"].column("id").to_pylist()) == [
+        1,
+        1,
+        2,
+        2,
+    ]
+    assert result.history["date"].dtype == "datetime64[ns, UTC]"
+    assert result.history["actualBetterWorse"].dtype == "Int8"
+    assert isinstance(result.specs["title"].dtype, pd.CategoricalDtype)
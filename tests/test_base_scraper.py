@@ -1,14 +1,20 @@
 import time
 from unittest import mock
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
+import aiohttp
 import pandas as pd
 import pytest
 import requests
 
 from market_calendar_tool.scraper.base_scraper import BaseScraper
 from market_calendar_tool.scraper.data_processor import DataProcessingError
-from market_calendar_tool.scraper.models import ScrapeResult, Site, site_number_mapping
+from market_calendar_tool.scraper.models import (
+    ScrapeOptions,
+    ScrapeResult,
+    Site,
+    site_number_mapping,
+)
 
 
 @pytest.fixture
@@ -137,3 +143,149 @@ def test_process_data_error(scraper):
         with pytest.raises(DataProcessingError):
             scraper._process_data(data)
         MockDataProcessor.assert_called_once_with(data)
+
+
+class MockAsyncResponse:
+    def __init__(self, payload=None, error=None):
+        self.payload = payload
+        self.error = error
+
+    def raise_for_status(self):
+        if self.error:
+            raise self.error
+
+    async def json(self):
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_successful(scraper):
+    session = MagicMock()
+    session.post.return_value = MockAsyncResponse(payload={"data": "test_data"})
+
+    with mock.patch.object(
+        scraper, "_process_data", return_value="processed_data"
+    ) as mock_process:
+        result = await scraper.async_scrape(session)
+
+    assert isinstance(result, ScrapeResult)
+    assert result.base == "processed_data"
+    assert result.date_from == "2024-01-01"
+    assert result.date_to == "2024-01-31"
+    mock_process.assert_called_once_with({"data": "test_data"})
+
+    args, kwargs = session.post.call_args
+    assert args == (f"{scraper.base_url}/apply-settings/1",)
+    assert kwargs["json"] == {"begin_date": "2024-01-01", "end_date": "2024-01-31"}
+    assert kwargs["timeout"].total == 10
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_client_error(scraper):
+    session = MagicMock()
+    session.post.return_value = MockAsyncResponse(
+        error=aiohttp.ClientError("Network error")
+    )
+
+    with mock.patch.object(scraper, "_process_data") as mock_process:
+        with pytest.raises(aiohttp.ClientError):
+            await scraper.async_scrape(session)
+        mock_process.assert_not_called()
+
+
+def test_scrape_does_not_retry_by_default(scraper):
+    post = Mock(side_effect=requests.exceptions.ConnectionError("flaky"))
+
+    with mock.patch.object(scraper.session, "post", post):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            scraper.scrape()
+
+    assert post.call_count == 1
+
+
+def test_max_retries_defaults_depend_on_chunking():
+    assert ScrapeOptions().max_retries == 0
+    assert ScrapeOptions(chunk_days=7).max_retries == 2
+    assert ScrapeOptions(chunk_days=7, max_retries=0).max_retries == 0
+    with pytest.raises(ValueError):
+        ScrapeOptions(max_retries=-1)
+
+
+@pytest.fixture
+def chunked_scraper():
+    return BaseScraper(
+        site=Site.FOREXFACTORY,
+        date_from="2024-01-01",
+        date_to="2024-01-17",
+        options=ScrapeOptions(chunk_days=7, max_retries=1),
+    )
+
+
+def _window_payload(json_data):
+    begin = json_data["begin_date"]
+    events = {
+        "2024-01-01": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}],
+        "2024-01-08": [{"id": 2, "name": "B"}, {"id": 3, "name": "C"}],
+        "2024-01-15": [{"id": 4, "name": "D"}],
+    }[begin]
+    return {"days": [{"events": events}]}
+
+
+def test_date_windows(chunked_scraper, scraper):
+    assert chunked_scraper._date_windows() == [
+        ("2024-01-01", "2024-01-07"),
+        ("2024-01-08", "2024-01-14"),
+        ("2024-01-15", "2024-01-17"),
+    ]
+    assert scraper._date_windows() == [("2024-01-01", "2024-01-31")]
+
+
+def test_chunked_scrape_merges_and_dedupes(chunked_scraper):
+    def post(url, json, headers, timeout):
+        response = Mock()
+        response.json.return_value = _window_payload(json)
+        return response
+
+    with mock.patch.object(chunked_scraper.session, "post", side_effect=post):
+        result = chunked_scraper.scrape()
+
+    assert result.date_from == "2024-01-01"
+    assert result.date_to == "2024-01-17"
+    assert sorted(result.base["id"].tolist()) == [1, 2, 3, 4]
+
+
+def test_chunked_scrape_retries_only_failed_window(chunked_scraper):
+    calls = []
+
+    def post(url, json, headers, timeout):
+        calls.append(json["begin_date"])
+        if json["begin_date"] == "2024-01-08" and calls.count("2024-01-08") == 1:
+            raise requests.exceptions.ConnectionError("flaky")
+        response = Mock()
+        response.json.return_value = _window_payload(json)
+        return response
+
+    with mock.patch.object(chunked_scraper.session, "post", side_effect=post):
+        result = chunked_scraper.scrape()
+
+    assert sorted(calls) == ["2024-01-01", "2024-01-08", "2024-01-08", "2024-01-15"]
+    assert sorted(result.base["id"].tolist()) == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_async_chunked_scrape(chunked_scraper):
+    session = MagicMock()
+    session.post.side_effect = lambda url, json, headers, timeout: MockAsyncResponse(
+        payload=_window_payload(json)
+    )
+
+    result = await chunked_scraper.async_scrape(session)
+
+    assert session.post.call_count == 3
+    assert sorted(result.base["id"].tolist()) == [1, 2, 3, 4]
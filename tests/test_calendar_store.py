@@ -0,0 +1,212 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from market_calendar_tool.cleaning.cleaner import clean_data
+from market_calendar_tool.scraper.models import Site
+from market_calendar_tool.storage import CalendarStore
+from tests.conftest import base_event, event_payload, raw_result
+
+OCTOBER = 1729515300
+NOVEMBER = 1730764800
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CalendarStore(str(tmp_path / "store"))
+
+
+@pytest.fixture
+def result():
+    events = [base_event(1), base_event(2), base_event(3, dateline=NOVEMBER)]
+    return raw_result(events, [event_payload(i) for i in (1, 2, 3)])
+
+
+def test_compact_threshold_validation(tmp_path):
+    with pytest.raises(ValueError):
+        CalendarStore(str(tmp_path), compact_threshold=1)
+
+
+def test_upsert_writes_hive_partitions(store, result):
+    written = store.upsert(result)
+
+    assert written == {"base": 3, "specs": 6, "history": 3, "news": 3}
+    partitions = sorted(
+        os.path.relpath(os.path.dirname(path), store.root)
+        for path in store.files("base")
+    )
+    assert partitions == [
+        os.path.join("site=forexfactory", "year=2024", "month=10", "frame=base"),
+        os.path.join("site=forexfactory", "year=2024", "month=11", "frame=base"),
+    ]
+
+
+def test_read_returns_latest_row_per_key(store, result):
+    store.upsert(result)
+    store.upsert(raw_result([base_event(2, actual="0.9%")], [event_payload(2, "Bank")]))
+
+    base = store.read("base").to_pandas().sort_values("id")
+    specs = store.read("specs").to_pandas().sort_values("id")
+    sources = specs[specs["title"] == "Source"]
+
+    assert base["id"].tolist() == [1, 2, 3]
+    assert base["actual"].tolist() == ["0.2%", "0.9%", "0.2%"]
+    assert sources["html"].tolist() == [
+        "<b>Statistics Bureau</b>",
+        "<b>Bank</b>",
+        "<b>Statistics Bureau</b>",
+    ]
+    assert "_seq" not in base.columns
+
+
+def test_read_filters_on_partitions(store, result):
+    store.upsert(result)
+
+    table = store.read("base", site=Site.FOREXFACTORY, filter=ds.field("month") == 11)
+
+    assert table.column("id").to_pylist() == [3]
+
+
+def test_upsert_promotes_conflicting_types_to_string(store):
+    store.upsert(raw_result([base_event(1, actual=1)]))
+    store.upsert(raw_result([base_event(2, actual="0.2%")]))
+
+    base = store.read("base").to_pandas().sort_values("id")
+
+    assert base["actual"].tolist() == ["1", "0.2%"]
+
+
+def test_upsert_skips_details_withoutbase_event(store):
+    written = store.upsert(raw_result([base_event(1)], [event_payload(5)]))
+
+    assert written == {"base": 1}
+    assert store.files("specs") == []
+
+
+def test_compact_keeps_latest_rows(store, result):
+    store.upsert(result)
+    store.upsert(raw_result([base_event(1, actual="0.5%")]))
+    before = store.read("base").to_pandas().sort_values("id").reset_index(drop=True)
+
+    removed = store.compact()
+
+    assert removed == 1
+    assert len(store.files("base")) == 2
+    after = store.read("base").to_pandas().sort_values("id").reset_index(drop=True)
+    pd.testing.assert_frame_equal(after, before)
+
+
+def test_compact_drops_rows_of_events_that_moved_month(store):
+    store.upsert(raw_result([base_event(1), base_event(2)]))
+    store.upsert(raw_result([base_event(1, dateline=NOVEMBER)]))
+
+    store.compact()
+
+    assert len(store.files("base")) == 2
+    rows = ds.dataset(store.files("base"), format="parquet").to_table()
+    assert sorted(rows.column("id").to_pylist()) == [1, 2]
+
+
+def test_compact_removes_partitions_left_without_rows(store):
+    store.upsert(raw_result([base_event(1)]))
+    store.upsert(raw_result([base_event(1, dateline=NOVEMBER)]))
+
+    assert store.compact() == 1
+    assert len(store.files("base")) == 1
+    assert store.read("base").column("id").to_pylist() == [1]
+
+
+def test_upsert_compacts_busy_partitions(tmp_path):
+    store = CalendarStore(str(tmp_path / "store"), compact_threshold=3)
+
+    for actual in ("0.1%", "0.2%", "0.3%"):
+        store.upsert(raw_result([base_event(1, actual=actual)]))
+
+    assert len(store.files("base")) == 1
+    assert store.read("base").column("actual").to_pylist() == ["0.3%"]
+
+
+def test_upsert_scans_each_frame_once_when_compacting(tmp_path, result):
+    store = CalendarStore(str(tmp_path / "store"), compact_threshold=2)
+    store.upsert(result)
+
+    with patch.object(store, "dataset", wraps=store.dataset) as dataset:
+        store.upsert(result)
+
+    assert [call.args[0] for call in dataset.call_args_list] == [
+        "base",
+        "specs",
+        "history",
+        "news",
+    ]
+    assert len(store.files("base")) == 2
+
+
+def test_save_to_store(store, result):
+    assert result.save_to_store(store)["base"] == 3
+
+
+@pytest.fixture
+def mixed_events():
+    events = [
+        base_event(1),
+        base_event(2, currency="EUR"),
+        base_event(3, impact="Low Impact Expected"),
+        base_event(4, dateline=NOVEMBER),
+        base_event(5, dateline=OCTOBER - 86400 * 30),
+    ]
+    return raw_result(events, [event_payload(i) for i in range(1, 6)])
+
+
+@pytest.mark.parametrize("cleaned", [False, True])
+def test_query_filters_base_and_joins_details(store, mixed_events, cleaned):
+    store.upsert(clean_data(mixed_events) if cleaned else mixed_events)
+
+    result = store.query(
+        Site.FOREXFACTORY,
+        start="2024-10-01",
+        end="2024-10-31",
+        currency=["usd"],
+        impact=["high"],
+    )
+
+    assert result.date_from == "2024-10-01"
+    assert result.base["id"].tolist() == [1]
+    assert result.specs["id"].tolist() == [1, 1]
+    assert result.news["id"].tolist() == [1]
+
+
+def test_query_includes_whole_end_day(store, mixed_events):
+    store.upsert(mixed_events)
+
+    result = store.query(Site.FOREXFACTORY, start="2024-11-05", end="2024-11-05")
+
+    assert result.base["id"].tolist() == [4]
+
+
+def test_query_projects_columns(store, mixed_events):
+    store.upsert(mixed_events)
+
+    result = store.query(Site.FOREXFACTORY, currency=["EUR"], columns=["name"])
+
+    assert result.base.columns.tolist() == ["id", "name"]
+    assert result.base["name"].tolist() == ["Event 2"]
+
+
+def test_query_ignores_superseded_matches(store, mixed_events):
+    store.upsert(mixed_events)
+    store.upsert(raw_result([base_event(1, currency="EUR")]))
+
+    result = store.query(Site.FOREXFACTORY, currency=["USD"], impact=["high"])
+
+    assert sorted(result.base["id"].tolist()) == [4, 5]
+
+
+def test_query_empty_store(store):
+    result = store.query(Site.FOREXFACTORY, currency=["USD"])
+
+    assert result.base.empty
+    assert result.specs.empty
@@ -9,6 +9,7 @@ from market_calendar_tool.cleaning.cleaner import (
     clean_news,
     clean_specs,
     is_valid_currency,
+    parse_unique,
 )
 from market_calendar_tool.scraper.models import ScrapeResult, Site
 
@@ -31,6 +32,33 @@ def test_camel_to_snake():
     assert camel_to_snake("aB") == "a_b"
 
 
+def test_camel_to_snake_is_memoized():
+    camel_to_snake.cache_clear()
+
+    camel_to_snake("actualBetterWorse")
+    camel_to_snake("actualBetterWorse")
+
+    assert camel_to_snake.cache_info().hits == 1
+
+
+def test_parse_unique_parses_each_value_once():
+    seen = []
+
+    def parse(uniques):
+        seen.append(len(uniques))
+        return pd.to_datetime(uniques, format="%b %d, %Y", errors="coerce")
+
+    series = pd.Series(
+        ["Sep 16, 2024", "Oct 1, 2024", None, "Sep 16, 2024", "bad"] * 1000,
+        index=range(10, 5010),
+    )
+
+    parsed = parse_unique(series, parse)
+
+    assert seen == [3]
+    pd.testing.assert_series_equal(parsed, parse(series))
+
+
 @pytest.fixture
 def sample_base_df():
     data = {
@@ -90,6 +118,22 @@ def test_clean_base(sample_base_df):
     )
 
 
+def test_clean_base_drops_invalid_rows(sample_base_df):
+    invalid = sample_base_df.copy()
+    invalid["currency"] = ["XYZ", "USD", "EUR"]
+    invalid["impactTitle"] = invalid["impactTitle"].replace(
+        "High Impact Expected", "Holiday"
+    )
+    invalid["dateline"] = [1729515300, 1729547100, None]
+    valid = sample_base_df.assign(id=[1, 2, 3], currency=["usd", None, "All"])
+
+    cleaned_df = clean_base(pd.concat([invalid, valid], ignore_index=True))
+
+    assert cleaned_df["id"].tolist() == [1, 3]
+    assert cleaned_df["currency"].tolist() == ["usd", "WORLD"]
+    assert cleaned_df["impact"].tolist() == ["low", "medium"]
+
+
 @pytest.fixture
 def sample_specs_df():
     data = {
@@ -259,6 +303,25 @@ def test_clean_data(sample_scrape_result):
     assert cleaned_news.shape[0] == 1
 
 
+def test_clean_data_filters_news_without_history(sample_base_df, sample_news_df):
+    news = pd.concat(
+        [sample_news_df, sample_news_df.assign(news_id=[1], id=[999])],
+        ignore_index=True,
+    )
+    scrape_result = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=sample_base_df,
+        news=news,
+    )
+
+    cleaned = clean_data(scrape_result)
+
+    assert cleaned.history.empty
+    assert cleaned.news["id"].tolist() == [135817]
+
+
 def test_clean_data_with_empty_dfs(sample_base_df):
     scrape_result = ScrapeResult(
         site=Site.FOREXFACTORY, date_from="", date_to="", base=sample_base_df
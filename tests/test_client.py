@@ -0,0 +1,116 @@
+import asyncio
+from unittest import mock
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from market_calendar_tool.client import CalendarClient
+from market_calendar_tool.scraper.models import ScrapeOptions, ScrapeResult, Site
+
+
+@pytest.fixture
+def client():
+    with CalendarClient() as client:
+        yield client
+
+
+def _mock_response(json_data):
+    response = Mock()
+    response.json.return_value = json_data
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_client_reuses_requests_session(client):
+    with mock.patch.object(
+        client.session, "post", return_value=_mock_response({"data": "x"})
+    ) as mock_post, mock.patch(
+        "market_calendar_tool.scraper.base_scraper.DataProcessor"
+    ) as mock_processor:
+        mock_processor.return_value.to_base_df.return_value = pd.DataFrame({"id": [1]})
+        first = client.scrape(date_from="2024-01-01", date_to="2024-01-07")
+        second = client.scrape(
+            Site.CRYPTOCRAFT, date_from="2024-01-01", date_to="2024-01-07"
+        )
+
+    assert isinstance(first, ScrapeResult)
+    assert second.site == Site.CRYPTOCRAFT
+    assert mock_post.call_count == 2
+    assert client.session.headers["Accept"] == "application/json"
+
+
+def test_client_passes_options(client):
+    options = ScrapeOptions(max_parallel_tasks=2)
+    with mock.patch("market_calendar_tool.client.BaseScraper") as mock_base:
+        client.scrape(date_from="2024-01-01", date_to="2024-01-07", options=options)
+
+    mock_base.assert_called_once_with(
+        Site.FOREXFACTORY,
+        "2024-01-01",
+        "2024-01-07",
+        options=options,
+        session=client.session,
+    )
+
+
+def test_client_scrape_extended_reuses_async_session(client):
+    sessions = []
+
+    async def fake_async_scrape(self, session=None, semaphore=None, previous=None):
+        sessions.append(session)
+        return "extended"
+
+    with mock.patch(
+        "market_calendar_tool.client.ExtendedScraper.async_scrape",
+        new=fake_async_scrape,
+    ):
+        assert client.scrape_extended(date_from="2024-01-01") == "extended"
+        assert client.scrape_extended(date_from="2024-01-01") == "extended"
+
+    assert sessions[0] is sessions[1]
+    assert not sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_client_async_methods_share_session():
+    sessions = []
+
+    async def fake_async_scrape(self, session=None, semaphore=None, previous=None):
+        sessions.append(session)
+        return "extended"
+
+    async with CalendarClient(limit=20, limit_per_host=4) as client:
+        with mock.patch(
+            "market_calendar_tool.client.ExtendedScraper.async_scrape",
+            new=fake_async_scrape,
+        ):
+            await client.async_scrape_extended(date_from="2024-01-01")
+            await asyncio.gather(
+                client.async_scrape_extended(Site.ENERGYEXCH, date_from="2024-01-01"),
+                client.async_scrape_extended(Site.METALSMINE, date_from="2024-01-01"),
+            )
+
+        assert len({id(session) for session in sessions}) == 1
+        connector = sessions[0].connector
+        assert connector.limit == 20
+        assert connector.limit_per_host == 4
+
+    assert sessions[0].closed
+    assert client.closed
+
+
+def test_client_rejects_use_after_close():
+    client = CalendarClient()
+    client.close()
+    client.close()
+
+    with pytest.raises(RuntimeError):
+        client.scrape(date_from="2024-01-01")
+    with pytest.raises(RuntimeError):
+        client.scrape_extended(date_from="2024-01-01")
+
+
+def test_client_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        CalendarClient(limit=0)
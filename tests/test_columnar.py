@@ -0,0 +1,146 @@
+import pandas as pd
+import pytest
+
+from market_calendar_tool.scraper.columnar import (
+    DetailFrameBuilder,
+    base_frame,
+    flatten_record,
+)
+from market_calendar_tool.scraper.data_processor import DataProcessor
+
+
+def _payload(event_id, specs=2, history=1, news=1):
+    return {
+        "data": {
+            "event_id": event_id,
+            "specs": [
+                {"order": i * 10, "title": f"Spec {i}", "html": "<b>x</b>"}
+                for i in range(specs)
+            ]
+            + ([{"order": 99, "title": "Notice", "html": "", "is_notice": "Yes"}]),
+            "history": {
+                "events": [
+                    {
+                        "event_id": event_id * 100 + i,
+                        "impact": "low",
+                        "date": "Sep 16, 2024",
+                        "actual": "0.1%",
+                    }
+                    for i in range(history)
+                ]
+            },
+            "linked_threads": {
+                "news": [
+                    {"id": event_id * 10 + i, "html": "<div>News</div>"}
+                    for i in range(news)
+                ]
+            },
+        }
+    }
+
+
+def _json_normalize(data, record_path, rename_cols=None, meta=(("data", "event_id"),)):
+    df = pd.json_normalize(
+        data, record_path=record_path, meta=[list(m) for m in meta], errors="ignore"
+    )
+    return df.rename(columns=rename_cols or {})
+
+
+@pytest.fixture
+def payloads():
+    return [
+        _payload(1),
+        _payload(2, specs=0, history=3, news=0),
+        _payload(3, specs=1, history=0, news=2),
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2])
+def test_frames_match_json_normalize(payloads, batch_size):
+    frames = DetailFrameBuilder(batch_size).extend(payloads).frames()
+
+    pd.testing.assert_frame_equal(
+        frames["specs"],
+        _json_normalize(payloads, ["data", "specs"], {"data.event_id": "id"}),
+    )
+    pd.testing.assert_frame_equal(
+        frames["history"],
+        _json_normalize(
+            payloads, ["data", "history", "events"], {"data.event_id": "id"}
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        frames["news"],
+        _json_normalize(
+            payloads,
+            ["data", "linked_threads", "news"],
+            {"id": "news_id", "data.event_id": "id"},
+        ),
+    )
+
+
+def test_data_processor_matches_json_normalize(payloads):
+    processor = DataProcessor(payloads)
+
+    pd.testing.assert_frame_equal(
+        processor.to_specs_df(typed=False),
+        _json_normalize(payloads, ["data", "specs"], {"data.event_id": "id"}),
+    )
+    pd.testing.assert_frame_equal(
+        processor.to_news_df(typed=False),
+        _json_normalize(
+            payloads,
+            ["data", "linked_threads", "news"],
+            {"id": "news_id", "data.event_id": "id"},
+        ),
+    )
+
+
+def test_base_frame_matches_json_normalize():
+    raw = {
+        "days": [
+            {"events": [{"id": 1, "name": "A", "meta": {"x": 1}}]},
+            {"events": []},
+            {"events": [{"id": 2, "actual": None}, {"id": 3, "name": "C"}]},
+        ]
+    }
+
+    pd.testing.assert_frame_equal(
+        base_frame(raw),
+        _json_normalize(raw, ["days", "events"], meta=()),
+    )
+    assert base_frame({"days": []}).empty
+
+
+def test_batches_are_flushed(payloads):
+    builder = DetailFrameBuilder(batch_size=2)
+
+    builder.add(payloads[0])
+    assert len(builder._builders["specs"]) == 3
+    builder.add(payloads[1])
+    assert len(builder._builders["specs"]) == 0
+    assert len(builder._chunks["specs"]) == 1
+
+
+def test_empty_frames():
+    assert DetailFrameBuilder().frames()["specs"].empty
+
+    frames = DetailFrameBuilder().extend([_payload(1, specs=0, news=0)]).frames()
+    assert list(frames["news"].columns) == ["id"]
+    assert frames["news"].empty
+
+
+def test_missing_record_paths_are_skipped():
+    frames = DetailFrameBuilder().extend([{"data": {"event_id": 5}}]).frames()
+
+    assert frames["specs"].empty
+    assert frames["history"].empty
+
+
+def test_flatten_record():
+    record = {"a": {"b": {"c": 1}, "d": 2}, "e": 3}
+
+    assert flatten_record(record) == {"e": 3, "a.b.c": 1, "a.d": 2}
+    assert list(flatten_record(record)) == list(
+        pd.json_normalize([{"x": [record]}], record_path="x").columns
+    )
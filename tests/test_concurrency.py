@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from market_calendar_tool.scraper.concurrency import AdaptiveLimiter
+
+
+def test_slow_start_then_additive_increase():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=10, cooldown=0)
+
+    for _ in range(3):
+        limiter.record_success(0.1)
+    assert limiter.limit == 4
+
+    limiter.record_throttle()
+    assert limiter.limit == 2
+
+    limiter.record_success(0.1)
+    assert limiter.limit == 2
+    limiter.record_success(0.1)
+    assert limiter.limit == 3
+
+
+def test_limits_are_bounded():
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=3, cooldown=0)
+
+    for _ in range(10):
+        limiter.record_success(0.1)
+    assert limiter.limit == 3
+
+    for _ in range(5):
+        limiter.record_throttle()
+    assert limiter.limit == 2
+
+
+def test_latency_spike_backs_off():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=10, initial_limit=8, cooldown=0)
+
+    limiter.record_success(0.1)
+    limiter.record_success(1.0)
+
+    assert limiter.limit == 4
+
+
+def test_cooldown_limits_consecutive_decreases():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=16, initial_limit=16, cooldown=60)
+
+    limiter.record_throttle()
+    limiter.record_throttle()
+
+    assert limiter.limit == 8
+
+
+def test_history_records_changes():
+    limiter = AdaptiveLimiter(min_limit=1, max_limit=3, cooldown=0)
+
+    for _ in range(5):
+        limiter.record_success(0.1)
+
+    assert [limit for _, limit in limiter.history] == [1, 2, 3]
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(min_limit=0)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(min_limit=5, max_limit=2)
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_tasks():
+    limiter = AdaptiveLimiter(min_limit=2, max_limit=2)
+    peak = 0
+
+    async def task():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(task() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
@@ -91,8 +91,13 @@ def test_to_history_df(mock_ext_processor):
     assert df["id"].tolist() == [141895]
 
 
-def test_invalid_record_path():
-    processor = DataProcessor(SAMPLE_RAW_BASE_DATA)
+def test_to_base_df_missing_days():
+    with pytest.raises(DataProcessingError):
+        DataProcessor({"unexpected": []}).to_base_df()
+
+
+def test_invalid_base_structure():
+    processor = DataProcessor({"days": "invalid"})
     with pytest.raises(DataProcessingError) as exc_info:
-        processor._to_df(record_path=["invalid", "path"])
+        processor.to_base_df()
     assert "Failed to convert data to DataFrame" in str(exc_info.value)
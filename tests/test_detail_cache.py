@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from market_calendar_tool.scraper.detail_cache import CacheStats, SQLiteDetailCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SQLiteDetailCache(path=str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_get_set_roundtrip(cache):
+    payload = {"data": {"event_id": 1, "specs": [{"title": "Source"}]}}
+
+    assert cache.get(1, 1) is None
+    cache.set(1, 1, payload)
+
+    assert cache.get(1, 1) == payload
+    assert cache.get(2, 1) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_expired_entries_are_misses(cache):
+    cache.set(1, 1, {"data": {}}, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get(1, 1) is None
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_ttl_for_near_events(cache):
+    now = 1_700_000_000
+
+    assert cache.ttl_for(None, now=now) == cache.ttl
+    assert cache.ttl_for(now + 60, now=now) == cache.near_ttl
+    assert cache.ttl_for(now - 60, now=now) == cache.near_ttl
+    assert cache.ttl_for(now + 7 * 24 * 3600, now=now) == cache.ttl
+
+
+def test_lru_eviction_by_total_bytes(tmp_path):
+    cache = SQLiteDetailCache(path=str(tmp_path / "cache.sqlite"), max_bytes=100)
+    payload = {"data": "x" * 30}
+
+    cache.set(1, 1, payload)
+    time.sleep(0.01)
+    cache.set(1, 2, payload)
+    time.sleep(0.01)
+    assert cache.get(1, 1) == payload
+    time.sleep(0.01)
+    cache.set(1, 3, payload)
+
+    assert cache.total_bytes <= 100
+    assert cache.stats.evictions == 1
+    assert cache.get(1, 2) is None
+    assert cache.get(1, 1) == payload
+    assert cache.get(1, 3) == payload
+    cache.close()
+
+
+def test_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    first = SQLiteDetailCache(path=path)
+    first.set(4, 99, {"data": {"event_id": 99}})
+    first.close()
+
+    second = SQLiteDetailCache(path=path)
+    assert second.get(4, 99) == {"data": {"event_id": 99}}
+    assert second.total_bytes > 0
+    second.close()
+
+
+def test_hits_batch_last_access_updates(cache):
+    cache.set(1, 1, {"data": {}})
+    stored = cache._conn.execute("SELECT last_access FROM details").fetchone()[0]
+
+    time.sleep(0.01)
+    assert cache.get(1, 1) == {"data": {}}
+    assert (
+        cache._conn.execute("SELECT last_access FROM details").fetchone()[0] == stored
+    )
+
+    cache.flush()
+    assert cache._conn.execute("SELECT last_access FROM details").fetchone()[0] > stored
+
+
+def test_snapshot_difference_counts_one_run(cache):
+    cache.get(1, 1)
+    before = cache.snapshot()
+    cache.set(1, 1, {"data": {}})
+    cache.get(1, 1)
+
+    assert cache.snapshot() - before == CacheStats(hits=1, misses=0, evictions=0)
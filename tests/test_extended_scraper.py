@@ -1,10 +1,18 @@
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
+import aiohttp
 import pandas as pd
 import pytest
 
+from market_calendar_tool.scraper.data_processor import DataProcessor
+from market_calendar_tool.scraper.detail_cache import SQLiteDetailCache
 from market_calendar_tool.scraper.extended_scraper import ExtendedScraper, ScrapeResult
-from market_calendar_tool.scraper.models import ScrapeOptions, Site
+from market_calendar_tool.scraper.models import Engine, ScrapeOptions, Site
+from market_calendar_tool.scraper.priority import priority_order
+from tests.conftest import detail_payload
 
 
 @pytest.fixture
@@ -18,6 +26,9 @@ def mock_base_scraper():
         mock_scraper.scrape.return_value = ScrapeResult(
             site=Site.FOREXFACTORY, date_from="", date_to="", base=df
         )
+        mock_scraper.async_scrape.return_value = ScrapeResult(
+            site=Site.FOREXFACTORY, date_from="", date_to="", base=df
+        )
 
         mock_scraper.site = Site.FOREXFACTORY
         mock_scraper.site_number = 1
@@ -113,3 +124,597 @@ async def test_async_scrape(mock_base_scraper, mock_data_processor):
     assert result.specs.equals(mock_data_processor.to_specs_df.return_value)
     assert result.history.equals(mock_data_processor.to_history_df.return_value)
     assert result.news.equals(mock_data_processor.to_news_df.return_value)
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_uses_async_base_fetch(
+    mock_base_scraper, mock_data_processor
+):
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper, options=ScrapeOptions(max_parallel_tasks=1)
+    )
+
+    async def mock_get(url, headers):
+        class MockResponse:
+            async def json(self):
+                return {"data": "mocked"}
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper.async_scrape()
+
+    assert isinstance(result, ScrapeResult)
+    mock_base_scraper.async_scrape.assert_awaited_once()
+    mock_base_scraper.scrape.assert_not_called()
+
+
+def _detail_payload(event_id, title):
+    return detail_payload(event_id, specs=[{"order": 10, "title": title, "html": ""}])
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_uses_detail_cache(mock_base_scraper, tmp_path):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    cache = SQLiteDetailCache(path=str(tmp_path / "cache.sqlite"))
+    cache.set(1, 1, _detail_payload(1, "cached"))
+
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=1, detail_cache=cache),
+    )
+    requested = []
+
+    def mock_get(self, url, headers):
+        requested.append(url)
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(2, "fetched")
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper._async_scrape()
+
+    assert len(requested) == 1
+    assert requested[0].endswith("/details/1-2")
+    assert sorted(result.specs["title"]) == ["cached", "fetched"]
+    assert cache.get(1, 2) is not None
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+    cache.close()
+
+
+class ThreadRecordingCache(SQLiteDetailCache):
+    def __init__(self, path):
+        super().__init__(path=path)
+        self.threads = set()
+
+    def _get(self, site_number, event_id):
+        self.threads.add(threading.get_ident())
+        return super()._get(site_number, event_id)
+
+    def _set(self, site_number, event_id, payload, ttl):
+        self.threads.add(threading.get_ident())
+        super()._set(site_number, event_id, payload, ttl)
+
+
+@pytest.mark.asyncio
+async def test_detail_cache_runs_off_the_event_loop(mock_base_scraper, tmp_path):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    cache = ThreadRecordingCache(str(tmp_path / "cache.sqlite"))
+    cache.set(1, 1, _detail_payload(1, "cached"))
+    cache.threads.clear()
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=1, detail_cache=cache),
+    )
+
+    def mock_get(self, url, headers):
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(2, "fetched")
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        await extended_scraper._async_scrape()
+
+    assert cache.threads
+    assert threading.get_ident() not in cache.threads
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_incremental(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    previous = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": [1, 2], "actual": ["", ""]}),
+        specs=pd.DataFrame(
+            {
+                "order": [10, 10],
+                "title": ["old 1", "old 2"],
+                "html": ["", ""],
+                "id": [1, 2],
+            }
+        ),
+    )
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": [1, 2, 3], "actual": ["", "1.2%", ""]}),
+    )
+
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper, options=ScrapeOptions(max_parallel_tasks=1)
+    )
+    requested = []
+
+    def mock_get(self, url, headers):
+        requested.append(url)
+        event_id = int(url.rsplit("-", 1)[1])
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(event_id, f"new {event_id}")
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper.async_scrape(previous=previous)
+
+    assert sorted(url.rsplit("-", 1)[1] for url in requested) == ["2", "3"]
+    assert result.specs["id"].tolist() == [1, 2, 3]
+    assert result.specs["title"].tolist() == ["old 1", "new 2", "new 3"]
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_incremental_against_loaded_bundle(
+    mock_base_scraper, tmp_path
+):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    events = [
+        {"id": 1, "name": "CPI m/m", "actual": "0.2%"},
+        {"id": 2, "name": "GDP q/q"},
+    ]
+    base = DataProcessor({"days": [{"events": events}]}).to_base_df()
+    previous = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="2024-10-21",
+        date_to="2024-10-21",
+        base=base,
+        specs=pd.DataFrame({"id": [1, 2], "title": ["old 1", "old 2"]}),
+    )
+    path = previous.save(output_dir=str(tmp_path))
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY, date_from="", date_to="", base=base
+    )
+    requested = []
+
+    def mock_get(self, url, headers):
+        requested.append(url)
+        raise AssertionError("no event changed")
+
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper, options=ScrapeOptions(max_parallel_tasks=1)
+    )
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper.async_scrape(previous=path)
+
+    assert requested == []
+    assert result.specs["title"].tolist() == ["old 1", "old 2"]
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_adaptive_concurrency(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": list(range(1, 11))}),
+    )
+
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(
+            max_parallel_tasks=4, min_parallel_tasks=1, adaptive_concurrency=True
+        ),
+    )
+
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(event_id, "title")
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper.async_scrape()
+
+    limits = [limit for _, limit in result.concurrency_history]
+    assert limits[0] == 1
+    assert max(limits) <= 4
+    assert len(limits) > 1
+    assert len(result.specs) == 10
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_retries_transient_errors(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=2, max_retries=2, backoff_base=0.01),
+    )
+    attempts = {}
+
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+        attempts[event_id] = attempts.get(event_id, 0) + 1
+        failing = event_id == 2 and attempts[event_id] == 1
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(event_id, "title")
+
+            def raise_for_status(self):
+                if failing:
+                    raise aiohttp.ClientResponseError(
+                        request_info=MagicMock(),
+                        history=(),
+                        status=503,
+                        headers={"Retry-After": "0"},
+                    )
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper.async_scrape()
+
+    assert attempts == {1: 1, 2: 2}
+    assert sorted(result.specs["id"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_streaming(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": list(range(1, 8))}),
+    )
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=3, stream_batch_size=2),
+    )
+
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(event_id, f"title {event_id}")
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await extended_scraper.async_scrape()
+
+    assert sorted(result.specs["id"]) == list(range(1, 8))
+    assert list(result.specs.columns) == ["order", "title", "html", "id"]
+    assert list(result.history.columns) == ["id"]
+
+
+def _timed_get(requested, delays):
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+        requested.append(event_id)
+
+        class MockResponse:
+            async def json(self):
+                await asyncio.sleep(delays.get(event_id, 0))
+                return _detail_payload(event_id, f"title {event_id}")
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    return mock_get
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_fetches_by_priority(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    now = int(time.time())
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4, 5],
+                "dateline": [now + offset for offset in (100, 300, 200, 400, 50)],
+                "impactTitle": [
+                    "Low Impact Expected",
+                    "High Impact Expected",
+                    "High Impact Expected",
+                    "Non-Economic",
+                    "Medium Impact Expected",
+                ],
+            }
+        ),
+    )
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper, options=ScrapeOptions(max_parallel_tasks=1)
+    )
+    requested = []
+
+    with patch("aiohttp.ClientSession.get", new=_timed_get(requested, {})):
+        result = await extended_scraper.async_scrape()
+
+    assert requested == [3, 2, 5, 1, 4]
+    assert list(result.specs["id"]) == [1, 2, 3, 4, 5]
+    assert result.missing_ids == []
+    assert result.is_complete
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("engine", [Engine.PANDAS, Engine.ARROW])
+async def test_streaming_keeps_event_order_when_completions_interleave(
+    mock_base_scraper, engine
+):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": [1, 2, 3, 4]}),
+    )
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=4, stream_batch_size=1, engine=engine),
+    )
+    requested = []
+    delays = {1: 0.15, 2: 0.05, 3: 0.1, 4: 0}
+
+    with patch("aiohttp.ClientSession.get", new=_timed_get(requested, delays)):
+        result = await extended_scraper.async_scrape()
+
+    assert list(result.specs["id"]) == [1, 2, 3, 4]
+    assert list(result.specs["title"]) == [f"title {i}" for i in range(1, 5)]
+
+
+def test_priority_order_puts_past_events_after_upcoming_ones():
+    base = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6],
+            "dateline": [900, 1200, 1050, 990, None, 1001],
+            "impactTitle": ["High Impact Expected"] * 5 + ["Low Impact Expected"],
+        }
+    )
+
+    assert list(priority_order(base, now=1000)["id"]) == [3, 2, 4, 1, 5, 6]
+
+
+def test_priority_order_accepts_categorical_impact():
+    base = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "dateline": [100, 200, 300],
+            "impactTitle": pd.Categorical(
+                ["Low Impact Expected", None, "High Impact Expected"]
+            ),
+        }
+    )
+
+    assert list(priority_order(base)["id"]) == [3, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_deadline_returns_partial_result(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": [1, 2, 3, 4]}),
+    )
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=2, deadline=0.2),
+    )
+    requested = []
+
+    with patch("aiohttp.ClientSession.get", new=_timed_get(requested, {2: 5, 4: 5})):
+        result = await extended_scraper.async_scrape()
+
+    assert sorted(result.specs["id"]) == [1, 3]
+    assert result.missing_ids == [2, 4]
+    assert not result.is_complete
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_request_timeout(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=2, max_retries=0, request_timeout=0.1),
+    )
+    requested = []
+
+    with patch("aiohttp.ClientSession.get", new=_timed_get(requested, {1: 5})):
+        result = await extended_scraper.async_scrape()
+
+    assert list(result.specs["id"]) == [2]
+    assert result.missing_ids == [1]
+
+
+def test_scrape_options_rejects_invalid_deadlines():
+    with pytest.raises(ValueError):
+        ScrapeOptions(request_timeout=0)
+    with pytest.raises(ValueError):
+        ScrapeOptions(deadline=-1)
+
+
+def _flaky_get(failures):
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+        status = failures.get(event_id)
+
+        class MockResponse:
+            async def json(self):
+                return _detail_payload(event_id, f"title {event_id}")
+
+            def raise_for_status(self):
+                if status is not None:
+                    raise aiohttp.ClientResponseError(
+                        request_info=MagicMock(), history=(), status=status
+                    )
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    return mock_get
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_records_failures_and_retries_them(mock_base_scraper):
+    mock_base_scraper.base_url = Site.FOREXFACTORY.value
+    mock_base_scraper.async_scrape.return_value = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="",
+        date_to="",
+        base=pd.DataFrame({"id": [1, 2, 3]}),
+    )
+    extended_scraper = ExtendedScraper(
+        base_scraper=mock_base_scraper,
+        options=ScrapeOptions(max_parallel_tasks=2, max_retries=2, backoff_base=0),
+    )
+
+    with patch("aiohttp.ClientSession.get", new=_flaky_get({2: 404, 3: 503})):
+        result = await extended_scraper.async_scrape()
+
+    assert result.missing_ids == [2, 3]
+    failed = {failure.event_id: failure for failure in result.failed}
+    assert failed[2].error == "ClientResponseError"
+    assert failed[2].attempts == 1
+    assert failed[2].last_status == 404
+    assert failed[3].attempts == 3
+    assert failed[3].last_status == 503
+
+    with patch("aiohttp.ClientSession.get", new=_flaky_get({3: 404})):
+        resumed = await extended_scraper.async_retry_failed(result)
+
+    assert resumed is result
+    assert sorted(result.specs["id"]) == [1, 2]
+    assert result.missing_ids == [3]
+    assert [failure.event_id for failure in result.failed] == [3]
+
+    with patch("aiohttp.ClientSession.get", new=_flaky_get({})):
+        result = await extended_scraper.async_retry_failed(result)
+
+    assert sorted(result.specs["id"]) == [1, 2, 3]
+    assert result.is_complete
+    assert result.failed == []
+
+
+def test_scrape_result_resume_retries_missing_ids():
+    result = ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="2024-01-01",
+        date_to="2024-01-07",
+        base=pd.DataFrame({"id": [1, 2]}),
+        missing_ids=[2],
+    )
+    options = ScrapeOptions(max_parallel_tasks=1)
+
+    with patch(
+        "market_calendar_tool.scraper.extended_scraper.ExtendedScraper.retry_failed",
+        autospec=True,
+        side_effect=lambda scraper, result: result,
+    ) as mock_retry:
+        assert result.resume(options) is result
+
+    scraper = mock_retry.call_args.args[0]
+    assert scraper.options == options
+    assert scraper.base_scraper.date_from == "2024-01-01"
@@ -0,0 +1,121 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from market_calendar_tool.cleaning.cleaner import clean_specs
+from market_calendar_tool.cleaning.html_text import HtmlTextMemo, html_to_text
+
+
+def soup_text(html_content):
+    soup = BeautifulSoup(html_content, "html.parser")
+    for a in soup.find_all("a"):
+        text = a.get_text()
+        href = a.get("href", "")
+        a.replace_with(f"{text} ({href})" if href else text)
+    return soup.get_text(separator=" ", strip=True)
+
+
+@pytest.mark.parametrize(
+    "html_content",
+    [
+        "",
+        "plain text",
+        "<p>Measures change in the price of goods &amp; services</p>",
+        '<a href="https://www.rba.gov.au/">Reserve Bank</a> (<a href="/x">latest</a>)',
+        '<a href="">no href</a> and <a>none</a>',
+        "<div><b>Usual Effect</b><br>Actual &gt; Forecast = Good</div>",
+        "<p>unclosed <a href='/y'>anchor <i>text",
+        "a < b &bogus; &#150; &nbsp;x",
+        "<script>var x = 1;</script><style>p {}</style>visible<!-- hidden -->",
+        '<a href="/z"> <b>spaced</b>\n </a>',
+        "<pre>  keep  </pre><p>mismatched</b></p></div>",
+    ],
+)
+def test_html_to_text_matches_beautifulsoup(html_content):
+    assert html_to_text(html_content) == soup_text(html_content)
+
+
+def test_memo_parses_each_fragment_once():
+    memo = HtmlTextMemo()
+
+    texts = [memo.convert("<p>Source</p>") for _ in range(3)]
+
+    assert texts == ["Source"] * 3
+    assert memo.stats.misses == 1
+    assert memo.stats.hits == 2
+
+
+def test_memo_evicts_least_recently_used():
+    memo = HtmlTextMemo(max_entries=2)
+
+    memo.convert("<p>a</p>")
+    memo.convert("<p>b</p>")
+    memo.convert("<p>a</p>")
+    memo.convert("<p>c</p>")
+
+    assert len(memo) == 2
+    assert memo.stats.evictions == 1
+    memo.convert("<p>a</p>")
+    assert memo.stats.hits == 2
+
+
+def test_memo_persists_between_instances(tmp_path):
+    path = str(tmp_path / "html.sqlite")
+    memo = HtmlTextMemo(path=path)
+    memo.convert("<p>Usual Effect</p>")
+    memo.close()
+
+    reopened = HtmlTextMemo(path=path)
+
+    assert reopened.convert("<p>Usual Effect</p>") == "Usual Effect"
+    assert reopened.stats.hits == 1
+    assert reopened.stats.misses == 0
+    reopened.close()
+
+
+def test_memo_counts_every_lookup_across_threads():
+    memo = HtmlTextMemo()
+    fragments = [f"<p>{i % 50}</p>" for i in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(memo.convert, fragments))
+
+    assert memo.stats.hits + memo.stats.misses == len(fragments)
+
+
+def test_memo_passes_missing_values_through():
+    memo = HtmlTextMemo()
+
+    assert memo.convert(None) is None
+    assert pd.isna(memo.convert(float("nan")))
+
+
+def test_memo_pickles_without_entries(tmp_path):
+    memo = HtmlTextMemo(max_entries=5)
+    memo.convert("<p>a</p>")
+
+    restored = pickle.loads(pickle.dumps(memo))
+
+    assert restored.max_entries == 5
+    assert len(restored) == 0
+
+
+def test_clean_specs_uses_given_memo():
+    memo = HtmlTextMemo()
+    df = pd.DataFrame(
+        {
+            "order": [10, 20],
+            "title": ["Source", "Source"],
+            "html": ["<b>Statistics</b>", "<b>Statistics</b>"],
+            "is_notice": [None, None],
+            "id": [1, 2],
+        }
+    )
+
+    cleaned = clean_specs(df, html_memo=memo)
+
+    assert cleaned["description"].tolist() == ["Statistics", "Statistics"]
+    assert memo.stats.misses == 1
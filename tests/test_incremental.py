@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from market_calendar_tool.scraper.incremental import changed_event_ids, splice_frame
+from market_calendar_tool.scraper.models import ScrapeResult, Site
+
+
+@pytest.fixture
+def previous():
+    return ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="2024-10-21",
+        date_to="2024-10-27",
+        base=pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "actual": ["", "", ""],
+                "revision": ["", "", ""],
+            }
+        ),
+        specs=pd.DataFrame({"id": [1, 2, 3], "title": ["S1", "S2", "S3"]}),
+        history=pd.DataFrame({"id": [1, 1, 2], "date": ["a", "b", "c"]}),
+        news=pd.DataFrame({"id": [2], "news_id": [10]}),
+    )
+
+
+def test_changed_event_ids(previous):
+    current = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "actual": ["", "0.3%", "", ""],
+            "revision": ["", "", "", ""],
+        }
+    )
+
+    assert changed_event_ids(previous, current) == [2, 4]
+
+
+def test_changed_event_ids_refetches_ids_without_details(previous):
+    previous.specs = previous.specs[previous.specs["id"] != 3]
+
+    current = previous.base.copy()
+
+    assert changed_event_ids(previous, current) == [3]
+
+
+def test_changed_event_ids_without_previous_base():
+    previous = ScrapeResult(
+        site=Site.FOREXFACTORY, date_from="", date_to="", base=pd.DataFrame()
+    )
+    current = pd.DataFrame({"id": [5, 6]})
+
+    assert changed_event_ids(previous, current) == [5, 6]
+
+
+def test_splice_frame(previous):
+    fresh = pd.DataFrame({"id": [2, 4], "title": ["S2 new", "S4"]})
+
+    spliced = splice_frame(previous.specs, fresh, [1, 2, 4], [2, 4])
+
+    assert spliced["id"].tolist() == [1, 2, 4]
+    assert spliced["title"].tolist() == ["S1", "S2 new", "S4"]
+
+
+def test_splice_frame_keeps_previous_rows_for_failed_refetch(previous):
+    spliced = splice_frame(previous.history, pd.DataFrame(), [1, 2, 3], [1])
+
+    assert spliced["id"].tolist() == [2]
@@ -0,0 +1,130 @@
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from market_calendar_tool.cleaning.cleaner import clean_data, clean_incremental
+from market_calendar_tool.cleaning.fingerprints import changed_keys, frame_fingerprints
+from market_calendar_tool.cleaning.html_text import HtmlTextMemo
+from market_calendar_tool.cleaning.models import CleaningOptions
+from tests.conftest import base_event, event_payload, raw_result
+
+
+def _sorted(df, keys):
+    return df.sort_values(keys).reset_index(drop=True)
+
+
+SORT_KEYS = {
+    "base": ["id"],
+    "specs": ["id", "order"],
+    "history": ["id"],
+    "news": ["id", "news_id"],
+}
+
+
+@pytest.fixture
+def first_run():
+    events = [base_event(event_id) for event_id in range(1, 6)]
+    payloads = [event_payload(event_id) for event_id in range(1, 6)]
+    return events, payloads
+
+
+def test_changed_keys_reports_new_and_modified():
+    previous = frame_fingerprints(pd.DataFrame({"id": [1, 2], "v": ["a", "b"]}), ["id"])
+    current = frame_fingerprints(
+        pd.DataFrame({"id": [1, 2, 3], "v": ["a", "x", "c"]}), ["id"]
+    )
+
+    assert changed_keys(previous, current).tolist() == [2, 3]
+
+
+def test_clean_incremental_matches_full_clean(first_run):
+    events, payloads = first_run
+    cleaned = clean_data(raw_result(events, payloads))
+
+    events = events[1:] + [base_event(6)]
+    events[0] = base_event(2, actual="0.5%")
+    payloads = payloads[1:] + [event_payload(6)]
+    payloads[1] = event_payload(3, source="Central Bank")
+
+    merged = clean_incremental(cleaned, raw_result(events, payloads))
+    expected = clean_data(raw_result(events, payloads))
+
+    for name, keys in SORT_KEYS.items():
+        pd.testing.assert_frame_equal(
+            _sorted(getattr(merged, name), keys),
+            _sorted(getattr(expected, name), keys),
+            check_categorical=False,
+        )
+
+
+def test_clean_incremental_only_cleans_changed_rows(first_run):
+    events, payloads = first_run
+    cleaned = clean_data(raw_result(events, payloads))
+
+    payloads[2] = event_payload(3, source="Central Bank")
+    memo = HtmlTextMemo()
+    clean_incremental(
+        cleaned,
+        raw_result(events, payloads),
+        CleaningOptions(html_memo=memo),
+    )
+
+    assert memo.stats.misses == 2
+
+
+def test_clean_data_writes_persisted_memo_entries(first_run, tmp_path):
+    events, payloads = first_run
+    path = str(tmp_path / "html.sqlite")
+    memo = HtmlTextMemo(path=path)
+
+    clean_data(raw_result(events, payloads), CleaningOptions(html_memo=memo))
+
+    with sqlite3.connect(path) as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM html_text").fetchone()[0]
+    assert stored == memo.stats.misses > 0
+    memo.close()
+
+
+def test_clean_data_shares_one_process_pool(first_run):
+    events, payloads = first_run
+    options = CleaningOptions(workers=2, chunk_rows=2, serial_threshold=0)
+
+    with patch(
+        "market_calendar_tool.cleaning.parallel.ProcessPoolExecutor",
+        wraps=ProcessPoolExecutor,
+    ) as executor:
+        cleaned = clean_data(raw_result(events, payloads), options)
+
+    assert executor.call_count == 1
+    expected = clean_data(raw_result(events, payloads))
+    for name in ("specs", "history", "news"):
+        pd.testing.assert_frame_equal(
+            getattr(cleaned, name), getattr(expected, name), check_categorical=False
+        )
+
+
+def test_clean_incremental_restores_details_for_revalidated_events(first_run):
+    events, payloads = first_run
+    events[0] = base_event(1, currency="XYZ")
+    cleaned = clean_data(raw_result(events, payloads))
+    assert 1 not in cleaned.specs["id"].tolist()
+
+    events[0] = base_event(1)
+    merged = clean_incremental(cleaned, raw_result(events, payloads))
+
+    assert merged.specs["id"].value_counts()[1] == 2
+    assert 1 in merged.news["id"].tolist()
+
+
+def test_clean_incremental_without_fingerprints_cleans_everything(first_run):
+    events, payloads = first_run
+    previous = raw_result(events, payloads)
+
+    merged = clean_incremental(previous, raw_result(events, payloads))
+    expected = clean_data(raw_result(events, payloads))
+
+    pd.testing.assert_frame_equal(merged.base, expected.base)
+    pd.testing.assert_frame_equal(merged.specs, expected.specs)
@@ -0,0 +1,197 @@
+import pickle
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from market_calendar_tool.cleaning.cleaner import clean_data
+from market_calendar_tool.scraper.columnar import DetailFrameBuilder
+from market_calendar_tool.scraper.data_processor import DataProcessor
+from market_calendar_tool.scraper.extended_scraper import ExtendedScraper
+from market_calendar_tool.scraper.lazy import LazyFrame
+from market_calendar_tool.scraper.models import ScrapeOptions, ScrapeResult, Site
+from tests.conftest import event_payload
+
+RAW_BASE_DATA = {
+    "days": [
+        {
+            "events": [
+                {
+                    "id": 1,
+                    "name": "CPI m/m",
+                    "currency": "USD",
+                    "dateline": 1729515300,
+                    "impactTitle": "High Impact Expected",
+                    "actual": "0.2%",
+                    "previous": "0.1%",
+                    "revision": "",
+                    "forecast": "0.2%",
+                    "actualBetterWorse": 0,
+                    "revisionBetterWorse": 0,
+                    "siteId": 1,
+                },
+                {
+                    "id": 2,
+                    "name": "GDP q/q",
+                    "currency": "EUR",
+                    "dateline": 1729547100,
+                    "impactTitle": "Low Impact Expected",
+                    "actual": "0.2%",
+                    "previous": "0.1%",
+                    "revision": "",
+                    "forecast": "0.2%",
+                    "actualBetterWorse": 0,
+                    "revisionBetterWorse": 0,
+                    "siteId": 1,
+                },
+            ]
+        }
+    ]
+}
+
+
+def _lazy_result():
+    frames = LazyFrame.from_payloads(
+        [event_payload(1), event_payload(2)], ("specs", "history", "news")
+    )
+    return ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="2024-10-21",
+        date_to="2024-10-21",
+        base=DataProcessor(RAW_BASE_DATA).to_base_df(),
+        **frames,
+    )
+
+
+def test_lazy_frames_build_on_first_access():
+    result = _lazy_result()
+    expected = DataProcessor([event_payload(1), event_payload(2)])
+
+    assert result.is_lazy("history")
+
+    history = result.history
+
+    assert not result.is_lazy("history")
+    assert result.is_lazy("specs")
+    assert result.history is history
+    pd.testing.assert_frame_equal(history, expected.to_history_df())
+
+
+def test_lazy_frames_build_only_the_requested_frame():
+    result = _lazy_result()
+    expected = DataProcessor([event_payload(1), event_payload(2)])
+
+    with patch(
+        "market_calendar_tool.scraper.lazy.DetailFrameBuilder",
+        wraps=DetailFrameBuilder,
+    ) as builder:
+        history = result.history
+
+    builder.assert_called_once_with(arrow=False, names=["history"])
+    assert result.is_lazy("specs")
+    assert result.is_lazy("news")
+    pd.testing.assert_frame_equal(history, expected.to_history_df())
+
+
+def test_repr_keeps_lazy_frames_unbuilt():
+    result = _lazy_result()
+
+    text = repr(result)
+
+    assert "LazyFrame(name='specs'" in text
+    for name in ("specs", "history", "news"):
+        assert result.is_lazy(name)
+
+
+def test_lazy_frames_survive_pickle():
+    result = pickle.loads(pickle.dumps(_lazy_result()))
+
+    assert result.is_lazy("news")
+    assert result.news["news_id"].tolist() == [100, 200]
+
+
+def test_memory_report_counts_lazy_payloads():
+    result = _lazy_result()
+
+    report = result.memory_report()
+    specs = report[report["frame"] == "specs"]
+
+    assert specs["column"].tolist() == ["<payloads>"]
+    assert specs["bytes"].iloc[0] == result.__dict__["specs"].nbytes
+    assert result.is_lazy("specs")
+
+
+def test_save_to_dataframes_builds_lazy_frames(tmp_path):
+    result = _lazy_result()
+
+    saved = result.save_to_dataframes(output_dir=str(tmp_path))
+
+    assert sorted(saved) == ["base", "history", "news", "specs"]
+    assert not result.is_lazy("specs")
+    assert pd.read_parquet(saved["specs"])["id"].tolist() == result.specs["id"].tolist()
+
+
+def test_pipe_defers_transform_until_access():
+    result = _lazy_result()
+    transform = MagicMock(side_effect=lambda df: df[df["id"] == 1])
+
+    result.pipe("specs", transform)
+
+    assert result.is_lazy("specs")
+    transform.assert_not_called()
+    assert result.specs["id"].tolist() == [1, 1]
+    transform.assert_called_once()
+
+
+def test_clean_data_keeps_detail_frames_lazy():
+    result = clean_data(_lazy_result())
+
+    assert result.is_lazy("history")
+    assert "impact_class" not in result.history.columns
+    assert result.news["text"].tolist() == ["News 1", "News 2"]
+
+
+@pytest.mark.asyncio
+async def test_extended_scrape_with_lazy_details():
+    options = ScrapeOptions(max_parallel_tasks=2, lazy=True)
+    base_scraper = MagicMock()
+    base_scraper.base_url = Site.FOREXFACTORY.value
+    base_scraper.site_number = 1
+    base_scraper.session.headers = {}
+
+    async def async_scrape(session, semaphore):
+        return ScrapeResult(
+            site=Site.FOREXFACTORY,
+            date_from="",
+            date_to="",
+            base=DataProcessor(RAW_BASE_DATA).to_base_df(),
+        )
+
+    base_scraper.async_scrape = async_scrape
+
+    def mock_get(self, url, headers):
+        event_id = int(url.rsplit("-", 1)[1])
+
+        class MockResponse:
+            async def json(self):
+                return event_payload(event_id)
+
+            def raise_for_status(self):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                pass
+
+        return MockResponse()
+
+    with patch("aiohttp.ClientSession.get", new=mock_get):
+        result = await ExtendedScraper(base_scraper, options).async_scrape()
+
+    for name in ("specs", "history", "news"):
+        assert result.is_lazy(name)
+
+    assert result.specs["id"].tolist() == [1, 1, 2, 2]
+    assert result.is_lazy("news")
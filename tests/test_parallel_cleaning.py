@@ -0,0 +1,110 @@
+import sqlite3
+from functools import partial
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from market_calendar_tool.cleaning.cleaner import clean_history, clean_specs
+from market_calendar_tool.cleaning.html_text import HtmlTextMemo
+from market_calendar_tool.cleaning.models import CleaningOptions
+from market_calendar_tool.cleaning.parallel import (
+    clean_in_chunks,
+    decode_frame,
+    encode_frame,
+    split_frame,
+)
+
+
+@pytest.fixture
+def specs_df():
+    rows = 25
+    return pd.DataFrame(
+        {
+            "order": [10 * i for i in range(rows)],
+            "title": ["Source", "Measures"] * 12 + ["Source"],
+            "html": [
+                f'<a href="/e/{i}">Event {i}</a> <b>bold</b>' for i in range(rows)
+            ],
+            "is_notice": [None] * rows,
+            "id": [i // 3 for i in range(rows)],
+        }
+    )
+
+
+@pytest.fixture
+def history_df():
+    rows = 12
+    return pd.DataFrame(
+        {
+            "event_id": range(rows),
+            "impact": pd.Categorical(["low", "high", "medium"] * 4),
+            "impact_class": ["icon"] * rows,
+            "date": ["Sep 16, 2024", "Oct 1, 2024", "bad"] * 4,
+            "actualBetterWorse": [0, 1, 2] * 4,
+            "id": range(rows),
+        }
+    )
+
+
+def test_cleaning_options_validation():
+    with pytest.raises(ValueError):
+        CleaningOptions(workers=0)
+    with pytest.raises(ValueError):
+        CleaningOptions(chunk_rows=0)
+    with pytest.raises(ValueError):
+        CleaningOptions(serial_threshold=-1)
+
+
+def test_split_frame_keeps_row_order(specs_df):
+    chunks = split_frame(specs_df, CleaningOptions(workers=2, chunk_rows=10))
+
+    assert len(chunks) == 3
+    pd.testing.assert_frame_equal(pd.concat(chunks), specs_df)
+
+
+def test_encode_frame_round_trips_through_arrow(history_df):
+    chunk = encode_frame(history_df.iloc[3:9])
+
+    assert isinstance(chunk, bytes)
+    pd.testing.assert_frame_equal(decode_frame(chunk), history_df.iloc[3:9])
+
+
+def test_encode_frame_falls_back_for_mixed_columns():
+    df = pd.DataFrame({"actual": [1, "0.2%"], "id": [1, 2]})
+
+    assert encode_frame(df) is df
+
+
+def test_clean_in_chunks_runs_serially_below_threshold(specs_df):
+    options = CleaningOptions(workers=4, serial_threshold=100)
+
+    with patch(
+        "market_calendar_tool.cleaning.parallel.ProcessPoolExecutor"
+    ) as mock_executor:
+        cleaned = clean_in_chunks(specs_df.copy(), clean_specs, options)
+
+    mock_executor.assert_not_called()
+    pd.testing.assert_frame_equal(cleaned, clean_specs(specs_df.copy()))
+
+
+@pytest.mark.parametrize("clean_fn", [clean_specs, clean_history])
+def test_clean_in_chunks_matches_serial(specs_df, history_df, clean_fn):
+    df = specs_df if clean_fn is clean_specs else history_df
+    options = CleaningOptions(workers=2, chunk_rows=5, serial_threshold=0)
+
+    cleaned = clean_in_chunks(df.copy(), clean_fn, options)
+
+    pd.testing.assert_frame_equal(cleaned, clean_fn(df.copy()))
+
+
+def test_worker_memos_write_their_entries(specs_df, tmp_path):
+    path = str(tmp_path / "html.sqlite")
+    options = CleaningOptions(workers=2, chunk_rows=5, serial_threshold=0)
+    clean_fn = partial(clean_specs, html_memo=HtmlTextMemo(path=path))
+
+    clean_in_chunks(specs_df.copy(), clean_fn, options)
+
+    with sqlite3.connect(path) as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM html_text").fetchone()[0]
+    assert stored == specs_df["html"].nunique()
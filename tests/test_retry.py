@@ -0,0 +1,93 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+import requests
+
+from market_calendar_tool.scraper.models import ScrapeOptions
+from market_calendar_tool.scraper.rate_limit import TokenBucket, host_bucket
+from market_calendar_tool.scraper.retry import (
+    backoff_delay,
+    parse_retry_after,
+    retry_delay,
+)
+
+
+def _response_error(status, headers=None):
+    return aiohttp.ClientResponseError(
+        request_info=Mock(), history=(), status=status, headers=headers or {}
+    )
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= 4
+
+
+def test_retry_delay_classification():
+    options = ScrapeOptions(max_retries=2, backoff_base=0.1, backoff_max=1)
+
+    assert retry_delay(_response_error(503), 0, options) is not None
+    assert retry_delay(asyncio.TimeoutError(), 1, options) is not None
+    assert retry_delay(aiohttp.ClientConnectionError(), 0, options) is not None
+    assert retry_delay(requests.exceptions.ConnectionError(), 0, options) is not None
+
+    assert retry_delay(_response_error(404), 0, options) is None
+    assert retry_delay(ValueError("bad"), 0, options) is None
+    assert retry_delay(_response_error(503), 2, options) is None
+
+
+def test_retry_delay_honors_retry_after():
+    options = ScrapeOptions(max_retries=1, backoff_base=0.01, backoff_max=10)
+
+    error = _response_error(429, headers={"Retry-After": "3"})
+    assert retry_delay(error, 0, options) == 3
+
+    error = _response_error(429, headers={"Retry-After": "60"})
+    assert retry_delay(error, 0, options) == 10
+
+
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[0] == 0
+    assert delays[1] == 0
+    assert delays[2] == pytest.approx(0.1, abs=0.02)
+    assert delays[3] == pytest.approx(0.2, abs=0.02)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire():
+    bucket = TokenBucket(rate=50)
+
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert time.monotonic() - started >= 0.05
+
+
+def test_host_bucket_is_shared_per_host():
+    first = host_bucket("https://example.test/calendar/details/1-1", 5)
+    second = host_bucket("https://example.test/calendar/apply-settings/1", 5, 3)
+
+    assert first is second
+    assert second.capacity == 3
+    assert host_bucket("https://example.test/calendar", None) is None
+    assert host_bucket("https://other.test/calendar", 5) is not first
@@ -1,12 +1,25 @@
+import glob
 import os
+import pickle
+import shutil
 from datetime import datetime
-from unittest.mock import patch
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from loguru import logger
 
-from market_calendar_tool.mixins.save_mixin import SaveFormat
-from market_calendar_tool.scraper.models import ScrapeResult, Site
+from market_calendar_tool.mixins.manifest import ResultManifest
+from market_calendar_tool.mixins.save_mixin import (
+    ResultFormat,
+    SaveFormat,
+    WriteOptions,
+    atomic_path,
+)
+from market_calendar_tool.scraper.columnar import frame_to_arrow
+from market_calendar_tool.scraper.models import FailedFetch, ScrapeResult, Site
+from market_calendar_tool.storage.calendar_store import frame_to_table
 
 
 @pytest.fixture
@@ -29,98 +42,401 @@ def test_site_prefix():
     assert Site.CRYPTOCRAFT.prefix == "cryptocraft"
 
 
-@patch("os.path.exists")
-@patch("os.makedirs")
-@patch.object(pd.DataFrame, "to_parquet")
-@patch.object(pd.DataFrame, "to_csv")
-def test_save_skips_empty_dataframes(
-    mock_to_csv, mock_to_parquet, mock_makedirs, mock_exists, scrape_result, tmp_path
-):
-    mock_exists.return_value = True
-    scrape_result.save_to_dataframes(
-        save_format=SaveFormat.PARQUET, output_dir=str(tmp_path)
+def _frame_path(directory, scrape_result, name, extension):
+    return os.path.join(
+        str(directory),
+        f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_{name}.{extension}",
     )
 
-    assert mock_to_parquet.call_count == 2
-    mock_to_parquet.assert_any_call(
-        os.path.join(
-            str(tmp_path),
-            f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_base.parquet",
-        ),
-        index=False,
+
+def _frame_files(directory):
+    return sorted(
+        name for name in os.listdir(directory) if name.endswith((".parquet", ".csv"))
     )
-    mock_to_parquet.assert_any_call(
-        os.path.join(
-            str(tmp_path),
-            f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_history.parquet",
-        ),
-        index=False,
+
+
+def test_save_skips_empty_dataframes(scrape_result, tmp_path):
+    saved = scrape_result.save_to_dataframes(
+        save_format=SaveFormat.PARQUET, output_dir=str(tmp_path)
     )
 
-    mock_to_csv.assert_not_called()
+    assert saved == {
+        "base": _frame_path(tmp_path, scrape_result, "base", "parquet"),
+        "history": _frame_path(tmp_path, scrape_result, "history", "parquet"),
+    }
+    assert len(_frame_files(tmp_path)) == 2
+    pd.testing.assert_frame_equal(pd.read_parquet(saved["base"]), scrape_result.base)
 
 
-@patch("os.path.exists")
-@patch("os.makedirs")
-@patch.object(pd.DataFrame, "to_parquet")
-@patch.object(pd.DataFrame, "to_csv")
-def test_save_correct_file_extensions(
-    mock_to_csv, mock_to_parquet, mock_makedirs, mock_exists, scrape_result, tmp_path
-):
-    mock_exists.return_value = True
+def test_save_correct_file_extensions(scrape_result, tmp_path):
+    saved = scrape_result.save_to_dataframes(
+        save_format=SaveFormat.CSV, output_dir=str(tmp_path)
+    )
+
+    assert saved == {
+        "base": _frame_path(tmp_path, scrape_result, "base", "csv"),
+        "history": _frame_path(tmp_path, scrape_result, "history", "csv"),
+    }
+    assert len(_frame_files(tmp_path)) == 2
+    pd.testing.assert_frame_equal(pd.read_csv(saved["history"]), scrape_result.history)
+
+
+def test_save_creates_output_dir_if_not_exists(scrape_result, tmp_path):
+    output_dir = tmp_path / "nested" / "output"
 
     scrape_result.save_to_dataframes(
-        save_format=SaveFormat.CSV, output_dir=str(tmp_path)
+        save_format=SaveFormat.PARQUET, output_dir=str(output_dir)
     )
 
-    assert mock_to_csv.call_count == 2
-    mock_to_csv.assert_any_call(
-        os.path.join(
-            str(tmp_path),
-            f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_base.csv",
+    assert len(_frame_files(output_dir)) == 2
+
+
+@pytest.fixture
+def typed_result():
+    return ScrapeResult(
+        site=Site.FOREXFACTORY,
+        date_from="2024-10-21",
+        date_to="2024-10-28",
+        base=pd.DataFrame(
+            {
+                "id": pd.array([1, 2, None], dtype="Int64"),
+                "currency": pd.Categorical(["USD", "EUR", "USD"]),
+                "datetime": pd.to_datetime([1729515300] * 3, unit="s", utc=True),
+            }
         ),
-        index=False,
+        specs=pd.DataFrame({"id": [1, 1], "title": ["Source", "Measures"]}),
+        missing_ids=[3],
+        failed=[FailedFetch(event_id=3, error="timeout", attempts=2)],
+        concurrency_history=[(0.5, 4)],
+        fingerprints={
+            "base": pd.Series(
+                [11, 12], index=pd.Index([1, 2], name="id"), dtype="uint64"
+            )
+        },
     )
-    mock_to_csv.assert_any_call(
-        os.path.join(
-            str(tmp_path),
-            f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_history.csv",
-        ),
-        index=False,
+
+
+def test_bundle_round_trip(typed_result, tmp_path):
+    typed_result.save(output_dir=str(tmp_path))
+    path = os.path.join(
+        str(tmp_path),
+        f"scrape_result_{datetime.fromtimestamp(typed_result.scraped_at).strftime('%Y%m%d%H%M%S')}.bundle",
     )
 
-    mock_to_parquet.assert_not_called()
+    loaded = ScrapeResult.load(path)
 
+    assert not loaded.is_materialized("base")
+    pd.testing.assert_frame_equal(loaded.base, typed_result.base)
+    pd.testing.assert_frame_equal(loaded.specs, typed_result.specs)
+    assert loaded.news.empty
+    assert loaded.site == Site.FOREXFACTORY
+    assert loaded.scraped_at == typed_result.scraped_at
+    assert loaded.missing_ids == [3]
+    assert loaded.failed == typed_result.failed
+    assert loaded.concurrency_history == [(0.5, 4)]
+    pd.testing.assert_series_equal(
+        loaded.fingerprints["base"], typed_result.fingerprints["base"]
+    )
 
-@patch("os.path.exists")
-@patch("os.makedirs")
-@patch.object(pd.DataFrame, "to_parquet")
-@patch.object(pd.DataFrame, "to_csv")
-def test_save_creates_output_dir_if_not_exists(
-    mock_to_csv, mock_to_parquet, mock_makedirs, mock_exists, scrape_result, tmp_path
-):
-    mock_exists.return_value = False
 
-    scrape_result.save_to_dataframes(
-        save_format=SaveFormat.PARQUET, output_dir=str(tmp_path)
+def test_legacy_pickle_loads_and_resaves(scrape_result, tmp_path):
+    state = {
+        name: scrape_result.__dict__[name]
+        for name in (
+            "site",
+            "date_from",
+            "date_to",
+            "base",
+            "scraped_at",
+            "specs",
+            "history",
+            "news",
+        )
+    }
+    legacy = object.__new__(ScrapeResult)
+    legacy.__dict__.update(state)
+    path = os.path.join(str(tmp_path), "scrape_result_legacy.pickle")
+    with open(path, "wb") as f:
+        pickle.dump(legacy, f)
+
+    loaded = ScrapeResult.load(path)
+    bundle = loaded.save(output_dir=str(tmp_path / "resaved"))
+    reloaded = ScrapeResult.load(bundle)
+
+    assert loaded.is_complete
+    assert loaded.failed == []
+    assert reloaded.is_complete
+    assert reloaded.concurrency_history == []
+    assert reloaded.fingerprints == {}
+    pd.testing.assert_frame_equal(reloaded.history, scrape_result.history)
+
+
+def test_bundle_stores_mixed_columns_as_strings(tmp_path):
+    result = ScrapeResult(
+        site=Site.CRYPTOCRAFT,
+        date_from="2024-10-21",
+        date_to="2024-10-22",
+        base=pd.DataFrame({"actual": [1, "0.2%", None], "id": [1, 2, 3]}),
     )
+    result.save(output_dir=str(tmp_path))
 
-    mock_makedirs.assert_called_once_with(str(tmp_path))
+    loaded = ScrapeResult.load(glob_one(tmp_path, "*.bundle"))
 
-    assert mock_to_parquet.call_count == 2
-    mock_to_parquet.assert_any_call(
-        os.path.join(
-            str(tmp_path),
-            f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_base.parquet",
-        ),
-        index=False,
+    assert loaded.base["actual"].tolist() == ["1", "0.2%", None]
+
+
+def test_mixed_columns_convert_alike_everywhere(tmp_path):
+    df = pd.DataFrame(
+        {"actual": [1, "0.2%", None], "id": pd.array([1, 2, None], dtype="Int64")}
     )
-    mock_to_parquet.assert_any_call(
-        os.path.join(
-            str(tmp_path),
-            f"{scrape_result.site.prefix}__{scrape_result.date_from}_{scrape_result.date_to}_{datetime.fromtimestamp(scrape_result.scraped_at).strftime('%Y%m%d%H%M%S')}_history.parquet",
-        ),
-        index=False,
+    result = ScrapeResult(
+        site=Site.CRYPTOCRAFT, date_from="2024-10-21", date_to="2024-10-22", base=df
+    )
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+
+    try:
+        tables = [
+            frame_to_arrow(df),
+            frame_to_table(df),
+            result.to_arrow(["base"])["base"],
+        ]
+        result.save(output_dir=str(tmp_path))
+    finally:
+        logger.remove(sink)
+    loaded = ScrapeResult.load(glob_one(tmp_path, "*.bundle"))
+
+    for table in tables:
+        assert table.column("actual").to_pylist() == ["1", "0.2%", None]
+    assert sum("'actual'" in message for message in messages) == 4
+    assert loaded.base["id"].dtype == "Int64"
+
+
+def test_load_picks_latest_bundle_or_pickle(typed_result, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    typed_result.save(result_format=ResultFormat.PICKLE)
+    typed_result.scraped_at += 60
+    typed_result.save()
+    typed_result.scraped_at += 60
+    typed_result.missing_ids = [4]
+    typed_result.save(result_format=ResultFormat.PICKLE)
+
+    loaded = ScrapeResult.load()
+
+    assert loaded.missing_ids == [4]
+    pd.testing.assert_frame_equal(loaded.base, typed_result.base)
+
+
+def glob_one(directory, pattern):
+    (path,) = glob.glob(os.path.join(str(directory), pattern))
+    return path
+
+
+def _result(site, date_from, date_to, scraped_at):
+    return ScrapeResult(
+        site=site,
+        date_from=date_from,
+        date_to=date_to,
+        scraped_at=scraped_at,
+        base=pd.DataFrame({"id": [1, 2], "site": [site.prefix] * 2}),
+        specs=pd.DataFrame({"id": [1]}),
     )
 
-    mock_to_csv.assert_not_called()
+
+@pytest.fixture
+def saved_results(tmp_path):
+    results = [
+        _result(Site.FOREXFACTORY, "2024-10-21", "2024-10-27", 1729500000),
+        _result(Site.FOREXFACTORY, "2024-10-28", "2024-11-03", 1729600000),
+        _result(Site.CRYPTOCRAFT, "2024-10-21", "2024-10-27", 1729700000),
+    ]
+    for result in results:
+        result.save(output_dir=str(tmp_path))
+    results[0].save_to_dataframes(output_dir=str(tmp_path))
+    return results
+
+
+def test_save_records_manifest_entries(saved_results, tmp_path):
+    manifest = ResultManifest(str(tmp_path))
+    entries = manifest.find()
+    manifest.close()
+
+    assert [entry.format for entry in entries] == [
+        "bundle",
+        "bundle",
+        "parquet",
+        "bundle",
+    ]
+    assert entries[0].row_counts == {"base": 2, "specs": 1, "history": 0, "news": 0}
+    assert entries[0].path == os.path.join(
+        str(tmp_path),
+        f"scrape_result_{datetime.fromtimestamp(1729700000).strftime('%Y%m%d%H%M%S')}.bundle",
+    )
+    assert sorted(entries[2].files) == ["base", "specs"]
+    assert all(os.path.exists(path) for path in entries[2].files.values())
+
+
+def test_load_by_site_and_range(saved_results, tmp_path):
+    directory = str(tmp_path)
+
+    assert ScrapeResult.load(directory=directory).site == Site.CRYPTOCRAFT
+    latest = ScrapeResult.load(site=Site.FOREXFACTORY, directory=directory)
+    assert latest.date_from == "2024-10-28"
+    covering = ScrapeResult.load(
+        site=Site.FOREXFACTORY,
+        date_from="2024-10-22",
+        date_to="2024-10-25",
+        directory=directory,
+    )
+    assert covering.date_from == "2024-10-21"
+    with pytest.raises(FileNotFoundError):
+        ScrapeResult.load(site=Site.METALSMINE, directory=directory)
+
+
+def test_find_returns_overlapping_entries(saved_results, tmp_path):
+    entries = ScrapeResult.find(
+        site=Site.FOREXFACTORY, date_from="2024-10-27", directory=str(tmp_path)
+    )
+
+    assert [entry.date_from for entry in entries] == [
+        "2024-10-28",
+        "2024-10-21",
+        "2024-10-21",
+    ]
+
+
+def test_load_skips_deleted_results(saved_results, tmp_path):
+    latest = ScrapeResult.find(site=Site.FOREXFACTORY, directory=str(tmp_path))[0]
+    shutil.rmtree(latest.path)
+
+    loaded = ScrapeResult.load(site=Site.FOREXFACTORY, directory=str(tmp_path))
+
+    assert loaded.date_from == "2024-10-21"
+
+
+def test_manifest_survives_moving_the_directory(saved_results, tmp_path):
+    moved = str(tmp_path.parent / f"{tmp_path.name}_moved")
+    shutil.move(str(tmp_path), moved)
+
+    loaded = ScrapeResult.load(site=Site.CRYPTOCRAFT, directory=moved)
+
+    assert loaded.base["site"].tolist() == ["cryptocraft"] * 2
+
+
+def test_load_by_site_requires_manifest(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ScrapeResult.load(site=Site.FOREXFACTORY, directory=str(tmp_path))
+
+
+def test_write_options_validation():
+    with pytest.raises(ValueError):
+        WriteOptions(compression="nope")
+    with pytest.raises(ValueError):
+        WriteOptions(compression_level=3)
+    with pytest.raises(ValueError):
+        WriteOptions(row_group_size=0)
+    with pytest.raises(ValueError):
+        WriteOptions(csv_chunksize=0)
+    with pytest.raises(ValueError):
+        WriteOptions(workers=0)
+
+
+def test_save_applies_parquet_write_options(typed_result, tmp_path):
+    options = WriteOptions(
+        compression="zstd", compression_level=5, row_group_size=1, workers=2
+    )
+
+    saved = typed_result.save_to_dataframes(
+        output_dir=str(tmp_path), write_options=options
+    )
+
+    metadata = pq.ParquetFile(saved["base"]).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(saved["base"]), typed_result.base)
+
+
+def test_save_writes_arrow_ipc_files(typed_result, tmp_path):
+    saved = typed_result.save_to_dataframes(
+        save_format=SaveFormat.ARROW,
+        output_dir=str(tmp_path),
+        write_options=WriteOptions(compression="lz4"),
+    )
+
+    with pa.memory_map(saved["specs"]) as source:
+        table = pa.ipc.open_file(source).read_all()
+    pd.testing.assert_frame_equal(table.to_pandas(), typed_result.specs)
+
+
+@pytest.mark.parametrize(
+    "save_format, codec",
+    [
+        (SaveFormat.ARROW, "snappy"),
+        (SaveFormat.PARQUET, "bz2"),
+        (SaveFormat.CSV, "gzip"),
+    ],
+)
+def test_save_rejects_unsupported_codec_before_writing(
+    typed_result, tmp_path, save_format, codec
+):
+    output_dir = tmp_path / "out"
+
+    with pytest.raises(ValueError, match=codec):
+        typed_result.save_to_dataframes(
+            save_format=save_format,
+            output_dir=str(output_dir),
+            write_options=WriteOptions(compression=codec, workers=4),
+        )
+
+    assert not output_dir.exists()
+
+
+def test_failed_write_leaves_no_partial_file(typed_result, tmp_path, monkeypatch):
+    def partial_write(self, path, **kwargs):
+        with open(path, "w") as f:
+            f.write("partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", partial_write)
+
+    with pytest.raises(OSError):
+        typed_result.save_to_dataframes(
+            output_dir=str(tmp_path), write_options=WriteOptions(workers=1)
+        )
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_atomic_path_keeps_old_directory_when_swap_fails(tmp_path, monkeypatch):
+    path = str(tmp_path / "result.bundle")
+    os.makedirs(path)
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        f.write("old")
+    replace = os.replace
+
+    def failing_replace(source, target):
+        if source.endswith(".tmp"):
+            raise OSError("rename failed")
+        replace(source, target)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        with atomic_path(path) as temp_path:
+            os.makedirs(temp_path)
+
+    with open(os.path.join(path, "meta.json")) as f:
+        assert f.read() == "old"
+    assert os.listdir(tmp_path) == ["result.bundle"]
+
+
+def test_atomic_path_swaps_directories_without_leftovers(tmp_path):
+    path = str(tmp_path / "result.bundle")
+    for content in ("old", "new"):
+        with atomic_path(path) as temp_path:
+            os.makedirs(temp_path)
+            with open(os.path.join(temp_path, "meta.json"), "w") as f:
+                f.write(content)
+
+    with open(os.path.join(path, "meta.json")) as f:
+        assert f.read() == "new"
+    assert os.listdir(tmp_path) == ["result.bundle"]
@@ -0,0 +1,158 @@
+import pandas as pd
+import pytest
+
+from market_calendar_tool.cleaning.cleaner import clean_data
+from market_calendar_tool.scraper.data_processor import DataProcessor
+from market_calendar_tool.scraper.models import ScrapeResult, Site
+from market_calendar_tool.scraper.schemas import (
+    apply_schema,
+    concat_frames,
+    dateline_seconds,
+)
+
+RAW_BASE_DATA = {
+    "days": [
+        {
+            "events": [
+                {
+                    "id": 1,
+                    "name": "CPI m/m",
+                    "currency": "USD",
+                    "dateline": 1729515300,
+                    "impactTitle": "High Impact Expected",
+                    "actual": "0.3%",
+                    "previous": "0.2%",
+                    "revision": "",
+                    "forecast": "0.2%",
+                    "actualBetterWorse": 1,
+                    "revisionBetterWorse": 0,
+                    "siteId": 1,
+                },
+                {
+                    "id": 2,
+                    "name": "Bank Holiday",
+                    "currency": "All",
+                    "dateline": 1729547100,
+                    "impactTitle": "Non-Economic",
+                    "actual": "",
+                    "previous": "",
+                    "revision": "",
+                    "forecast": "",
+                    "actualBetterWorse": 0,
+                    "revisionBetterWorse": 0,
+                    "siteId": 1,
+                },
+            ]
+        }
+    ]
+}
+
+HISTORY_DF = pd.DataFrame(
+    {
+        "event_id": [11, 12],
+        "impact": ["low", "low"],
+        "impact_class": ["icon--ff-impact-yel", "icon--ff-impact-yel"],
+        "date": ["Sep 16, 2024", "Aug 19, 2024"],
+        "actualBetterWorse": [0.0, ""],
+        "id": [1, 2],
+    }
+)
+
+NEWS_DF = pd.DataFrame({"news_id": [5], "html": ["<div>News</div>"], "id": [1]})
+
+
+def test_base_schema_dtypes():
+    df = DataProcessor(RAW_BASE_DATA).to_base_df()
+
+    assert df["id"].dtype == "Int64"
+    assert isinstance(df["currency"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["impactTitle"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["siteId"].dtype, pd.CategoricalDtype)
+    assert df["actualBetterWorse"].dtype == "Int8"
+    assert str(df["dateline"].dtype) == "datetime64[ns, UTC]"
+    assert df.loc[0, "dateline"] == pd.Timestamp("2024-10-21 12:55:00", tz="UTC")
+    assert df["name"].dtype == object
+
+
+def test_raw_dtypes_flag():
+    df = DataProcessor(RAW_BASE_DATA).to_base_df(typed=False)
+
+    assert df["currency"].dtype == object
+    assert df["dateline"].dtype == "int64"
+
+
+def test_history_schema_coerces_blank_values():
+    df = apply_schema(HISTORY_DF, "history")
+
+    assert df["actualBetterWorse"].tolist() == [0, pd.NA]
+    assert str(df["date"].dtype) == "datetime64[ns, UTC]"
+    assert isinstance(df["impact_class"].dtype, pd.CategoricalDtype)
+
+
+def test_unconvertible_column_keeps_raw_dtype():
+    df = apply_schema(pd.DataFrame({"actualBetterWorse": [0.5, 1.0]}), "base")
+
+    assert df["actualBetterWorse"].dtype == "float64"
+
+
+def test_concat_frames_keeps_categories():
+    left = pd.DataFrame({"currency": pd.Categorical(["USD"]), "id": [1]})
+    right = pd.DataFrame({"currency": pd.Categorical(["EUR"]), "id": [2]})
+
+    df = concat_frames([left, right], ignore_index=True)
+
+    assert isinstance(df["currency"].dtype, pd.CategoricalDtype)
+    assert df["currency"].tolist() == ["USD", "EUR"]
+
+
+def test_dateline_seconds():
+    typed = apply_schema(pd.DataFrame({"dateline": [1729515300, None]}), "base")
+
+    seconds = dateline_seconds(typed["dateline"])
+
+    assert seconds[0] == 1729515300
+    assert pd.isna(seconds[1])
+
+
+def test_cleaning_accepts_typed_frames():
+    raw_base = DataProcessor(RAW_BASE_DATA).to_base_df(typed=False)
+    typed_base = DataProcessor(RAW_BASE_DATA).to_base_df()
+
+    raw = clean_data(
+        ScrapeResult(
+            site=Site.FOREXFACTORY,
+            date_from="",
+            date_to="",
+            base=raw_base,
+            history=HISTORY_DF,
+            news=NEWS_DF,
+        )
+    )
+    typed = clean_data(
+        ScrapeResult(
+            site=Site.FOREXFACTORY,
+            date_from="",
+            date_to="",
+            base=typed_base,
+            history=apply_schema(HISTORY_DF, "history"),
+            news=apply_schema(NEWS_DF, "news"),
+        )
+    )
+
+    assert typed.base["currency"].tolist() == raw.base["currency"].tolist()
+    assert typed.base["datetime"].tolist() == raw.base["datetime"].tolist()
+    assert typed.base["impact"].tolist() == raw.base["impact"].tolist()
+    assert typed.history["date"].tolist() == raw.history["date"].tolist()
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_memory_report(typed):
+    base = DataProcessor(RAW_BASE_DATA).to_base_df(typed=typed)
+    result = ScrapeResult(site=Site.FOREXFACTORY, date_from="", date_to="", base=base)
+
+    report = result.memory_report()
+
+    assert list(report.columns) == ["frame", "column", "dtype", "bytes"]
+    assert set(report["frame"]) == {"base"}
+    assert report.set_index("column").loc["id", "dtype"] == str(base["id"].dtype)
+    assert (report["bytes"] > 0).all()
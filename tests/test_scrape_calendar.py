@@ -1,10 +1,16 @@
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from freezegun import freeze_time
 
-from market_calendar_tool.api import scrape_calendar
+from market_calendar_tool.api import (
+    SiteScrapeError,
+    scrape_calendar,
+    scrape_calendar_async,
+    scrape_sites,
+    scrape_sites_async,
+)
 from market_calendar_tool.scraper.base_scraper import Site
 from market_calendar_tool.scraper.models import ScrapeOptions
 
@@ -31,7 +37,9 @@ def test_scrape_calendar_default_dates(mock_base_scraper):
 
     scrape_calendar()
 
-    mock_base_scraper.assert_called_with(Site.FOREXFACTORY, today, next_week)
+    mock_base_scraper.assert_called_with(
+        Site.FOREXFACTORY, today, next_week, options=ScrapeOptions()
+    )
 
 
 def test_scrape_calendar_custom_date_range(mock_base_scraper):
@@ -40,7 +48,9 @@ def test_scrape_calendar_custom_date_range(mock_base_scraper):
 
     scrape_calendar(date_from=custom_from, date_to=custom_to)
 
-    mock_base_scraper.assert_called_with(Site.FOREXFACTORY, custom_from, custom_to)
+    mock_base_scraper.assert_called_with(
+        Site.FOREXFACTORY, custom_from, custom_to, options=ScrapeOptions()
+    )
 
 
 def test_scrape_calendar_invalid_date_from():
@@ -72,7 +82,9 @@ def test_scrape_calendar_only_date_from(mock_base_scraper):
 
     scrape_calendar(date_from=custom_from)
 
-    mock_base_scraper.assert_called_with(Site.FOREXFACTORY, custom_from, expected_to)
+    mock_base_scraper.assert_called_with(
+        Site.FOREXFACTORY, custom_from, expected_to, options=ScrapeOptions()
+    )
 
 
 @freeze_time("2024-10-20")
@@ -82,7 +94,9 @@ def test_scrape_calendar_only_date_to(mock_base_scraper):
 
     scrape_calendar(date_to=custom_to)
 
-    mock_base_scraper.assert_called_with(Site.FOREXFACTORY, expected_from, custom_to)
+    mock_base_scraper.assert_called_with(
+        Site.FOREXFACTORY, expected_from, custom_to, options=ScrapeOptions()
+    )
 
 
 @freeze_time("2024-10-20")
@@ -94,7 +108,9 @@ def test_scrape_calendar_different_site(mock_base_scraper):
     today = datetime.now().strftime("%Y-%m-%d")
     next_week = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
 
-    mock_base_scraper.assert_called_with(alternative_site, today, next_week)
+    mock_base_scraper.assert_called_with(
+        alternative_site, today, next_week, options=ScrapeOptions()
+    )
 
 
 @freeze_time("2024-10-20")
@@ -109,8 +125,135 @@ def test_scrape_calendar_extended(mock_base_scraper, mock_extended_scraper):
 
     custom_options = ScrapeOptions(max_parallel_tasks=5)
 
-    mock_base_scraper.assert_called_with(Site.FOREXFACTORY, today, next_week)
+    mock_base_scraper.assert_called_with(
+        Site.FOREXFACTORY, today, next_week, options=ScrapeOptions()
+    )
     mock_extended_scraper.assert_called_with(
         mock_base_scraper.return_value, options=custom_options
     )
     mock_extended_instance.scrape.assert_called_once()
+
+
+@pytest.mark.asyncio
+@freeze_time("2024-10-20")
+async def test_scrape_calendar_async_base(mock_base_scraper):
+    mock_base_scraper.return_value.async_scrape = AsyncMock(return_value="result")
+
+    result = await scrape_calendar_async(site=Site.METALSMINE)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    next_week = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+
+    assert result == "result"
+    mock_base_scraper.assert_called_with(
+        Site.METALSMINE, today, next_week, options=ScrapeOptions()
+    )
+    mock_base_scraper.return_value.async_scrape.assert_awaited_once()
+    mock_base_scraper.return_value.scrape.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scrape_calendar_async_extended(mock_base_scraper, mock_extended_scraper):
+    mock_extended_instance = MagicMock()
+    mock_extended_instance.async_scrape = AsyncMock(return_value="result")
+    mock_extended_scraper.return_value = mock_extended_instance
+
+    result = await scrape_calendar_async(
+        date_from="2024-11-01", date_to="2024-11-07", extended=True
+    )
+
+    assert result == "result"
+    mock_base_scraper.assert_called_with(
+        Site.FOREXFACTORY, "2024-11-01", "2024-11-07", options=ScrapeOptions()
+    )
+    mock_extended_scraper.assert_called_with(
+        mock_base_scraper.return_value, options=ScrapeOptions()
+    )
+    mock_extended_instance.async_scrape.assert_awaited_once()
+    mock_extended_instance.scrape.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scrape_calendar_async_invalid_range():
+    with pytest.raises(ValueError):
+        await scrape_calendar_async(date_from="2024-10-20", date_to="2024-10-19")
+
+
+def _site_scrapers(mock_scraper_class):
+    instances = {}
+
+    def create(site, *args, **kwargs):
+        instance = MagicMock()
+        instance.site = site
+        instance.async_scrape = AsyncMock(return_value=f"result-{site.name}")
+        instances[site] = instance
+        return instance
+
+    mock_scraper_class.side_effect = create
+    return instances
+
+
+@pytest.mark.asyncio
+async def test_scrape_sites_async_shares_session(mock_base_scraper):
+    instances = _site_scrapers(mock_base_scraper)
+
+    results = await scrape_sites_async(
+        sites=[Site.FOREXFACTORY, Site.METALSMINE, Site.FOREXFACTORY],
+        date_from="2024-11-01",
+        date_to="2024-11-07",
+    )
+
+    assert results == {
+        Site.FOREXFACTORY: "result-FOREXFACTORY",
+        Site.METALSMINE: "result-METALSMINE",
+    }
+
+    sessions = {
+        instance.async_scrape.await_args.args[0] for instance in instances.values()
+    }
+    semaphores = {
+        instance.async_scrape.await_args.args[1] for instance in instances.values()
+    }
+    assert len(sessions) == 1
+    assert len(semaphores) == 1
+    assert semaphores.pop()._value == ScrapeOptions().max_parallel_tasks * 2
+
+
+def test_scrape_sites_extended(mock_base_scraper, mock_extended_scraper):
+    mock_extended_scraper.return_value.async_scrape = AsyncMock(return_value="ext")
+
+    results = scrape_sites(extended=True, max_connections=8)
+
+    assert results == {site: "ext" for site in Site}
+    assert mock_base_scraper.call_count == len(Site)
+    assert mock_extended_scraper.call_count == len(Site)
+
+
+@pytest.mark.asyncio
+async def test_scrape_sites_async_keeps_partial_results_on_failure(mock_base_scraper):
+    instances = _site_scrapers(mock_base_scraper)
+
+    def create(site, *args, **kwargs):
+        instance = MagicMock()
+        instance.async_scrape = AsyncMock(
+            side_effect=RuntimeError("boom") if site == Site.ENERGYEXCH else None,
+            return_value="ok",
+        )
+        instances[site] = instance
+        return instance
+
+    mock_base_scraper.side_effect = create
+
+    with pytest.raises(SiteScrapeError) as excinfo:
+        await scrape_sites_async(
+            sites=[Site.FOREXFACTORY, Site.ENERGYEXCH, Site.METALSMINE]
+        )
+
+    assert excinfo.value.results == {
+        Site.FOREXFACTORY: "ok",
+        Site.METALSMINE: "ok",
+    }
+    assert list(excinfo.value.errors) == [Site.ENERGYEXCH]
+    assert isinstance(excinfo.value.errors[Site.ENERGYEXCH], RuntimeError)
+    assert "ENERGYEXCH: boom" in str(excinfo.value)
+    assert instances[Site.FOREXFACTORY].async_scrape.await_count == 1